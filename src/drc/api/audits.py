@@ -1,3 +1,201 @@
+"""
+Write the audit trail through a buffer, with only the changes of an update.
+
+With the ``ASYNC_AUDITTRAILS`` setting, the audit trail entry of a change is
+written as an :class:`AuditTrailBuffer` in the transaction of the change
+itself. The ``write_audittrails`` worker moves them to the audit trail in
+batches.
+
+The buffered entries of updates store the version after the update in
+``nieuw``, and only the old values of the attributes that changed in ``oud``.
+The full version before the update is reconstructed when the audit trail is
+read. Entries written during the request keep the full versions, as written by
+``vng_api_common``, so the audit trail of existing installations doesn't
+change unless the setting is enabled.
+"""
+import uuid
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import connection, transaction
+
 from vng_api_common.audittrails.audits import Audit
+from vng_api_common.audittrails.models import AuditTrail
+from vng_api_common.compat import get_header
+from vng_api_common.constants import CommonResourceAction
+
+from drc.datamodel.models import AuditTrailBuffer
 
 AUDIT_DRC = Audit("DRC", "enkelvoudiginformatieobject")
+
+
+def get_changes(oud: Optional[dict], nieuw: Optional[dict]) -> Optional[dict]:
+    """
+    Leave out the attributes of ``oud`` that are the same in ``nieuw``.
+
+    Attributes which are missing from ``nieuw`` are kept, so that ``oud`` can
+    be reconstructed by :func:`reconstruct_wijzigingen`.
+    """
+    if oud is None or nieuw is None:
+        return oud
+    return {
+        name: value
+        for name, value in oud.items()
+        if name not in nieuw or nieuw[name] != value
+    }
+
+
+class AuditTrailBufferMixin:
+    """
+    Write the audit trail of an ``AuditTrailViewsetMixin`` view to the buffer
+    if ``ASYNC_AUDITTRAILS`` is enabled.
+    """
+
+    def create_audittrail(
+        self,
+        status_code,
+        action,
+        version_before_edit,
+        version_after_edit,
+        unique_representation,
+    ):
+        if not settings.ASYNC_AUDITTRAILS:
+            super().create_audittrail(
+                status_code,
+                action,
+                version_before_edit,
+                version_after_edit,
+                unique_representation,
+            )
+            return
+
+        data = version_after_edit if version_after_edit else version_before_edit
+        if self.basename == self.audit.main_resource:
+            main_object = data["url"]
+        else:
+            main_object = self.get_audittrail_main_object_url(
+                data, self.audit.main_resource
+            )
+
+        jwt_auth = self.request.jwt_auth
+        applications = jwt_auth.applicaties
+        if applications:
+            application = applications[0]
+            app_id, app_presentation = str(application.uuid), application.label
+        else:
+            app_id = get_header(self.request, "X-NLX-Request-Application-Id")
+            app_presentation = app_id
+
+        AuditTrailBuffer.objects.create(
+            hoofd_object=main_object,
+            gegevens={
+                "bron": self.audit.component_name,
+                "logrecord_id": get_header(self.request, "X-NLX-Logrecord-ID") or "",
+                "applicatie_id": app_id,
+                "applicatie_weergave": app_presentation,
+                "actie": action,
+                "actie_weergave": CommonResourceAction.labels.get(action, ""),
+                "gebruikers_id": jwt_auth.payload.get("user_id") or "",
+                "gebruikers_weergave": (
+                    jwt_auth.payload.get("user_representation") or ""
+                ),
+                "resultaat": status_code,
+                "hoofd_object": main_object,
+                "resource": self.basename,
+                "resource_url": data["url"],
+                "toelichting": get_header(self.request, "X-Audit-Toelichting") or "",
+                "resource_weergave": unique_representation,
+                "oud": get_changes(version_before_edit, version_after_edit),
+                "nieuw": version_after_edit,
+            },
+        )
+
+    def _destroy_related_audittrails(self, main_object_url):
+        # delete the buffered entries first, this waits for a worker that is
+        # moving them to the audit trail
+        AuditTrailBuffer.objects.filter(hoofd_object=main_object_url).delete()
+        super()._destroy_related_audittrails(main_object_url)
+
+
+def reconstruct_wijzigingen(audittrail: AuditTrail) -> AuditTrail:
+    """
+    Replace the changes in ``oud`` with the full version before the update.
+
+    Entries with a full ``oud`` are left as they are.
+    """
+    if audittrail.oud is not None and audittrail.nieuw is not None:
+        audittrail.oud = {**audittrail.nieuw, **audittrail.oud}
+    return audittrail
+
+
+def insert_audittrails(pks: List[int]) -> None:
+    """
+    Copy buffered entries to the audit trail in a single statement.
+
+    The ``aanmaakdatum`` of the buffered entries is kept, which
+    ``AuditTrail.save`` and ``bulk_create`` would overwrite with the current
+    time.
+    """
+    quote = connection.ops.quote_name
+    fields = [
+        field
+        for field in AuditTrail._meta.concrete_fields
+        if field.name not in ["id", "uuid", "aanmaakdatum"]
+    ]
+    columns = ", ".join(quote(field.column) for field in fields)
+    values = ", ".join(f"gegevens.{quote(field.column)}" for field in fields)
+    audittrail_table = quote(AuditTrail._meta.db_table)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {audittrail_table} "
+            f"({quote('uuid')}, {columns}, {quote('aanmaakdatum')}) "
+            f"SELECT entry.uuid, {values}, buffer.{quote('aanmaakdatum')} "
+            "FROM unnest(%s::integer[], %s::uuid[]) "
+            "WITH ORDINALITY AS entry(id, uuid, position) "
+            f"JOIN {quote(AuditTrailBuffer._meta.db_table)} AS buffer "
+            f"ON buffer.{quote('id')} = entry.id "
+            # the fields of the audit trail, by the name of their column
+            f"CROSS JOIN LATERAL jsonb_populate_record("
+            f"NULL::{audittrail_table}, buffer.{quote('gegevens')}) AS gegevens "
+            "ORDER BY entry.position",
+            [pks, [uuid.uuid4() for _ in pks]],
+        )
+
+
+def write_audittrails(batch_size: int) -> int:
+    """
+    Move a batch of buffered entries to the audit trail, skipping the entries
+    claimed by other workers.
+
+    :return: the number of entries in the batch
+    """
+    with transaction.atomic():
+        pks = list(
+            AuditTrailBuffer.objects.select_for_update(skip_locked=True)
+            .order_by("pk")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return 0
+
+        insert_audittrails(pks)
+        AuditTrailBuffer.objects.filter(pk__in=pks).delete()
+
+    return len(pks)
+
+
+def process_audittrails(batch_size: int = None) -> int:
+    """
+    Move batches of buffered entries to the audit trail until there are none
+    left.
+
+    :return: the number of processed entries
+    """
+    batch_size = batch_size or settings.AUDITTRAILS_BATCH_SIZE
+    processed = 0
+    while True:
+        count = write_audittrails(batch_size)
+        processed += count
+        if count < batch_size:
+            return processed
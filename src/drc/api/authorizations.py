@@ -0,0 +1,83 @@
+"""
+Cache of the authorizations of applications, compiled for filtering lists.
+
+Filtering on the authorizations of a consumer needs all of its ``Autorisatie``
+objects, of which there can be hundreds. They are compiled with
+:func:`drc.datamodel.query.compile_authorizations` once per set of applications
+and scope, and kept in the Django cache configured by the
+``AUTHORIZATIONS_CACHE`` setting. Any change of an application, authorization or
+the authorizations configuration invalidates all compiled authorizations.
+"""
+import hashlib
+import uuid
+from typing import Dict, Iterable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.authorizations.models import (
+    Applicatie,
+    AuthorizationsConfig,
+    Autorisatie,
+)
+from vng_api_common.scopes import Scope
+
+from drc.datamodel.query import compile_authorizations
+
+KEY_PREFIX = "authorizations"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+
+
+def get_cache():
+    return caches[settings.AUTHORIZATIONS_CACHE]
+
+
+def get_version() -> str:
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # ``add`` doesn't overwrite a version set by another process
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate():
+    get_cache().set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_compiled_authorizations(
+    applicaties: Iterable[Applicatie], scope: Scope, authorizations: models.QuerySet
+) -> Dict[str, int]:
+    """
+    Compile the ``authorizations`` of the ``applicaties`` for ``scope``, through
+    the cache.
+
+    :param authorizations: queryset of the
+      :class:`vng_api_common.authorizations.models.Autorisatie` objects of the
+      ``applicaties``, which is only evaluated if they are not cached.
+    """
+    app_ids = sorted(str(app.pk) for app in applicaties)
+    hash_ = hashlib.sha256(",".join(app_ids).encode("utf8"))
+    hash_.update(str(scope).encode("utf8"))
+    key = f"{KEY_PREFIX}:{get_version()}:{hash_.hexdigest()}"
+
+    cache = get_cache()
+    compiled = cache.get(key)
+    if compiled is None:
+        compiled = compile_authorizations(scope, authorizations)
+        cache.set(key, compiled, settings.AUTHORIZATIONS_CACHE_TIMEOUT)
+    return compiled
+
+
+@receiver([post_save, post_delete], sender=Applicatie)
+@receiver([post_save, post_delete], sender=Autorisatie)
+@receiver([post_save, post_delete], sender=AuthorizationsConfig)
+def invalidate_on_change(sender, **kwargs):
+    invalidate()
+    # requests running while the transaction is committed could cache the old
+    # authorizations with the new version
+    transaction.on_commit(invalidate)
@@ -0,0 +1,89 @@
+"""
+Cache of the credentials for the other APIs, kept in memory by every process.
+
+Every call to another API (Catalogi, Zaken, Besluiten) looks up the
+:class:`vng_api_common.models.APICredential` of the API root the URL starts
+with. The credentials are loaded once and kept in memory, until they change.
+Changes are signalled through a version in the Django cache configured by the
+``API_CREDENTIALS_CACHE`` setting, so all processes sharing that cache reload
+them.
+"""
+import uuid
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from vng_api_common.models import APICredential
+from zds_client import ClientAuth
+
+VERSION_KEY = "api-credentials:version"
+
+# the version and the credentials by API root, longest API root first
+_credentials: Tuple[Optional[str], Dict[str, APICredential]] = (None, {})
+
+
+def get_cache():
+    return caches[settings.API_CREDENTIALS_CACHE]
+
+
+def get_version() -> str:
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # ``add`` doesn't overwrite a version set by another process
+        cache.add(VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def invalidate():
+    get_cache().set(VERSION_KEY, uuid.uuid4().hex, None)
+
+
+def get_credentials() -> Dict[str, APICredential]:
+    global _credentials
+
+    version = get_version()
+    cached_version, credentials = _credentials
+    if cached_version != version:
+        credentials = {
+            credential.api_root: credential
+            for credential in sorted(
+                APICredential.objects.all(),
+                key=lambda credential: len(credential.api_root),
+                reverse=True,
+            )
+        }
+        _credentials = (version, credentials)
+    return credentials
+
+
+def get_auth(url: str, **kwargs) -> Optional[ClientAuth]:
+    """
+    Cached version of :meth:`vng_api_common.models.APICredential.get_auth`.
+
+    :return: the auth for the most specific API root ``url`` starts with, or
+      ``None`` if there are no credentials for it.
+    """
+    for api_root, credential in get_credentials().items():
+        if url.startswith(api_root):
+            return ClientAuth(
+                client_id=credential.client_id,
+                secret=credential.secret,
+                user_id=credential.user_id,
+                user_representation=credential.user_representation,
+                **kwargs,
+            )
+    return None
+
+
+@receiver([post_save, post_delete], sender=APICredential)
+def invalidate_on_change(sender, **kwargs):
+    invalidate()
+    # requests running while the transaction is committed could cache the old
+    # credentials with the new version
+    transaction.on_commit(invalidate)
@@ -1,3 +1,6 @@
+from .authorizations import get_compiled_authorizations
+
+
 class ListFilterByAuthorizationsMixin:
     """
     Filter list-action data by the authorizations configured.
@@ -34,6 +37,10 @@ class ListFilterByAuthorizationsMixin:
             return base
 
         scope_needed = self.required_scopes[self.action]
-        authorizations = self.request.jwt_auth.autorisaties
+        # compiled once for the applications and cached, see
+        # ``drc.api.authorizations``
+        authorizations = get_compiled_authorizations(
+            apps, scope_needed, self.request.jwt_auth.autorisaties
+        )
 
         return base.filter_for_authorizations(scope_needed, authorizations)
@@ -1,7 +1,9 @@
 import binascii
+import uuid
 from base64 import b64decode
 
 from django.core.exceptions import ValidationError
+from django.core.files.base import File
 from django.utils.http import urlencode
 from django.utils.translation import gettext_lazy as _
 
@@ -10,6 +12,8 @@ from privates.storages import PrivateMediaFileSystemStorage
 from rest_framework import serializers
 from rest_framework.reverse import reverse
 
+from .utils import reverse_uuid
+
 
 class AnyFileType:
     def __contains__(self, item):
@@ -19,39 +23,56 @@ class AnyFileType:
 class AnyBase64File(Base64FileField):
     ALLOWED_TYPES = AnyFileType()
 
-    def __init__(self, view_name: str = None, *args, **kwargs):
+    def __init__(
+        self, view_name: str = None, lookup_field: str = "uuid", *args, **kwargs
+    ):
         self.view_name = view_name
+        self.lookup_field = lookup_field
         super().__init__(*args, **kwargs)
 
+    @property
+    def required_sources(self) -> tuple:
+        # the download link is built from these attributes of the object
+        return (self.lookup_field, "versie")
+
     def get_file_extension(self, filename, decoded_file):
         return "bin"
 
     def to_internal_value(self, base64_data):
+        # raw uploads and files decoded by the ``Base64FileJSONParser`` are
+        # passed as files
+        if isinstance(base64_data, File):
+            return serializers.FileField.to_internal_value(self, base64_data)
+        if isinstance(base64_data, binascii.Error):
+            raise self.get_decoding_error(base64_data)
+
         try:
             return super().to_internal_value(base64_data)
         except Exception:
             try:
                 b64decode(base64_data)
             except binascii.Error as e:
-                if str(e) == "Incorrect padding":
-                    raise ValidationError(
-                        _("The provided base64 data has incorrect padding"),
-                        code="incorrect-base64-padding",
-                    )
-                raise ValidationError(str(e), code="invalid-base64")
+                raise self.get_decoding_error(e)
             except TypeError as exc:
                 raise ValidationError(str(exc))
 
+    def get_decoding_error(self, exc: binascii.Error) -> ValidationError:
+        if str(exc) == "Incorrect padding":
+            return ValidationError(
+                _("The provided base64 data has incorrect padding"),
+                code="incorrect-base64-padding",
+            )
+        return ValidationError(str(exc), code="invalid-base64")
+
     def to_representation(self, file):
         is_private_storage = isinstance(file.storage, PrivateMediaFileSystemStorage)
 
         if not is_private_storage or self.represent_in_base64:
             return super().to_representation(file)
 
-        # if there is no associated file link is not returned
-        try:
-            file.file
-        except ValueError:
+        # if there is no associated file link is not returned. Only the name is
+        # checked, the storage is not accessed
+        if not file.name:
             return None
 
         assert (
@@ -61,28 +82,42 @@ class AnyBase64File(Base64FileField):
         model_instance = file.instance
         request = self.context.get("request")
 
-        url_field = self.parent.fields["url"]
-        lookup_field = url_field.lookup_field
-        kwargs = {lookup_field: getattr(model_instance, lookup_field)}
-        url = reverse(self.view_name, kwargs=kwargs, request=request)
-
-        # Retrieve the correct version to construct the download url that
-        # points to the content of that version
-        instance = self.parent.instance
-        # in case of pagination instance can be a list object
-        if isinstance(instance, list):
-            instance = instance[0]
-
-        if hasattr(instance, "versie"):
-            versie = instance.versie
+        lookup_field = self.lookup_field
+        lookup_value = getattr(model_instance, lookup_field)
+        if isinstance(lookup_value, uuid.UUID):
+            url = reverse_uuid(self.view_name, lookup_field, lookup_value, request)
         else:
-            versie = instance.get(uuid=kwargs["uuid"]).versie
-        query_string = urlencode({"versie": versie})
+            kwargs = {lookup_field: lookup_value}
+            url = reverse(self.view_name, kwargs=kwargs, request=request)
+
+        # the download url points to the content of the serialized version
+        query_string = urlencode({"versie": model_instance.versie})
         return f"{url}?{query_string}"
 
 
+class URLTemplateMixin:
+    """
+    Format the urls of objects with a UUID lookup from a template per view,
+    instead of reversing the url of every object.
+    """
+
+    def get_url(self, obj, view_name, request, format):
+        lookup_value = getattr(obj, self.lookup_field, None)
+        if (
+            format
+            or getattr(obj, "pk", None) in (None, "")
+            or not isinstance(lookup_value, uuid.UUID)
+        ):
+            return super().get_url(obj, view_name, request, format)
+        return reverse_uuid(view_name, self.lookup_url_kwarg, lookup_value, request)
+
+
+class HyperlinkedIdentityField(URLTemplateMixin, serializers.HyperlinkedIdentityField):
+    pass
+
+
 class EnkelvoudigInformatieObjectHyperlinkedRelatedField(
-    serializers.HyperlinkedRelatedField
+    URLTemplateMixin, serializers.HyperlinkedRelatedField
 ):
     """
     Custom field to construct the url for models that have a ForeignKey to
@@ -3,6 +3,7 @@ from django.utils.translation import ugettext_lazy as _
 from django_filters import rest_framework as filters
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
+from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.filters import URLModelChoiceFilter
 from vng_api_common.filtersets import FilterSet
 from vng_api_common.utils import get_help_text
@@ -21,6 +22,42 @@ def expand_filter(queryset, name, value):
     return queryset
 
 
+def cursor_filter(queryset, name, value):
+    """cursor pagination is handled by the paginator"""
+    return queryset
+
+
+def fields_filter(queryset, name, value):
+    """sparse fieldsets are handled by the view"""
+    return queryset
+
+
+def cursor_field():
+    return extend_schema_field(OpenApiTypes.STR)(
+        filters.CharFilter(
+            method=cursor_filter,
+            help_text=_(
+                "Gebruik cursor-paginering in plaats van paginanummers. Laat de waarde "
+                "leeg voor de eerste pagina en volg daarna de `next` en `previous` links. "
+                "Het totaal aantal resultaten (`count`) wordt hierbij niet berekend."
+            ),
+        )
+    )
+
+
+def fields_field():
+    return extend_schema_field(OpenApiTypes.STR)(
+        filters.CharFilter(
+            method=fields_filter,
+            help_text=_(
+                "Geef alleen de opgegeven velden terug, gescheiden door een komma, "
+                "bijvoorbeeld `fields=url,titel`. Velden die gebruikt worden in "
+                "`expand` moeten ook opgegeven worden."
+            ),
+        )
+    )
+
+
 class EnkelvoudigInformatieObjectListFilter(FilterSet):
     trefwoorden = filters.CharFilter(lookup_expr="icontains")
 
@@ -35,6 +72,9 @@ class EnkelvoudigInformatieObjectListFilter(FilterSet):
         )
     )
 
+    fields = fields_field()
+    cursor = cursor_field()
+
     class Meta:
         model = EnkelvoudigInformatieObject
         fields = ("identificatie", "bronorganisatie", "trefwoorden")
@@ -63,6 +103,7 @@ class ObjectInformatieObjectFilter(FilterSet):
             ),
         )
     )
+    fields = fields_field()
 
     class Meta:
         model = ObjectInformatieObject
@@ -85,6 +126,7 @@ class GebruiksrechtenFilter(FilterSet):
             ),
         )
     )
+    fields = fields_field()
 
     class Meta:
         model = Gebruiksrechten
@@ -112,6 +154,9 @@ class VerzendingFilter(FilterSet):
         )
     )
 
+    fields = fields_field()
+    cursor = cursor_field()
+
     class Meta:
         model = Verzending
         fields = {
@@ -119,3 +164,22 @@ class VerzendingFilter(FilterSet):
             "informatieobject": ["exact"],
             "betrokkene": ["exact"],
         }
+
+
+class AuditTrailFilter(FilterSet):
+    cursor = extend_schema_field(OpenApiTypes.STR)(
+        filters.CharFilter(
+            method=cursor_filter,
+            help_text=_(
+                "Gebruik cursor-paginering. Laat de waarde leeg voor de eerste pagina "
+                "en volg daarna de `next` en `previous` links. Zonder deze parameter "
+                "worden alle regels in één keer teruggegeven."
+            ),
+        )
+    )
+
+    class Meta:
+        model = AuditTrail
+        fields = {
+            "aanmaakdatum": ["lt", "lte", "gt", "gte"],
+        }
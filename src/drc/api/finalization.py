@@ -0,0 +1,140 @@
+"""
+Merge the bestandsdelen of a document into its ``inhoud``.
+
+Merging happens during the unlock request, or, with the
+``ASYNC_UPLOAD_FINALIZATION`` setting, in the ``finalize_uploads`` worker,
+which processes the :class:`Finalisatie` jobs created by the unlock.
+"""
+import logging
+from typing import Callable, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from drc.datamodel.constants import FinalisatieStatussen
+from drc.datamodel.models import EnkelvoudigInformatieObject, Finalisatie
+
+from .utils import HASH_ALGORITHMS, create_filename, merge_files
+
+logger = logging.getLogger(__name__)
+
+
+def merge_bestandsdelen(
+    eio: EnkelvoudigInformatieObject,
+    progress: Optional[Callable[[int], None]] = None,
+) -> None:
+    """
+    Merge the complete bestandsdelen of the document into the ``inhoud`` of
+    the version ``eio`` and delete them.
+
+    The files are merged before any changes are made in the database, so
+    ``progress`` can report on the merge outside of a transaction.
+    """
+    bestandsdelen = list(eio.canonical.bestandsdelen.order_by("volgnummer"))
+    part_files = [p.inhoud.file for p in bestandsdelen]
+
+    # create the name of target file using the storage backend to the serializer
+    name = create_filename(eio.bestandsnaam)
+    file_field = eio._meta.get_field("inhoud")
+    rel_name = file_field.generate_filename(eio, name)
+    # compute the checksum while merging if the algorithm is known, but
+    # no value was provided
+    hash_name = ""
+    if not eio.integriteit_waarde:
+        hash_name = HASH_ALGORITHMS.get(eio.integriteit_algoritme, "")
+    # merge files directly into the storage of the FileField
+    rel_name, size, checksum = merge_files(
+        part_files,
+        file_field.storage,
+        rel_name,
+        hash_name=hash_name,
+        progress=progress,
+    )
+
+    with transaction.atomic():
+        eio.inhoud.name = rel_name
+        eio.bestandsomvang = size
+        if checksum:
+            eio.integriteit_waarde = checksum
+            eio.integriteit_datum = timezone.now().date()
+        eio.save()
+
+        delete_bestandsdelen(bestandsdelen)
+
+
+def delete_bestandsdelen(bestandsdelen) -> None:
+    for part in bestandsdelen:
+        part.inhoud.delete()
+        part.delete()
+
+
+def claim_finalisatie() -> Optional[Finalisatie]:
+    """
+    Take the oldest waiting job, skipping jobs claimed by other workers.
+
+    Jobs of which the worker was stopped while merging are taken again after
+    ``UPLOAD_FINALIZATION_TIMEOUT``.
+    """
+    with transaction.atomic():
+        waiting = Finalisatie.objects.filter(status=FinalisatieStatussen.in_wachtrij)
+        finalisatie = (
+            (waiting | Finalisatie.objects.stale())
+            .select_for_update(skip_locked=True)
+            .order_by("aangemaakt", "pk")
+            .first()
+        )
+        if finalisatie is None:
+            return None
+
+        if finalisatie.status == FinalisatieStatussen.bezig:
+            logger.warning("Finalisatie %s was not finished, retrying", finalisatie.pk)
+
+        finalisatie.status = FinalisatieStatussen.bezig
+        finalisatie.verwerkt = 0
+        finalisatie.gestart = timezone.now()
+        finalisatie.save(update_fields=["status", "verwerkt", "gestart"])
+
+    return finalisatie
+
+
+def run_finalisatie(finalisatie: Finalisatie) -> None:
+    """
+    Merge the bestandsdelen of a claimed job, recording the progress and the
+    outcome on the job.
+    """
+    queryset = Finalisatie.objects.filter(pk=finalisatie.pk)
+
+    def progress(verwerkt: int):
+        # outside of a transaction, so clients can follow it
+        queryset.update(verwerkt=verwerkt)
+
+    try:
+        merge_bestandsdelen(finalisatie.informatieobject, progress=progress)
+    except Exception as exc:
+        logger.exception("Finalisatie %s failed", finalisatie.pk)
+        queryset.update(
+            status=FinalisatieStatussen.mislukt,
+            foutmelding=str(exc),
+            beeindigd=timezone.now(),
+        )
+    else:
+        queryset.update(
+            status=FinalisatieStatussen.voltooid,
+            verwerkt=finalisatie.informatieobject.bestandsomvang,
+            beeindigd=timezone.now(),
+        )
+
+
+def process_finalisaties() -> int:
+    """
+    Process waiting jobs until there are none left.
+
+    :return: the number of processed jobs
+    """
+    processed = 0
+    while True:
+        finalisatie = claim_finalisatie()
+        if finalisatie is None:
+            return processed
+        run_finalisatie(finalisatie)
+        processed += 1
@@ -1,4 +1,31 @@
+from itertools import islice
+from typing import Iterator, List, Optional, Set, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.http import StreamingHttpResponse
+from django.utils.functional import cached_property
+from django.utils.translation import gettext as _
+
+from djangorestframework_camel_case.util import camel_to_underscore
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter
+from rest_framework import serializers
+from rest_framework.request import Request
 from rest_framework.response import Response
+from vng_api_common.descriptors import GegevensGroepType
+
+from drc.api.parsers import OctetStreamParser, get_content_length
+from drc.api.renderers import NDJSONRenderer
+
+FIELDS_QUERY_PARAM = OpenApiParameter(
+    name="fields",
+    location=OpenApiParameter.QUERY,
+    description="Geef alleen de opgegeven velden terug, gescheiden door een komma, "
+    "bijvoorbeeld `fields=url,titel`. Velden die gebruikt worden in `expand` moeten "
+    "ook opgegeven worden.",
+    type=OpenApiTypes.STR,
+)
 
 
 class UpdateWithoutPartialMixin(object):
@@ -21,3 +48,253 @@ class UpdateWithoutPartialMixin(object):
 
     def perform_update(self, serializer):
         serializer.save()
+
+
+class RawUploadMixin:
+    """
+    Reject raw uploads without a valid ``Content-Length`` header.
+
+    DRF doesn't call the parser for a request body without a size, the upload
+    would otherwise be handled as a request without data.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        raw = any(isinstance(parser, OctetStreamParser) for parser in request.parsers)
+        if raw and request.content_type.startswith(OctetStreamParser.media_type):
+            get_content_length(request)
+
+
+class SerializerRelationsMixin:
+    """
+    Fetch the relations that are serialized in bulk.
+
+    Viewsets declare the relations their serializer needs, so a page of
+    results is serialized with a constant number of queries instead of one or
+    more queries per object. Relations that are prefetched are only fetched
+    for read operations, the prefetched objects would not reflect the changes
+    made by a write operation.
+    """
+
+    serializer_select_related: Tuple[str, ...] = ()
+    serializer_prefetch_related: Tuple[str, ...] = ()
+    read_actions = ("list", "retrieve", "_zoek")
+
+    @classmethod
+    def with_serializer_relations(cls, queryset: models.QuerySet) -> models.QuerySet:
+        return queryset.select_related(*cls.serializer_select_related).prefetch_related(
+            *cls.serializer_prefetch_related
+        )
+
+    def get_serializer_relations(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        if self.action in self.read_actions:
+            return self.serializer_select_related, self.serializer_prefetch_related
+        return self.serializer_select_related, ()
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select_related, prefetch_related = self.get_serializer_relations()
+        # without arguments, ``select_related`` follows all foreign keys
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+        return queryset.prefetch_related(*prefetch_related)
+
+
+def get_source_paths(fields) -> Optional[Set[str]]:
+    """
+    Get the lookup paths of the model attributes that serializer fields read.
+
+    Returns ``None`` if this can't be determined for some field.
+    """
+    paths = set()
+    for field in fields:
+        if field.source == "*":
+            # hyperlinks to the object itself only read their lookup field
+            lookup_field = getattr(field, "lookup_field", None)
+            if lookup_field is None:
+                return None
+            paths.add(lookup_field)
+        else:
+            paths.add("__".join(field.source_attrs))
+        paths.update(getattr(field, "required_sources", ()))
+    return paths
+
+
+def get_columns(model, paths: Set[str]) -> Optional[Set[str]]:
+    """
+    Get the model fields to load for the lookup ``paths``.
+
+    Returns ``None`` if some path does not start with a model field or
+    gegevensgroep, e.g. a property.
+    """
+    columns = {model._meta.pk.name}
+    for path in paths:
+        name = path.split("__")[0]
+        try:
+            model_field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            gegevensgroep = getattr(model, name, None)
+            if not isinstance(gegevensgroep, GegevensGroepType):
+                return None
+            columns.update(field.name for field in gegevensgroep.mapping.values())
+            continue
+
+        if model_field.concrete:
+            columns.add(name)
+    return columns
+
+
+def is_used(relation: str, paths: Set[str]) -> bool:
+    return any(
+        path == relation
+        or path.startswith(f"{relation}__")
+        or relation.startswith(f"{path}__")
+        for path in paths
+    )
+
+
+class SparseFieldsMixin(SerializerRelationsMixin):
+    """
+    Limit the response to the fields in the ``fields`` query parameter.
+
+    Only the columns and relations that the remaining fields read are loaded
+    from the database. For searches, the fields are part of the search input.
+    The serializer must leave out the other fields, see
+    :class:`drc.api.serializers.mixins.SparseFieldsSerializerMixin`.
+    """
+
+    fields_query_param = "fields"
+
+    @cached_property
+    def sparse_fields(self) -> Optional[List[str]]:
+        # views are also instantiated outside of a request, e.g. to look up
+        # the object of an ETag
+        if not isinstance(getattr(self, "request", None), Request):
+            return None
+        if self.action not in self.read_actions:
+            return None
+
+        if self.action == "_zoek":
+            value = self.get_search_input().get(self.fields_query_param, "")
+        else:
+            value = self.request.query_params.get(self.fields_query_param, "")
+        if not value:
+            return None
+
+        fields = [
+            camel_to_underscore(name.strip())
+            for name in value.split(",")
+            if name.strip()
+        ]
+        known_fields = self.get_serializer_class()().fields
+        unknown_fields = [name for name in fields if name not in known_fields]
+        if unknown_fields:
+            msg = _("Onbekende velden: %s") % ", ".join(unknown_fields)
+            raise serializers.ValidationError(
+                {self.fields_query_param: msg}, code="unknown-fields"
+            )
+        return fields
+
+    @cached_property
+    def sparse_source_paths(self) -> Optional[Set[str]]:
+        if self.sparse_fields is None:
+            return None
+        known_fields = self.get_serializer_class()().fields
+        return get_source_paths(known_fields[name] for name in self.sparse_fields)
+
+    def get_serializer_relations(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        select_related, prefetch_related = super().get_serializer_relations()
+        paths = self.sparse_source_paths
+        if paths is None:
+            return select_related, prefetch_related
+
+        return (
+            tuple(relation for relation in select_related if is_used(relation, paths)),
+            tuple(
+                relation for relation in prefetch_related if is_used(relation, paths)
+            ),
+        )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        paths = self.sparse_source_paths
+        if paths is None:
+            return queryset
+
+        paths = paths | {self.lookup_field}
+        # the cursor is built from the last object of a page
+        cursor_ordering = getattr(self, "cursor_ordering", ())
+        if isinstance(cursor_ordering, str):
+            cursor_ordering = (cursor_ordering,)
+        paths.update(ordering.lstrip("-") for ordering in cursor_ordering)
+        # object permissions on the object itself read its fields
+        for permission in self.get_permissions():
+            if getattr(permission, "obj_path", None) is None:
+                paths.update(getattr(permission, "permission_fields", ()))
+
+        columns = get_columns(queryset.model, paths)
+        if columns is None:
+            return queryset
+        return queryset.only(*columns)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.sparse_fields is not None:
+            context["fields"] = self.sparse_fields
+        return context
+
+
+class StreamingListMixin:
+    """
+    Stream the list as newline delimited JSON if it is requested with
+    ``Accept: application/x-ndjson``.
+
+    The objects are read from a server-side cursor and serialized and rendered
+    per chunk, so the memory use does not grow with the number of results. The
+    results are not paginated. Requires :class:`SerializerRelationsMixin` for
+    the relations to prefetch, which are prefetched per chunk.
+    """
+
+    stream_chunk_size = 500
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        # only offered if it is asked for, the responses in the schema describe
+        # the paginated JSON
+        request = getattr(self, "request", None)
+        accept = request.META.get("HTTP_ACCEPT", "") if request is not None else ""
+        if self.action == "list" and NDJSONRenderer.media_type in accept:
+            renderers.append(NDJSONRenderer())
+        return renderers
+
+    def list(self, request, *args, **kwargs):
+        if not isinstance(request.accepted_renderer, NDJSONRenderer):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return StreamingHttpResponse(
+            self.stream(queryset), content_type=NDJSONRenderer.media_type
+        )
+
+    def stream(self, queryset: models.QuerySet) -> Iterator[bytes]:
+        prefetch_related = self.get_serializer_relations()[1]
+        fields_to_expand = (
+            self.get_fields_to_expand() if hasattr(self, "get_fields_to_expand") else []
+        )
+        renderer = self.request.accepted_renderer
+
+        # ``iterator`` ignores the prefetches, they're done for each chunk
+        objects = queryset.prefetch_related(None).iterator(
+            chunk_size=self.stream_chunk_size
+        )
+        while True:
+            chunk = list(islice(objects, self.stream_chunk_size))
+            if not chunk:
+                break
+
+            models.prefetch_related_objects(chunk, *prefetch_related)
+            data = self.get_serializer(chunk, many=True).data
+            if fields_to_expand:
+                self.clear_expansion_cache()
+                self.expand_results(data, fields_to_expand)
+            yield renderer.render(data)
@@ -0,0 +1,134 @@
+"""
+Send notifications to the Notificaties API through an outbox.
+
+With the ``ASYNC_NOTIFICATIONS`` setting, the notification of a change is
+written as a :class:`Notificatie` in the transaction of the change itself, so
+it is only sent if the change is committed. The ``send_notifications`` worker
+sends them in batches and retries failed notifications with an exponential
+backoff, so notifications are sent at least once.
+"""
+import logging
+from datetime import timedelta
+from typing import Dict, List, Union
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
+
+from notifications_api_common.models import NotificationsConfig
+from notifications_api_common.settings import get_setting
+
+from drc.datamodel.constants import NotificatieStatussen
+from drc.datamodel.models import Notificatie
+
+logger = logging.getLogger(__name__)
+
+
+class NotificatieOutboxMixin:
+    """
+    Write the notifications of a ``NotificationViewSetMixin`` view to the
+    outbox if ``ASYNC_NOTIFICATIONS`` is enabled.
+    """
+
+    def notify(
+        self, status_code: int, data: Union[List, Dict], instance: models.Model = None
+    ) -> None:
+        if not settings.ASYNC_NOTIFICATIONS:
+            super().notify(status_code, data, instance=instance)
+            return
+
+        if get_setting("NOTIFICATIONS_DISABLED"):
+            return
+
+        if not 200 <= status_code < 300:
+            logger.info(
+                "Not notifying, status code '%s' does not represent success.",
+                status_code,
+            )
+            return
+
+        # the kenmerken are determined now, the object may be changed or
+        # deleted by the time the notification is sent
+        message = self.construct_message(data, instance=instance)
+        Notificatie.objects.create(bericht=message)
+
+
+def get_retry_delay(pogingen: int) -> timedelta:
+    delay = settings.NOTIFICATIONS_RETRY_BACKOFF * 2 ** (pogingen - 1)
+    return timedelta(seconds=min(delay, settings.NOTIFICATIONS_RETRY_BACKOFF_MAX))
+
+
+def send_notificaties(batch_size: int) -> int:
+    """
+    Send a batch of waiting notifications, skipping the notifications claimed
+    by other workers.
+
+    Sent notifications are deleted. Failed notifications are retried later,
+    until they failed ``NOTIFICATIONS_MAX_ATTEMPTS`` times.
+
+    :return: the number of notifications in the batch
+    """
+    with transaction.atomic():
+        notificaties = list(
+            Notificatie.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=NotificatieStatussen.in_wachtrij,
+                volgende_poging__lte=timezone.now(),
+            )
+            .order_by("pk")[:batch_size]
+        )
+        if not notificaties:
+            return 0
+
+        client = NotificationsConfig.get_client()
+        if client is None:
+            raise RuntimeError("Could not build a client for Notifications API")
+
+        sent = []
+        for notificatie in notificaties:
+            try:
+                client.create("notificaties", notificatie.bericht)
+            except Exception as exc:
+                notificatie.pogingen += 1
+                notificatie.foutmelding = str(exc)
+                if notificatie.pogingen >= settings.NOTIFICATIONS_MAX_ATTEMPTS:
+                    logger.exception("Notificatie %s failed, giving up", notificatie.pk)
+                    notificatie.status = NotificatieStatussen.mislukt
+                else:
+                    logger.warning(
+                        "Notificatie %s failed, retrying later",
+                        notificatie.pk,
+                        exc_info=True,
+                    )
+                    notificatie.volgende_poging = timezone.now() + get_retry_delay(
+                        notificatie.pogingen
+                    )
+                notificatie.save(
+                    update_fields=[
+                        "pogingen",
+                        "foutmelding",
+                        "status",
+                        "volgende_poging",
+                    ]
+                )
+            else:
+                sent.append(notificatie.pk)
+
+        Notificatie.objects.filter(pk__in=sent).delete()
+
+    return len(notificaties)
+
+
+def process_notificaties(batch_size: int = None) -> int:
+    """
+    Send batches of waiting notifications until there are none left.
+
+    :return: the number of processed notifications
+    """
+    batch_size = batch_size or settings.NOTIFICATIONS_BATCH_SIZE
+    processed = 0
+    while True:
+        count = send_notificaties(batch_size)
+        processed += count
+        if count < batch_size:
+            return processed
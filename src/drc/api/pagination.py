@@ -0,0 +1,65 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination on a unique, immutable column.
+
+    Pages are selected by filtering on the position in the cursor instead of an
+    OFFSET, and the total number of results is not counted, so every page is as
+    cheap as the first one.
+
+    The ``cursor_ordering`` of the view is a column, or a tuple of columns if the
+    first one is not unique. The cursor only holds the position of the first
+    column; the other columns order the objects with the same position, which
+    are skipped with an offset.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", "pk")
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def decode_cursor(self, request):
+        # an empty cursor (``?cursor=``) requests the first page
+        if not request.query_params.get(self.cursor_query_param):
+            return None
+        return super().decode_cursor(request)
+
+
+class PageNumberOrCursorPagination(PageNumberPagination):
+    """
+    Page number pagination, with opt-in cursor pagination.
+
+    Cursor pagination is used as soon as the ``cursor`` query parameter is
+    provided, ordered on the ``cursor_ordering`` attribute of the view.
+    """
+
+    cursor_query_param = "cursor"
+    cursor_pagination_class = KeysetPagination
+
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param in request.query_params:
+            self.cursor_paginator = self.cursor_pagination_class()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class OptionalCursorPagination(KeysetPagination):
+    """
+    Cursor pagination if the ``cursor`` query parameter is provided, all
+    results otherwise.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.cursor_query_param not in request.query_params:
+            return None
+        return super().paginate_queryset(queryset, request, view)
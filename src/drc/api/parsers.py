@@ -0,0 +1,375 @@
+import base64
+import binascii
+import codecs
+import hashlib
+import json
+import re
+import uuid
+from functools import partial
+from typing import Optional, Tuple, Union
+
+from django.conf import settings
+from django.core.files.base import File
+from django.core.files.uploadedfile import TemporaryUploadedFile
+from django.utils.datastructures import MultiValueDict
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.parser import CamelCaseJSONParser
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework import serializers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.settings import api_settings
+
+# algorithms of the ``Digest`` header (RFC 3230) which can be verified
+DIGEST_ALGORITHMS = {
+    "md5": "md5",
+    "sha": "sha1",
+    "sha-256": "sha256",
+    "sha-512": "sha512",
+}
+
+# characters which are ignored by ``base64.b64decode``
+NON_BASE64_CHARS = re.compile(r"[^A-Za-z0-9+/=]")
+# characters which end a run of plain characters in a JSON string
+JSON_STRING_SPECIAL = re.compile(r'["\\]')
+# the longest ``data:<media type>;base64,`` header that is stripped
+MAX_DATA_URI_HEADER = 1024
+
+
+def parse_digest(value: str) -> Optional[Tuple[str, bytes]]:
+    """
+    Parse a ``Digest: <algorithm>=<base64 digest>`` header.
+
+    :return: the :mod:`hashlib` name of the first supported algorithm and the
+      expected digest, or ``None`` if no supported algorithm is used
+    :raises ValueError: if the digest is not valid base64
+    """
+    for instance in value.split(","):
+        algorithm, __, digest = instance.strip().partition("=")
+        hash_name = DIGEST_ALGORITHMS.get(algorithm.lower())
+        if hash_name:
+            try:
+                return hash_name, base64.b64decode(digest, validate=True)
+            except binascii.Error as exc:
+                raise ValueError(f"Invalid Digest header: {value!r}") from exc
+    return None
+
+
+def get_content_length(request) -> int:
+    """
+    Get the size of a raw upload from the ``Content-Length`` header.
+
+    Uploads without the header (``Transfer-Encoding: chunked``) are not
+    supported, the size of the file would not be known.
+
+    :raises ParseError: if the header is missing or not a valid size
+    """
+    value = request.META.get("CONTENT_LENGTH")
+    if not value:
+        raise ParseError(
+            _("De `Content-Length` header is verplicht bij een upload."),
+            code="file-size",
+        )
+    try:
+        size = int(value)
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise ParseError(
+            _("Ongeldige `Content-Length` header: {value!r}").format(value=value)
+        )
+    return size
+
+
+class StreamedUpload(File):
+    """
+    A file which is read from the request body while it's written to storage.
+
+    The body is not spooled to memory or a temporary file first, so the
+    file is written exactly once. The size and digest can only be checked
+    afterwards, with :meth:`verify`.
+    """
+
+    def __init__(self, stream, size: int, digest: Optional[Tuple[str, bytes]] = None):
+        super().__init__(stream, name=f"{uuid.uuid4()}.bin")
+        self.size = size
+        self.received = 0
+        self.digest = digest
+        self.hash_obj = hashlib.new(digest[0]) if digest else None
+
+    def chunks(self, chunk_size=None):
+        chunk_size = chunk_size or settings.READ_CHUNK
+        while self.file is not None and self.received < self.size:
+            data = self.file.read(min(chunk_size, self.size - self.received))
+            if not data:
+                # the client closed the connection
+                break
+            self.received += len(data)
+            if self.hash_obj is not None:
+                self.hash_obj.update(data)
+            yield data
+
+    def verify(self):
+        """
+        Check that the file was received completely and matches the digest.
+
+        This is called after the file is saved, outside of ``validate``.
+        """
+        if self.received != self.size:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: _(
+                        "Het bestand is niet volledig ontvangen. "
+                        "Verwachting: {expected}b, ontvangen: {received}b"
+                    ).format(expected=self.size, received=self.received)
+                },
+                code="file-size",
+            )
+
+        if self.hash_obj is not None and self.hash_obj.digest() != self.digest[1]:
+            raise serializers.ValidationError(
+                {
+                    api_settings.NON_FIELD_ERRORS_KEY: _(
+                        "De checksum van het bestand komt niet overeen met de "
+                        "`Digest` header."
+                    )
+                },
+                code="invalid-digest",
+            )
+
+
+class OctetStreamParser(BaseParser):
+    """
+    Parse a raw upload of the ``inhoud`` of a resource.
+
+    The request body is streamed into storage as a :class:`StreamedUpload`,
+    the ``lock`` is taken from the ``Lock`` header.
+    """
+
+    media_type = "application/octet-stream"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        request = parser_context["request"]
+
+        try:
+            digest = parse_digest(request.headers.get("Digest", ""))
+        except ValueError as exc:
+            raise ParseError(str(exc))
+
+        size = get_content_length(request)
+        data = {"inhoud": StreamedUpload(stream, size, digest=digest)}
+        if "Lock" in request.headers:
+            data["lock"] = request.headers["Lock"]
+        return data
+
+
+class Base64Decoder:
+    """
+    Decode base64 text into a temporary file, in parts.
+
+    The result is the same as decoding the whole text with
+    :func:`base64.b64decode`: characters outside of the base64 alphabet are
+    ignored, and only the part from the first padding character on is kept
+    until the end. A ``data:<media type>;base64,`` header is stripped, like
+    the ``Base64FileField`` does.
+    """
+
+    def __init__(self):
+        self.file = TemporaryUploadedFile(f"{uuid.uuid4()}.bin", None, 0, None)
+        self.header = ""
+        self.started = False
+        self.received = 0
+        self.pending = ""
+        self.padded = False
+
+    def feed(self, text: str):
+        self.received += len(text)
+        if not self.started:
+            self.header += text
+            # wait until it's known if the value starts with a header
+            if (
+                "data:".startswith(self.header[:5])
+                and ";base64," not in self.header
+                and len(self.header) < MAX_DATA_URI_HEADER
+            ):
+                return
+            text = self._strip_header()
+
+        text = self.pending + NON_BASE64_CHARS.sub("", text)
+        if not self.padded:
+            padding = text.find("=")
+            self.padded = padding != -1
+            # complete quads are decoded independently of the rest
+            end = (padding if self.padded else len(text)) // 4 * 4
+            self.file.write(binascii.a2b_base64(text[:end]))
+            text = text[end:]
+        self.pending = text
+
+    def close(self) -> Union[File, str, binascii.Error]:
+        """
+        :return: the decoded file, an empty string if the value was empty, or
+          the decoding error
+        """
+        if not self.started:
+            self.pending = NON_BASE64_CHARS.sub("", self._strip_header())
+
+        if not self.received:
+            self.file.close()
+            return ""
+
+        try:
+            self.file.write(base64.b64decode(self.pending))
+        except binascii.Error as exc:
+            self.file.close()
+            return exc
+
+        self.file.size = self.file.tell()
+        self.file.seek(0)
+        return self.file
+
+    def _strip_header(self) -> str:
+        text, self.header, self.started = self.header, "", True
+        if text.startswith("data:") and ";base64," in text:
+            text = text.split(";base64,", 1)[1]
+        return text
+
+
+class Base64FieldExtractor:
+    """
+    Take the value of a top level string field out of a JSON document, while
+    it's read.
+
+    The value is decoded with a :class:`Base64Decoder`, the rest of the
+    document is kept with ``null`` in place of the value. A document with the
+    field more than once is not valid, only one decoded file is kept.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.text = []
+        self.depth = 0
+        self.in_string = False
+        self.in_value = False
+        self.expect_value = False
+        self.escape = ""
+        self.string = []
+        self.last_string = None
+        self.field_found = False
+        self.decoder = None
+
+    def feed(self, chunk: str):
+        i, length = 0, len(chunk)
+        while i < length:
+            if self.in_value:
+                i = self._feed_value(chunk, i)
+                continue
+
+            char = chunk[i]
+            i += 1
+
+            if self.in_string:
+                self.text.append(char)
+                if self.escape:
+                    self.escape = ""
+                elif char == "\\":
+                    self.escape = char
+                elif char == '"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self.last_string = "".join(self.string)
+                    continue
+                if self.depth == 1:
+                    self.string.append(char)
+                continue
+
+            if char == '"' and self.depth == 1 and self.expect_value:
+                self.text.append("null")
+                self.in_value = True
+                self.expect_value = False
+                self.decoder = Base64Decoder()
+                continue
+
+            self.text.append(char)
+            if char == '"':
+                self.in_string = True
+                self.string = []
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+            elif char == ":" and self.depth == 1:
+                self.expect_value = self.last_string == self.field
+                if self.expect_value and self.field_found:
+                    raise ValueError(f"Duplicate key {self.field!r}")
+                self.field_found = self.field_found or self.expect_value
+            elif not char.isspace():
+                self.expect_value = False
+
+    def _feed_value(self, chunk: str, i: int) -> int:
+        # complete an escape sequence, which can be split over chunks
+        while self.escape:
+            if i >= len(chunk):
+                return i
+            self.escape += chunk[i]
+            i += 1
+            if len(self.escape) == (6 if self.escape[1] == "u" else 2):
+                self.decoder.feed(json.loads(f'"{self.escape}"'))
+                self.escape = ""
+
+        match = JSON_STRING_SPECIAL.search(chunk, i)
+        if match is None:
+            self.decoder.feed(chunk[i:])
+            return len(chunk)
+
+        end = match.start()
+        self.decoder.feed(chunk[i:end])
+        if chunk[end] == '"':
+            self.in_value = False
+        else:
+            self.escape = "\\"
+        return end + 1
+
+    def get_text(self) -> str:
+        return "".join(self.text)
+
+
+class Base64FileJSONParser(CamelCaseJSONParser):
+    """
+    Parse JSON with a base64 encoded ``inhoud``, which is decoded into a
+    temporary file while the request body is read.
+
+    Only the other fields are kept in memory, so the memory use of a request
+    does not grow with the size of the file. Decoding errors are passed on to
+    the ``inhoud`` field, which reports them as validation errors.
+    """
+
+    file_field = "inhoud"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        reader = codecs.getreader(encoding)(stream)
+        extractor = Base64FieldExtractor(self.file_field)
+
+        try:
+            for chunk in iter(partial(reader.read, settings.READ_CHUNK), ""):
+                extractor.feed(chunk)
+            data = underscoreize(
+                json.loads(extractor.get_text()), **self.json_underscoreize
+            )
+        except ValueError as exc:
+            if extractor.decoder is not None:
+                extractor.decoder.file.close()
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+        if extractor.decoder is None:
+            return data
+
+        inhoud = data[self.file_field] = extractor.decoder.close()
+        # like DRF does for form data, hand the file to the underlying request,
+        # which closes (and removes) it at the end of the request
+        request = parser_context.get("request")
+        if isinstance(inhoud, File) and request is not None:
+            request._request._files = MultiValueDict({self.file_field: [inhoud]})
+        return data
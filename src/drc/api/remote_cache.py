@@ -0,0 +1,198 @@
+"""
+Cache of remote resources, shared between requests and processes.
+
+Resources from the other APIs (Catalogi, Zaken, Besluiten) are fetched over
+and over again, for validation, for the default ``vertrouwelijkheidaanduiding``
+of documents and for the ``expand`` query parameter. They are cached in the
+Django cache configured by the ``REMOTE_RESOURCE_CACHE`` setting, honouring the
+``Cache-Control`` and ``ETag`` headers of the remote API. By default that's the
+``remote_resources`` cache of every process, which holds at most
+``REMOTE_RESOURCE_CACHE_MAX_ENTRIES`` resources.
+"""
+import hashlib
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from requests.structures import CaseInsensitiveDict
+
+KEY_PREFIX = "remote-resource"
+
+
+def parse_cache_control(value: str) -> dict:
+    directives = {}
+    for directive in value.split(","):
+        name, _, argument = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"')
+    return directives
+
+
+class CachedResponse:
+    """
+    Response of a cached remote resource, mimicking ``requests.Response``.
+    """
+
+    status_code = 200
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def json(self) -> dict:
+        return self._data
+
+    def raise_for_status(self):
+        pass
+
+
+class RemoteResourceCache:
+    """
+    Cache the JSON of remote resources by URL.
+
+    Entries are fresh for ``REMOTE_RESOURCE_CACHE_TIMEOUT`` seconds, or shorter
+    if the remote API says so with ``Cache-Control: max-age``. Stale entries
+    with an ``ETag`` are revalidated with a conditional request. The number of
+    cached resources is bounded by the ``MAX_ENTRIES`` of the cache, or the
+    eviction of a cache backend without it, like Redis.
+
+    The hits and misses are counted in the ``default`` cache, which is shared
+    by the processes even if the resources aren't.
+    """
+
+    stats_keys = ("hits", "misses")
+
+    @property
+    def cache(self):
+        return caches[settings.REMOTE_RESOURCE_CACHE]
+
+    @property
+    def stats_cache(self):
+        return caches["default"]
+
+    def get_key(self, url: str, headers: Optional[dict] = None) -> str:
+        hash_ = hashlib.sha256(url.encode("utf8"))
+        # resources fetched with the credentials of the client are only shared
+        # with requests using the same credentials
+        if headers and "Authorization" in headers:
+            hash_.update(headers["Authorization"].encode("utf8"))
+        return f"{KEY_PREFIX}:{hash_.hexdigest()}"
+
+    def get(self, url: str, headers: Optional[dict] = None) -> Optional[dict]:
+        """
+        Return the cached data of a resource, if it is still fresh.
+        """
+        entry = self.cache.get(self.get_key(url, headers))
+        if entry is None or entry["fresh_until"] < time.time():
+            self._count("misses")
+            return None
+
+        self._count("hits")
+        return entry["data"]
+
+    def set(
+        self,
+        url: str,
+        data: dict,
+        headers: Optional[dict] = None,
+        response_headers: Optional[dict] = None,
+    ):
+        """
+        Cache the data of a resource, unless the remote API forbids it.
+        """
+        response_headers = CaseInsensitiveDict(response_headers or {})
+        cache_control = parse_cache_control(response_headers.get("Cache-Control", ""))
+        if "no-store" in cache_control:
+            return
+
+        timeout = settings.REMOTE_RESOURCE_CACHE_TIMEOUT
+        max_age = timeout
+        if "no-cache" in cache_control:
+            max_age = 0
+        elif cache_control.get("max-age", "").isdigit():
+            max_age = min(int(cache_control["max-age"]), timeout)
+
+        etag = response_headers.get("ETag", "")
+        # without a way to revalidate, there's no use in keeping stale entries
+        if not max_age and not etag:
+            return
+
+        entry = {"data": data, "etag": etag, "fresh_until": time.time() + max_age}
+        self.cache.set(self.get_key(url, headers), entry, timeout)
+
+    def fetch(
+        self,
+        url: str,
+        fetcher: Callable,
+        headers: Optional[dict] = None,
+        private: bool = False,
+        **kwargs,
+    ):
+        """
+        Fetch a resource through the cache.
+
+        :param fetcher: a callable with the signature of ``requests.get``, used
+          for cache misses and revalidation.
+        :param private: whether the resource is fetched with the credentials of
+          the client rather than those of this API, in which case it's only
+          shared between requests with the same ``Authorization`` header.
+        :return: the response of the ``fetcher``, or a :class:`CachedResponse`.
+        """
+        headers = headers or {}
+        key_headers = headers if private else None
+        entry = self.cache.get(self.get_key(url, key_headers))
+
+        if entry is not None and entry["fresh_until"] >= time.time():
+            self._count("hits")
+            return CachedResponse(entry["data"])
+
+        self._count("misses")
+        request_headers = headers.copy()
+        if entry is not None and entry["etag"]:
+            request_headers["If-None-Match"] = entry["etag"]
+
+        response = fetcher(url, headers=request_headers, **kwargs)
+
+        if response.status_code == 304 and entry is not None:
+            response_headers = CaseInsensitiveDict({"ETag": entry["etag"]})
+            response_headers.update(response.headers or {})
+            self.set(url, entry["data"], key_headers, response_headers)
+            return CachedResponse(entry["data"])
+
+        if response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                return response
+            self.set(url, data, key_headers, response.headers)
+
+        return response
+
+    def stats(self) -> dict:
+        keys = {f"{KEY_PREFIX}:stats:{name}": name for name in self.stats_keys}
+        values = self.stats_cache.get_many(keys.keys())
+        return {name: values.get(key, 0) for key, name in keys.items()}
+
+    def _count(self, name: str):
+        key = f"{KEY_PREFIX}:stats:{name}"
+        try:
+            self.stats_cache.incr(key)
+        except ValueError:
+            # the counter doesn't exist (anymore), ``add`` doesn't overwrite a
+            # counter created by another process in the meantime
+            if not self.stats_cache.add(key, 1, None):
+                self.stats_cache.incr(key)
+
+
+remote_cache = RemoteResourceCache()
+
+
+def cached_link_fetcher(url: str, **kwargs):
+    """
+    Link fetcher for the ``URLValidator`` and its subclasses, which fetches
+    through the remote resource cache with ``REMOTE_RESOURCE_FETCHER``.
+    """
+    fetcher = import_string(settings.REMOTE_RESOURCE_FETCHER)
+    return remote_cache.fetch(url, fetcher, **kwargs)
@@ -1,9 +1,19 @@
 import json
-from json.decoder import JSONDecodeError
+from functools import lru_cache
+
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
 
 from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from djangorestframework_camel_case.util import (
+    camelize_re,
+    is_iterable,
+    underscore_to_camel,
+)
 from rest_framework.renderers import BaseRenderer
 
+NoneType = type(None)
+
 
 class BinaryFileRenderer(BaseRenderer):
     media_type = "application/octet-stream"
@@ -21,43 +31,81 @@ class BinaryFileRenderer(BaseRenderer):
         return data
 
 
+@lru_cache(maxsize=4096)
+def camelize_key(key: str) -> str:
+    if "_" in key:
+        key = camelize_re.sub(underscore_to_camel, key)
+    # ``_expand`` is the only key which keeps its underscore
+    return "_expand" if key == "Expand" else key
+
+
+def camelize_data(data, ignore_fields=()):
+    """
+    Camelize the keys of ``data`` like
+    :func:`djangorestframework_camel_case.util.camelize`, keeping ``_expand``.
+    """
+    if isinstance(data, (str, int, float, NoneType)):
+        return data
+    if isinstance(data, Promise):
+        return force_str(data)
+
+    if isinstance(data, dict):
+        camelized = {}
+        for key, value in data.items():
+            if isinstance(key, Promise):
+                key = force_str(key)
+            new_key = camelize_key(key) if isinstance(key, str) else key
+            if key in ignore_fields or new_key in ignore_fields:
+                camelized[new_key] = value
+            else:
+                camelized[new_key] = camelize_data(value, ignore_fields)
+        return camelized
+
+    if isinstance(data, (list, tuple)) or is_iterable(data):
+        return [camelize_data(item, ignore_fields) for item in data]
+    return data
+
+
 class CustomCamelCaseJSONRenderer(CamelCaseJSONRenderer):
-    """search and replace Expand with _expand in the response"""
+    """
+    Render the data with camelCase keys, and ``_expand`` for the expanded
+    resources.
+
+    The keys are converted in a single pass over the data, the result is
+    encoded once, with the C accelerated encoder of :mod:`json` if available.
+    Like the API always did, the JSON is ASCII-only and uses the default
+    separators of :func:`json.dumps`.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        ignore_fields = self.json_underscoreize.get("ignore_fields") or ()
+        return json.dumps(
+            camelize_data(data, ignore_fields),
+            cls=self.encoder_class,
+            allow_nan=not self.strict,
+        ).encode("ascii")
+
+
+class NDJSONRenderer(CustomCamelCaseJSONRenderer):
+    """
+    Render a list as newline delimited JSON, one object per line.
+
+    See http://ndjson.org/. Other data is rendered as a single line.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
 
-    def render(self, data, *args, **kwargs):
-        rendered = super().render(data, *args, **kwargs)
-        try:
-            list_of_responses = json.loads(rendered)
-        except JSONDecodeError as e:
-            return rendered
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
 
-        list_of_responses = self.replace_key_nested_dicts(
-            list_of_responses, "Expand", "_expand"
+        if not isinstance(data, list):
+            data = [data]
+        return b"".join(
+            super(NDJSONRenderer, self).render(item, accepted_media_type) + b"\n"
+            for item in data
         )
-        data_bytes = json.dumps(list_of_responses).encode("utf-8")
-        return data_bytes
-
-    def replace_key_nested_dicts(self, nested_dicts, old_key, new_key):
-        if isinstance(nested_dicts, list):
-            new_list = []
-            for dictionary in nested_dicts:
-                new_list.append(self.replace_key(dictionary, old_key, new_key))
-            return new_list
-        else:
-            return self.replace_key(nested_dicts, old_key, new_key)
-
-    def replace_key(self, dictionary, old_key, new_key):
-        if isinstance(dictionary, dict):
-            new_dict = {}
-            for key, value in dictionary.items():
-                if key == old_key:
-                    key = new_key
-                new_dict[key] = self.replace_key(value, old_key, new_key)
-            return new_dict
-        elif isinstance(dictionary, list):
-            new_list = []
-            for item in dictionary:
-                new_list.append(self.replace_key(item, old_key, new_key))
-            return new_list
-        else:
-            return dictionary
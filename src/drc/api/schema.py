@@ -122,6 +122,16 @@ class RequestEntityTooLargeSchema(AutoSchema):
         return responses
 
 
+class OptionalPaginationAutoSchema(AutoSchema):
+    """
+    Describe the unpaginated response of list endpoints with opt-in
+    pagination.
+    """
+
+    def _get_paginator(self):
+        return None
+
+
 class EIOAutoSchema(RequestEntityTooLargeSchema):
     pass
 
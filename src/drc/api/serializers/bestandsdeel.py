@@ -1,22 +1,41 @@
+import os
+from functools import partial
+from typing import Optional, Tuple
+
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
 
+from drc.api.fields import HyperlinkedIdentityField
+from drc.api.parsers import StreamedUpload
+from drc.api.serializers.mixins import CachedFieldsMixin
+from drc.api.utils import parse_content_range, write_chunk
 from drc.datamodel.models import BestandsDeel
 
 
-class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
+class BestandsDeelSerializer(CachedFieldsMixin, serializers.HyperlinkedModelSerializer):
+    serializer_url_field = HyperlinkedIdentityField
+
     lock = serializers.CharField(
         help_text="Hash string, which represents id of the lock of related informatieobject",
     )
 
     class Meta:
         model = BestandsDeel
-        fields = ("url", "volgnummer", "omvang", "inhoud", "voltooid", "lock")
+        fields = (
+            "url",
+            "volgnummer",
+            "omvang",
+            "ontvangen",
+            "inhoud",
+            "voltooid",
+            "lock",
+        )
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "volgnummer": {"read_only": True},
             "omvang": {"read_only": True},
+            "ontvangen": {"read_only": True},
             "voltooid": {
                 "read_only": True,
                 "help_text": _(
@@ -27,12 +46,51 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
             "inhoud": {"write_only": True},
         }
 
+    def get_content_range(self) -> Optional[Tuple[int, int, int]]:
+        request = self.context.get("request")
+        content_range = request.headers.get("Content-Range") if request else None
+        if not content_range:
+            return None
+
+        try:
+            return parse_content_range(content_range)
+        except ValueError:
+            raise serializers.ValidationError(
+                _("De `Content-Range` header is ongeldig."),
+                code="invalid-content-range",
+            )
+
     def validate(self, attrs):
         valid_attrs = super().validate(attrs)
 
         inhoud = valid_attrs.get("inhoud")
         lock = valid_attrs.get("lock")
-        if inhoud:
+        content_range = self.get_content_range()
+        if inhoud and content_range:
+            start, end, total = content_range
+            if total != self.instance.omvang or inhoud.size != end - start + 1:
+                raise serializers.ValidationError(
+                    _(
+                        "Het aangeleverde bestand komt niet overeen met de `Content-Range` "
+                        "header. Verwachting: bytes {start}-{end}/{expected}, "
+                        "ontvangen: {received}b"
+                    ).format(
+                        start=start,
+                        end=end,
+                        expected=self.instance.omvang,
+                        received=inhoud.size,
+                    ),
+                    code="invalid-content-range",
+                )
+            if start > self.instance.ontvangen:
+                raise serializers.ValidationError(
+                    _(
+                        "Het bestandsdeel moet aansluitend worden geupload. Verwachting: "
+                        "vanaf byte {expected}, ontvangen: vanaf byte {received}"
+                    ).format(expected=self.instance.ontvangen, received=start),
+                    code="invalid-offset",
+                )
+        elif inhoud:
             if inhoud.size != self.instance.omvang:
                 raise serializers.ValidationError(
                     _(
@@ -49,6 +107,35 @@ class BestandsDeelSerializer(serializers.HyperlinkedModelSerializer):
 
         return valid_attrs
 
+    def update(self, instance, validated_data):
+        inhoud = validated_data.pop("inhoud", None)
+        content_range = self.get_content_range()
+        if not inhoud:
+            return super().update(instance, validated_data)
+
+        if content_range and instance.inhoud:
+            # write the range into the file of the part, keeping the bytes which
+            # were received already
+            offset, received = content_range[0], instance.ontvangen
+            instance.ontvangen = write_chunk(
+                instance.inhoud.path, offset, inhoud, skip=received - offset
+            )
+            cleanup = partial(os.truncate, instance.inhoud.path, received)
+        else:
+            instance.inhoud.save(inhoud.name, inhoud, save=False)
+            instance.ontvangen = inhoud.size
+            cleanup = partial(instance.inhoud.delete, save=False)
+
+        # raw uploads can only be checked after they are written
+        if isinstance(inhoud, StreamedUpload):
+            try:
+                inhoud.verify()
+            except serializers.ValidationError:
+                cleanup()
+                raise
+
+        return super().update(instance, validated_data)
+
 
 class SchemaBestandsDeelSerializer(BestandsDeelSerializer):
     lock = serializers.CharField(
@@ -1,69 +1,76 @@
 import math
-import os
 import uuid
 
 from django.conf import settings
-from django.core.files.base import ContentFile, File
+from django.core.files.base import ContentFile
 from django.db import transaction
+from django.db.models import Sum
 from django.utils.module_loading import import_string
 from django.utils.translation import gettext_lazy as _
 
 from drf_spectacular.utils import extend_schema
 from rest_framework import serializers
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
-from vng_api_common.models import APICredential
-from vng_api_common.serializers import (
-    GegevensGroepSerializer,
-    add_choice_values_help_text,
-)
+from vng_api_common.serializers import GegevensGroepSerializer
 from vng_api_common.validators import IsImmutableValidator, PublishValidator
 
 from drc.api.auth import get_ztc_auth
-from drc.api.fields import AnyBase64File
+from drc.api.fields import AnyBase64File, HyperlinkedIdentityField
+from drc.api.finalization import delete_bestandsdelen, merge_bestandsdelen
+from drc.api.parsers import StreamedUpload
+from drc.api.remote_cache import remote_cache
 from drc.api.serializers.bestandsdeel import (
     BestandsDeelSerializer,
     SchemaBestandsDeelSerializer,
 )
-from drc.api.utils import create_filename, merge_files
+from drc.api.serializers.finalisatie import FinalisatieSerializer
+from drc.api.serializers.mixins import CachedFieldsMixin, SparseFieldsSerializerMixin
 from drc.api.validators import StatusValidator
-from drc.datamodel.constants import ChecksumAlgoritmes, OndertekeningSoorten, Statussen
+from drc.datamodel.constants import (
+    ChecksumAlgoritmes,
+    FinalisatieStatussen,
+    OndertekeningSoorten,
+    Statussen,
+)
 from drc.datamodel.models import (
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
+    Finalisatie,
 )
 from drc.datamodel.models.bestandsdeel import BestandsDeel
 
 
-class IntegriteitSerializer(GegevensGroepSerializer):
+class IntegriteitSerializer(CachedFieldsMixin, GegevensGroepSerializer):
+    choices_help_text = {"algoritme": ChecksumAlgoritmes}
+
     class Meta:
         model = EnkelvoudigInformatieObject
         gegevensgroep = "integriteit"
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
 
-        value_display_mapping = add_choice_values_help_text(ChecksumAlgoritmes)
-        self.fields["algoritme"].help_text += f"\n\n{value_display_mapping}"
+class OndertekeningSerializer(CachedFieldsMixin, GegevensGroepSerializer):
+    choices_help_text = {"soort": OndertekeningSoorten}
 
-
-class OndertekeningSerializer(GegevensGroepSerializer):
     class Meta:
         model = EnkelvoudigInformatieObject
         gegevensgroep = "ondertekening"
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(OndertekeningSoorten)
-        self.fields["soort"].help_text += f"\n\n{value_display_mapping}"
 
-
-class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class EnkelvoudigInformatieObjectSerializer(
+    SparseFieldsSerializerMixin,
+    CachedFieldsMixin,
+    serializers.HyperlinkedModelSerializer,
+):
     """
     Serializer for the EnkelvoudigInformatieObject model
     """
 
-    url = serializers.HyperlinkedIdentityField(
+    choices_help_text = {
+        "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding,
+        "status": Statussen,
+    }
+
+    url = HyperlinkedIdentityField(
         view_name="enkelvoudiginformatieobject-detail", lookup_field="uuid"
     )
     inhoud = AnyBase64File(
@@ -101,6 +108,15 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
     bestandsdelen = BestandsDeelSerializer(
         source="canonical.bestandsdelen", many=True, read_only=True
     )
+    finalisatie = FinalisatieSerializer(
+        label=_("finalisatie"),
+        read_only=True,
+        allow_null=True,
+        help_text=_(
+            "De voortgang van het samenvoegen van de bestandsdelen, als dit na het "
+            "unlocken van het document op de achtergrond gebeurt."
+        ),
+    )
 
     class Meta:
         model = EnkelvoudigInformatieObject
@@ -131,6 +147,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
             "informatieobjecttype",  # van-relatie,
             "locked",
             "bestandsdelen",
+            "finalisatie",
             "trefwoorden",
             "inhoud_is_vervallen",
         )
@@ -155,31 +172,15 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         read_only_fields = ["versie", "begin_registratie"]
         validators = [StatusValidator()]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(
-            VertrouwelijkheidsAanduiding
-        )
-        self.fields[
-            "vertrouwelijkheidaanduiding"
-        ].help_text += f"\n\n{value_display_mapping}"
-
-        value_display_mapping = add_choice_values_help_text(Statussen)
-        self.fields["status"].help_text += f"\n\n{value_display_mapping}"
-
     def _get_informatieobjecttype(self, informatieobjecttype_url: str) -> dict:
-        if not hasattr(self, "informatieobjecttype"):
-            # dynamic so that it can be mocked in tests easily
-            Client = import_string(settings.ZDS_CLIENT_CLASS)
-            client = Client.from_url(informatieobjecttype_url)
-            client.auth = APICredential.get_auth(
-                informatieobjecttype_url, scopes=["zds.scopes.zaaktypes.lezen"]
-            )
-            self._informatieobjecttype = client.request(
-                informatieobjecttype_url, "informatieobjecttype"
-            )
-        return self._informatieobjecttype
+        fetcher = import_string(settings.REMOTE_RESOURCE_FETCHER)
+        response = remote_cache.fetch(
+            informatieobjecttype_url,
+            fetcher,
+            headers=get_ztc_auth(informatieobjecttype_url),
+        )
+        response.raise_for_status()
+        return response.json()
 
     def validate_indicatie_gebruiksrecht(self, indicatie):
         if (
@@ -210,6 +211,10 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
 
     def validate(self, attrs):
         valid_attrs = super().validate(attrs)
+        # the size of raw uploads is known from the request
+        if isinstance(valid_attrs.get("inhoud"), StreamedUpload):
+            valid_attrs.setdefault("bestandsomvang", valid_attrs["inhoud"].size)
+
         # check if file.size equal bestandsomvang
         if self.instance is None:  # create
             inhoud = valid_attrs.get("inhoud")
@@ -276,6 +281,7 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
 
         return eio
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         """
         Instead of updating an existing EnkelvoudigInformatieObject,
@@ -284,8 +290,18 @@ class EnkelvoudigInformatieObjectSerializer(serializers.HyperlinkedModelSerializ
         """
         integriteit = validated_data.pop("integriteit", None)
         ondertekening = validated_data.pop("ondertekening", None)
+        inhoud = validated_data.get("inhoud")
 
         eio = super().update(instance, validated_data)
+
+        # raw uploads can only be checked after they are written
+        if isinstance(inhoud, StreamedUpload):
+            try:
+                inhoud.verify()
+            except serializers.ValidationError:
+                eio.inhoud.delete(save=False)
+                raise
+
         eio.integriteit = integriteit
         eio.ondertekening = ondertekening
         eio.save()
@@ -404,6 +420,12 @@ class LockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 _("The document is already locked"), code="existing-lock"
             )
+        finalisatie = getattr(self.instance.latest_version, "finalisatie", None)
+        if finalisatie and finalisatie.is_active:
+            raise serializers.ValidationError(
+                _("The bestandsdelen of the document are still being merged"),
+                code="finalisatie-bezig",
+            )
         return valid_attrs
 
     @transaction.atomic
@@ -435,6 +457,13 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         valid_attrs = super().validate(attrs)
         force_unlock = self.context.get("force_unlock", False)
 
+        finalisatie = getattr(self.instance, "finalisatie", None)
+        if finalisatie and finalisatie.is_active:
+            raise serializers.ValidationError(
+                _("The bestandsdelen of the document are still being merged"),
+                code="finalisatie-bezig",
+            )
+
         if force_unlock:
             return valid_attrs
 
@@ -471,28 +500,29 @@ class UnlockEnkelvoudigInformatieObjectSerializer(serializers.ModelSerializer):
         if self.instance.canonical.empty_bestandsdelen:
             return self.instance
 
-        bestandsdelen = self.instance.canonical.bestandsdelen.order_by("volgnummer")
-        if self.instance.canonical.complete_upload:
-            part_files = [p.inhoud.file for p in bestandsdelen]
-            # create the name of target file using the storage backend to the serializer
-            name = create_filename(self.instance.bestandsnaam)
-            file_field = self.instance._meta.get_field("inhoud")
-            rel_name = file_field.generate_filename(self.instance, name)
-            rel_path, file_name = os.path.split(rel_name)
-            # merge files
-            file_dir = os.path.join(settings.PRIVATE_MEDIA_ROOT, rel_path)
-            target_file = merge_files(part_files, file_dir, file_name)
-            # save full file to the instance FileField
-            with open(target_file, "rb") as file_obj:
-                self.instance.inhoud.save(file_name, File(file_obj))
-        else:
+        if not self.instance.canonical.complete_upload:
             self.instance.bestandsomvang = None
             self.instance.save()
-
-        # delete part files
-        for part in bestandsdelen:
-            part.inhoud.delete()
-            part.delete()
+            delete_bestandsdelen(self.instance.canonical.bestandsdelen.all())
+        elif settings.ASYNC_UPLOAD_FINALIZATION:
+            # the bestandsdelen are merged by the ``finalize_uploads`` worker
+            omvang = self.instance.canonical.bestandsdelen.aggregate(
+                omvang=Sum("omvang")
+            )["omvang"]
+            # a failed job of this version is started over
+            Finalisatie.objects.update_or_create(
+                informatieobject=self.instance,
+                defaults={
+                    "status": FinalisatieStatussen.in_wachtrij,
+                    "omvang": omvang,
+                    "verwerkt": 0,
+                    "foutmelding": "",
+                    "gestart": None,
+                    "beeindigd": None,
+                },
+            )
+        else:
+            merge_bestandsdelen(self.instance)
 
         return self.instance
 
@@ -510,6 +540,14 @@ class EIOZoekSerializer(serializers.Serializer):
         ),
         required=False,
     )
+    fields = serializers.CharField(
+        help_text=_(
+            "Geef alleen de opgegeven velden terug, gescheiden door een komma, "
+            "bijvoorbeeld `url,titel`. Velden die gebruikt worden in `expand` moeten "
+            "ook opgegeven worden."
+        ),
+        required=False,
+    )
 
 
 class SchemaEIOSerializer(EnkelvoudigInformatieObjectSerializer):
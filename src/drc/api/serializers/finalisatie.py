@@ -0,0 +1,15 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+from drc.api.serializers.mixins import CachedFieldsMixin
+from drc.datamodel.constants import FinalisatieStatussen
+from drc.datamodel.models import Finalisatie
+
+
+class FinalisatieSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    choices_help_text = {"status": FinalisatieStatussen}
+
+    class Meta:
+        model = Finalisatie
+        fields = ("status", "omvang", "verwerkt")
@@ -2,14 +2,24 @@ from rest_framework import serializers
 from vng_api_common.utils import get_help_text
 from vng_api_common.validators import IsImmutableValidator
 
-from drc.api.fields import EnkelvoudigInformatieObjectHyperlinkedRelatedField
+from drc.api.fields import (
+    EnkelvoudigInformatieObjectHyperlinkedRelatedField,
+    HyperlinkedIdentityField,
+)
+from drc.api.serializers.mixins import CachedFieldsMixin, SparseFieldsSerializerMixin
 from drc.datamodel.models.enkelvoudig_informatieobject import (
     EnkelvoudigInformatieObject,
 )
 from drc.datamodel.models.gebruiksrechten import Gebruiksrechten
 
 
-class GebruiksrechtenSerializer(serializers.HyperlinkedModelSerializer):
+class GebruiksrechtenSerializer(
+    SparseFieldsSerializerMixin,
+    CachedFieldsMixin,
+    serializers.HyperlinkedModelSerializer,
+):
+    serializer_url_field = HyperlinkedIdentityField
+
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
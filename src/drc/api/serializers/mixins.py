@@ -0,0 +1,58 @@
+import copy
+from typing import Dict, List, Optional, Type
+
+from djchoices import DjangoChoices
+from vng_api_common.serializers import add_choice_values_help_text
+
+
+class CachedFieldsMixin:
+    # Build the fields of a serializer once per class.
+    #
+    # Building the fields of a ``ModelSerializer`` introspects the model for every
+    # instance, which adds up for nested serializers and lists. The fields are
+    # built once and copied for every instance instead, like DRF does for the
+    # declared fields.
+    #
+    # The possible values of the fields in ``choices_help_text`` are added to
+    # their help text when the fields are built.
+    #
+    # This is not a docstring, drf-spectacular would use it as the description
+    # of the serializers in the schema.
+
+    choices_help_text: Dict[str, Type[DjangoChoices]] = {}
+
+    def get_fields(self):
+        cls = type(self)
+        # subclasses can declare other fields, so only look in the class itself
+        fields = cls.__dict__.get("_cached_fields")
+        if fields is None:
+            fields = super().get_fields()
+            for field_name, choices in self.choices_help_text.items():
+                field = fields[field_name]
+                value_display_mapping = add_choice_values_help_text(choices)
+                field.help_text = f"{field.help_text}\n\n{value_display_mapping}"
+                # copies are constructed again with the original arguments
+                field._kwargs["help_text"] = field.help_text
+            cls._cached_fields = fields
+        return copy.deepcopy(fields)
+
+
+class SparseFieldsSerializerMixin:
+    # Leave out the fields that are not in the ``fields`` of the context.
+    #
+    # Only the context that is passed to the serializer itself is used, nested
+    # serializers share the context of their parent but serialize all of their
+    # fields.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        context = kwargs.get("context") or {}
+        self.sparse_fields: Optional[List[str]] = context.get("fields")
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.sparse_fields is None:
+            return fields
+        return {
+            name: field for name, field in fields.items() if name in self.sparse_fields
+        }
@@ -1,11 +1,13 @@
 from rest_framework import serializers
 from vng_api_common.constants import ObjectTypes
-from vng_api_common.serializers import add_choice_values_help_text
 from vng_api_common.utils import get_help_text
-from vng_api_common.validators import IsImmutableValidator, URLValidator
+from vng_api_common.validators import IsImmutableValidator
 
-from drc.api.auth import get_zrc_auth
-from drc.api.fields import EnkelvoudigInformatieObjectHyperlinkedRelatedField
+from drc.api.fields import (
+    EnkelvoudigInformatieObjectHyperlinkedRelatedField,
+    HyperlinkedIdentityField,
+)
+from drc.api.serializers.mixins import CachedFieldsMixin, SparseFieldsSerializerMixin
 from drc.api.validators import (
     InformatieObjectUniqueValidator,
     ObjectInformatieObjectValidator,
@@ -16,7 +18,15 @@ from drc.datamodel.models.enkelvoudig_informatieobject import (
 from drc.datamodel.models.object_informatieobject import ObjectInformatieObject
 
 
-class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
+class ObjectInformatieObjectSerializer(
+    SparseFieldsSerializerMixin,
+    CachedFieldsMixin,
+    serializers.HyperlinkedModelSerializer,
+):
+    serializer_url_field = HyperlinkedIdentityField
+
+    choices_help_text = {"object_type": ObjectTypes}
+
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -30,26 +40,11 @@ class ObjectInformatieObjectSerializer(serializers.HyperlinkedModelSerializer):
         extra_kwargs = {
             "url": {"lookup_field": "uuid"},
             "informatieobject": {"validators": [IsImmutableValidator()]},
-            "object": {
-                "validators": [
-                    URLValidator(
-                        get_auth=get_zrc_auth, headers={"Accept-Crs": "EPSG:4326"}
-                    ),
-                    IsImmutableValidator(),
-                ]
-            },
+            # the object is fetched by the ObjectInformatieObjectValidator
+            "object": {"validators": [IsImmutableValidator()]},
             "object_type": {"validators": [IsImmutableValidator()]},
         }
         validators = [
             ObjectInformatieObjectValidator(),
             InformatieObjectUniqueValidator("object", "informatieobject"),
         ]
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        value_display_mapping = add_choice_values_help_text(ObjectTypes)
-        self.fields["object_type"].help_text += f"\n\n{value_display_mapping}"
-
-        if not hasattr(self, "initial_data"):
-            return
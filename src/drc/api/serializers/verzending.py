@@ -5,7 +5,11 @@ from rest_framework import serializers
 from vng_api_common.serializers import GegevensGroepSerializer, NestedGegevensGroepMixin
 from vng_api_common.utils import get_help_text
 
-from drc.api.fields import EnkelvoudigInformatieObjectHyperlinkedRelatedField
+from drc.api.fields import (
+    EnkelvoudigInformatieObjectHyperlinkedRelatedField,
+    HyperlinkedIdentityField,
+)
+from drc.api.serializers.mixins import CachedFieldsMixin, SparseFieldsSerializerMixin
 from drc.api.validators import OneAddressValidator
 from drc.datamodel.models import Verzending
 from drc.datamodel.models.enkelvoudig_informatieobject import (
@@ -13,30 +17,40 @@ from drc.datamodel.models.enkelvoudig_informatieobject import (
 )
 
 
-class BinnenlandsCorrespondentieadresVerzendingSerializer(GegevensGroepSerializer):
+class BinnenlandsCorrespondentieadresVerzendingSerializer(
+    CachedFieldsMixin, GegevensGroepSerializer
+):
     class Meta:
         model = Verzending
         gegevensgroep = "binnenlands_correspondentieadres"
 
 
-class BuitenlandsCorrespondentieadresVerzendingSerializer(GegevensGroepSerializer):
+class BuitenlandsCorrespondentieadresVerzendingSerializer(
+    CachedFieldsMixin, GegevensGroepSerializer
+):
     class Meta:
         model = Verzending
         gegevensgroep = "buitenlands_correspondentieadres"
 
 
-class BuitenlandsCorrespondentiepostadresVerzendingSerializer(GegevensGroepSerializer):
+class BuitenlandsCorrespondentiepostadresVerzendingSerializer(
+    CachedFieldsMixin, GegevensGroepSerializer
+):
     class Meta:
         model = Verzending
         gegevensgroep = "correspondentie_postadres"
 
 
 class VerzendingSerializer(
+    SparseFieldsSerializerMixin,
+    CachedFieldsMixin,
     NestedGegevensGroepMixin,
     NestedCreateMixin,
     NestedUpdateMixin,
     serializers.HyperlinkedModelSerializer,
 ):
+    serializer_url_field = HyperlinkedIdentityField
+
     informatieobject = EnkelvoudigInformatieObjectHyperlinkedRelatedField(
         view_name="enkelvoudiginformatieobject-detail",
         lookup_field="uuid",
@@ -1,9 +1,14 @@
+import json
+import tempfile
 import uuid
 from base64 import b64encode
-from datetime import datetime
+from datetime import datetime, timedelta
+from io import StringIO
 from unittest.mock import patch
 
+from django.core.management import call_command
 from django.test import override_settings
+from django.utils import timezone
 
 from freezegun import freeze_time
 from rest_framework import status
@@ -12,7 +17,10 @@ from vng_api_common.audittrails.models import AuditTrail
 from vng_api_common.tests import JWTAuthMixin, reverse, reverse_lazy
 from vng_api_common.utils import get_uuid_from_path
 
+from drc.api.audits import get_changes, reconstruct_wijzigingen
+from drc.api.pagination import OptionalCursorPagination
 from drc.datamodel.models import (
+    AuditTrailBuffer,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
     Gebruiksrechten,
@@ -285,3 +293,234 @@ class AuditTrailTests(JWTAuthMixin, APITestCase):
         # Verify that the resource weergave stored in the AuditTrail matches
         # the unique representation as defined in the Zaak model
         self.assertIn(audittrail.resource_weergave, eio_unique_representation)
+
+
+@freeze_time("2019-01-01")
+@override_settings(
+    LINK_FETCHER="vng_api_common.mocks.link_fetcher_200", ASYNC_AUDITTRAILS=True
+)
+class BufferedAuditTrailTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_update_enkelvoudiginformatieobject_audittrail(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(titel="oud")
+        eio.canonical.lock = "0f60f6d2d2714c809ed762372f5a363a"
+        eio.canonical.save()
+        eio_url = f"http://testserver{reverse(eio)}"
+        oud = self.client.get(eio_url).json()
+
+        response = self.client.patch(
+            eio_url, {"titel": "nieuw", "lock": "0f60f6d2d2714c809ed762372f5a363a"}
+        )
+
+        self.assertFalse(AuditTrail.objects.exists())
+        aanmaakdatum = timezone.now() - timedelta(hours=1)
+        AuditTrailBuffer.objects.update(aanmaakdatum=aanmaakdatum)
+
+        call_command("write_audittrails", once=True, stdout=StringIO())
+
+        audittrail = AuditTrail.objects.get()
+        self.assertEqual(audittrail.actie, "partial_update")
+        self.assertEqual(audittrail.aanmaakdatum, aanmaakdatum)
+        # only the changes are stored
+        self.assertEqual(audittrail.oud, {"titel": "oud"})
+        self.assertEqual(audittrail.nieuw, response.data)
+
+        list_url = reverse(
+            "audittrail-list", kwargs={"enkelvoudiginformatieobject_uuid": eio.uuid}
+        )
+        detail_url = reverse(
+            audittrail, kwargs={"enkelvoudiginformatieobject_uuid": eio.uuid}
+        )
+        for data in [
+            self.client.get(list_url).json()[0],
+            self.client.get(detail_url).json(),
+        ]:
+            self.assertEqual(
+                data["wijzigingen"], {"oud": oud, "nieuw": response.json()}
+            )
+
+    def test_create_and_delete_gebruiksrechten_audittrail(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        gebruiksrechten = self.client.post(
+            reverse(Gebruiksrechten),
+            {
+                "informatieobject": f"http://testserver{reverse(eio)}",
+                "startdatum": "2019-01-01T00:00:00Z",
+                "omschrijvingVoorwaarden": "test",
+            },
+        ).data
+        self.client.delete(gebruiksrechten["url"])
+
+        call_command("write_audittrails", once=True, stdout=StringIO())
+
+        audittrails = AuditTrail.objects.order_by("pk")
+        self.assertEqual(
+            [(trail.actie, trail.oud, trail.nieuw) for trail in audittrails],
+            [("create", None, gebruiksrechten), ("destroy", gebruiksrechten, None)],
+        )
+        # stored as SQL NULL, not as JSON null
+        self.assertEqual(
+            list(audittrails.filter(oud__isnull=True).values_list("actie", flat=True)),
+            ["create"],
+        )
+
+    def test_destroy_enkelvoudiginformatieobject(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = f"http://testserver{reverse(eio)}"
+        self.client.post(
+            reverse(Gebruiksrechten),
+            {
+                "informatieobject": eio_url,
+                "startdatum": "2019-01-01T00:00:00Z",
+                "omschrijvingVoorwaarden": "test",
+            },
+        )
+        self.client.delete(reverse(Gebruiksrechten.objects.get()))
+
+        response = self.client.delete(eio_url)
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertFalse(AuditTrailBuffer.objects.exists())
+
+    def test_reconstruct_attribute_missing_after_update(self):
+        oud = {"titel": "oud", "link": None, "taal": "nld"}
+        nieuw = {"titel": "nieuw", "taal": "nld"}
+
+        audittrail = AuditTrail(oud=get_changes(oud, nieuw), nieuw=nieuw)
+
+        self.assertEqual(audittrail.oud, {"titel": "oud", "link": None})
+        self.assertEqual(reconstruct_wijzigingen(audittrail).oud, oud)
+
+
+class AuditTrailListTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def setUp(self):
+        super().setUp()
+
+        self.eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = f"http://testserver{reverse(self.eio)}"
+        for day in range(1, 6):
+            with freeze_time(f"2019-01-0{day}"):
+                AuditTrail.objects.create(
+                    bron="DRC",
+                    actie="update",
+                    resultaat=200,
+                    hoofd_object=eio_url,
+                    resource="enkelvoudiginformatieobject",
+                    resource_url=eio_url,
+                    resource_weergave=f"{day}",
+                )
+        self.list_url = reverse(
+            "audittrail-list",
+            kwargs={"enkelvoudiginformatieobject_uuid": self.eio.uuid},
+        )
+
+    def test_cursor_pagination(self):
+        weergaven = []
+        url, data = self.list_url, {"cursor": ""}
+        with patch.object(OptionalCursorPagination, "page_size", 2):
+            while url:
+                response = self.client.get(url, data)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                page = response.json()
+                weergaven += [
+                    audittrail["resourceWeergave"] for audittrail in page["results"]
+                ]
+                url, data = page["next"], None
+
+        self.assertEqual(weergaven, ["1", "2", "3", "4", "5"])
+
+    def test_cursor_pagination_same_aanmaakdatum(self):
+        eio_url = f"http://testserver{reverse(self.eio)}"
+        # the page boundaries fall between entries created at the same time
+        with freeze_time("2019-01-03"):
+            for weergave in ["3a", "3b"]:
+                AuditTrail.objects.create(
+                    bron="DRC",
+                    actie="update",
+                    resultaat=200,
+                    hoofd_object=eio_url,
+                    resource="enkelvoudiginformatieobject",
+                    resource_url=eio_url,
+                    resource_weergave=weergave,
+                )
+
+        weergaven = []
+        url, data = self.list_url, {"cursor": ""}
+        with patch.object(OptionalCursorPagination, "page_size", 2):
+            while url:
+                page = self.client.get(url, data).json()
+                weergaven += [
+                    audittrail["resourceWeergave"] for audittrail in page["results"]
+                ]
+                url, data = page["next"], None
+
+        self.assertEqual(weergaven, ["1", "2", "3", "3a", "3b", "4", "5"])
+
+    def test_filter_aanmaakdatum(self):
+        response = self.client.get(
+            self.list_url,
+            {
+                "aanmaakdatum__gte": "2019-01-02T00:00:00Z",
+                "aanmaakdatum__lt": "2019-01-04T00:00:00Z",
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [audittrail["resourceWeergave"] for audittrail in response.json()],
+            ["2", "3"],
+        )
+
+    def test_other_document(self):
+        other = EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.get(
+            reverse(
+                "audittrail-list",
+                kwargs={"enkelvoudiginformatieobject_uuid": other.uuid},
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_written_with_other_host(self):
+        AuditTrail.objects.create(
+            bron="DRC",
+            actie="update",
+            resultaat=200,
+            hoofd_object=f"https://documenten.example.com{reverse(self.eio)}",
+            resource="enkelvoudiginformatieobject",
+            resource_url=f"https://documenten.example.com{reverse(self.eio)}",
+            resource_weergave="6",
+        )
+
+        response = self.client.get(self.list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [audittrail["resourceWeergave"] for audittrail in response.json()],
+            ["1", "2", "3", "4", "5", "6"],
+        )
+
+    def test_archive(self):
+        with tempfile.NamedTemporaryFile("r") as output:
+            call_command(
+                "archive_audittrails", "2019-01-03", output.name, stdout=StringIO()
+            )
+
+            archived = [json.loads(line) for line in output]
+
+        self.assertEqual([entry["resource_weergave"] for entry in archived], ["1", "2"])
+        self.assertEqual(
+            list(
+                AuditTrail.objects.order_by("pk").values_list(
+                    "resource_weergave", flat=True
+                )
+            ),
+            ["3", "4", "5"],
+        )
@@ -2,11 +2,13 @@
 Guarantee that the proper authorization amchinery is in place.
 """
 
-from django.test import override_settings
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.models import APICredential
 from vng_api_common.tests import AuthCheckMixin, JWTAuthMixin, reverse
 
 from drc.datamodel.tests.factories import (
@@ -15,8 +17,12 @@ from drc.datamodel.tests.factories import (
     ObjectInformatieObjectFactory,
 )
 
+from .. import credentials
+from ..credentials import get_auth
 from ..scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
 
+ZAAK = "https://zrc.nl/api/v1/zaken/1234"
+
 
 @override_settings(ZDS_CLIENT_CLASS="vng_api_common.mocks.MockClient")
 class InformatieObjectScopeForbiddenTests(AuthCheckMixin, APITestCase):
@@ -281,3 +287,53 @@ class OioReadTests(JWTAuthMixin, APITestCase):
                 response = self.client.get(url)
 
                 self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class APICredentialsCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def test_most_specific_api_root(self):
+        APICredential.objects.create(
+            api_root="https://zrc.nl/", client_id="root", secret="secret"
+        )
+        APICredential.objects.create(
+            api_root="https://zrc.nl/api/v1/", client_id="api", secret="secret"
+        )
+
+        self.assertEqual(get_auth(ZAAK).client_id, "api")
+        self.assertEqual(get_auth("https://zrc.nl/other").client_id, "root")
+        self.assertIsNone(get_auth("https://brc.nl/api/v1/besluiten/4321"))
+
+    def test_cached_until_changed(self):
+        credential = APICredential.objects.create(
+            api_root="https://zrc.nl/api/v1/", client_id="old", secret="secret"
+        )
+        get_auth(ZAAK)
+
+        with self.assertNumQueries(0):
+            auth = get_auth(ZAAK, scopes=["zds.scopes.zaken.lezen"])
+
+        self.assertEqual(auth.client_id, "old")
+        self.assertEqual(auth.claims["scopes"], ["zds.scopes.zaken.lezen"])
+
+        credential.client_id = "new"
+        credential.save()
+
+        self.assertEqual(get_auth(ZAAK).client_id, "new")
+
+        credential.delete()
+
+        self.assertIsNone(get_auth(ZAAK))
+
+    def test_invalidated_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            APICredential.objects.create(
+                api_root="https://zrc.nl/api/v1/", client_id="new", secret="secret"
+            )
+            # another process caching the credentials before the commit
+            credentials._credentials = (credentials.get_version(), {})
+
+        self.assertEqual(get_auth(ZAAK).client_id, "new")
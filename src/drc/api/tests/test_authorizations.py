@@ -0,0 +1,115 @@
+from django.core.cache import caches
+from django.test import TestCase
+
+from vng_api_common.authorizations.models import Applicatie, Autorisatie
+from vng_api_common.constants import ComponentTypes, VertrouwelijkheidsAanduiding
+
+from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+
+from ..authorizations import get_compiled_authorizations
+from ..scopes import SCOPE_DOCUMENTEN_AANMAKEN, SCOPE_DOCUMENTEN_ALLES_LEZEN
+
+IOTYPE = "https://ztc.nl/api/v1/informatieobjecttypen/{}"
+
+
+class CompiledAuthorizationsTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+        self.applicatie = Applicatie.objects.create(client_ids=["test"])
+
+    def add_autorisatie(self, informatieobjecttype, max_va, scopes=None):
+        return Autorisatie.objects.create(
+            applicatie=self.applicatie,
+            component=ComponentTypes.drc,
+            scopes=scopes or [SCOPE_DOCUMENTEN_ALLES_LEZEN.label],
+            informatieobjecttype=informatieobjecttype,
+            max_vertrouwelijkheidaanduiding=max_va,
+        )
+
+    def compile(self):
+        return get_compiled_authorizations(
+            [self.applicatie],
+            SCOPE_DOCUMENTEN_ALLES_LEZEN,
+            self.applicatie.autorisaties.all(),
+        )
+
+    def test_compile(self):
+        self.add_autorisatie(IOTYPE.format(1), VertrouwelijkheidsAanduiding.openbaar)
+        self.add_autorisatie(IOTYPE.format(1), VertrouwelijkheidsAanduiding.geheim)
+        self.add_autorisatie(IOTYPE.format(2), VertrouwelijkheidsAanduiding.intern)
+        self.add_autorisatie(
+            IOTYPE.format(3),
+            VertrouwelijkheidsAanduiding.geheim,
+            scopes=[SCOPE_DOCUMENTEN_AANMAKEN.label],
+        )
+
+        compiled = self.compile()
+
+        self.assertEqual(
+            compiled,
+            {
+                IOTYPE.format(1): VertrouwelijkheidsAanduiding.get_choice(
+                    VertrouwelijkheidsAanduiding.geheim
+                ).order,
+                IOTYPE.format(2): VertrouwelijkheidsAanduiding.get_choice(
+                    VertrouwelijkheidsAanduiding.intern
+                ).order,
+            },
+        )
+
+    def test_cached_until_changed(self):
+        autorisatie = self.add_autorisatie(
+            IOTYPE.format(1), VertrouwelijkheidsAanduiding.openbaar
+        )
+        self.compile()
+
+        with self.assertNumQueries(0):
+            self.compile()
+
+        autorisatie.informatieobjecttype = IOTYPE.format(2)
+        autorisatie.save()
+
+        self.assertEqual(list(self.compile()), [IOTYPE.format(2)])
+
+        autorisatie.delete()
+
+        self.assertEqual(self.compile(), {})
+
+    def test_sql_does_not_grow_with_authorizations(self):
+        def get_sql(count):
+            authorizations = {IOTYPE.format(i): i % 8 for i in range(count)}
+            queryset = EnkelvoudigInformatieObject.objects.filter_for_authorizations(
+                SCOPE_DOCUMENTEN_ALLES_LEZEN, authorizations
+            )
+            return queryset.query.sql_with_params()[0]
+
+        self.assertEqual(get_sql(1), get_sql(500))
+
+    def test_filter(self):
+        for i in range(2):
+            self.add_autorisatie(IOTYPE.format(i), VertrouwelijkheidsAanduiding.intern)
+            for vertrouwelijkheidaanduiding in [
+                VertrouwelijkheidsAanduiding.openbaar,
+                VertrouwelijkheidsAanduiding.zeer_geheim,
+            ]:
+                EnkelvoudigInformatieObjectFactory.create(
+                    informatieobjecttype=IOTYPE.format(i),
+                    vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
+                )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=IOTYPE.format(2),
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        queryset = EnkelvoudigInformatieObject.objects.filter_for_authorizations(
+            SCOPE_DOCUMENTEN_ALLES_LEZEN, self.compile()
+        )
+
+        self.assertEqual(
+            sorted(queryset.values_list("informatieobjecttype", flat=True)),
+            [IOTYPE.format(0), IOTYPE.format(1)],
+        )
@@ -7,6 +7,7 @@ from django.test import override_settings
 from django.utils import timezone
 
 from freezegun import freeze_time
+from privates.storages import PrivateMediaFileSystemStorage
 from privates.test import temp_private_root
 from rest_framework import status
 from rest_framework.test import APITestCase
@@ -116,6 +117,7 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
                 "status": "",
                 "locked": False,
                 "bestandsdelen": [],
+                "finalisatie": None,
                 "lock": "",
                 "trefwoorden": None,
             }
@@ -175,6 +177,7 @@ class EnkelvoudigInformatieObjectAPITests(JWTAuthMixin, APITestCase):
             "informatieobjecttype": INFORMATIEOBJECTTYPE,
             "locked": False,
             "bestandsdelen": [],
+            "finalisatie": None,
             "trefwoorden": None,
             "inhoudIsVervallen": None,
         }
@@ -544,6 +547,33 @@ class EnkelvoudigInformatieObjectVersionHistoryAPITests(JWTAuthMixin, APITestCas
         self.assertEqual(response_data[0]["beschrijving"], "object1 versie2")
         self.assertEqual(response_data[1]["beschrijving"], "object2 versie2")
 
+    def test_eio_list_download_links_without_storage_access(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(versie=2)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        eio3 = EnkelvoudigInformatieObjectFactory.create(inhoud=None, bestandsomvang=0)
+
+        with patch.object(
+            PrivateMediaFileSystemStorage,
+            "open",
+            side_effect=AssertionError("storage accessed"),
+        ):
+            response = self.client.get(reverse(EnkelvoudigInformatieObject))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        inhoud = {eio["url"]: eio["inhoud"] for eio in response.data["results"]}
+        self.assertEqual(
+            inhoud,
+            {
+                f"http://testserver{reverse(eio1)}": (
+                    f"http://testserver{reverse(eio1)}/download?versie=2"
+                ),
+                f"http://testserver{reverse(eio2)}": (
+                    f"http://testserver{reverse(eio2)}/download?versie=1"
+                ),
+                f"http://testserver{reverse(eio3)}": None,
+            },
+        )
+
     def test_eio_detail_filter_by_version(self):
         eio = EnkelvoudigInformatieObjectFactory.create(beschrijving="beschrijving1")
 
@@ -680,6 +710,39 @@ class EnkelvoudigInformatieObjectPaginationAPITests(JWTAuthMixin, APITestCase):
         self.assertIsNone(response_data["previous"])
         self.assertIsNone(response_data["next"])
 
+    @patch("drc.api.pagination.KeysetPagination.page_size", 1)
+    def test_pagination_cursor_param(self):
+        eio1, eio2 = EnkelvoudigInformatieObjectFactory.create_batch(2)
+
+        response = self.client.get(self.list_url, {"cursor": ""})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertNotIn("count", response_data)
+        self.assertIsNone(response_data["previous"])
+        self.assertEqual(len(response_data["results"]), 1)
+        self.assertEqual(
+            response_data["results"][0]["identificatie"], eio1.identificatie
+        )
+
+        # a new version does not change the position of the document
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, uuid=eio1.uuid, versie=2
+        )
+
+        response = self.client.get(response_data["next"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response_data = response.json()
+        self.assertIsNotNone(response_data["previous"])
+        self.assertIsNone(response_data["next"])
+        self.assertEqual(len(response_data["results"]), 1)
+        self.assertEqual(
+            response_data["results"][0]["identificatie"], eio2.identificatie
+        )
+
 
 class EIOZoekTests(JWTAuthMixin, APITestCase):
     heeft_alle_autorisaties = True
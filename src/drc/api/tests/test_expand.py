@@ -0,0 +1,114 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.models import ObjectInformatieObject
+from drc.datamodel.tests.factories import ObjectInformatieObjectFactory
+
+DELAY = 0.3
+
+
+class SlowZakenAPIHandler(BaseHTTPRequestHandler):
+    """
+    Serve zaken with a status after a delay, keeping track of the number of
+    requests handled at the same time.
+    """
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+
+        time.sleep(DELAY)
+
+        url = f"http://{self.headers['Host']}{self.path}"
+        data = {"url": url}
+        if "/zaken/" in self.path:
+            data["status"] = url.replace("/zaken/", "/statussen/")
+        body = json.dumps(data).encode("utf8")
+
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        except ConnectionError:
+            # the client gave up, e.g. because of a timeout
+            pass
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@override_settings(EXPAND_EXTERNAL_MAX_PER_HOST=20)
+class ExpandExternalTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    list_url = reverse(ObjectInformatieObject)
+
+    def setUp(self):
+        super().setUp()
+
+        # a new server (and host) for every test, so the host limits of the
+        # test settings apply
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SlowZakenAPIHandler)
+        self.server.lock = threading.Lock()
+        self.server.active = 0
+        self.server.max_active = 0
+        thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        host, port = self.server.server_address
+        self.zaken = [f"http://{host}:{port}/api/v1/zaken/{i}" for i in range(6)]
+        for zaak in self.zaken:
+            ObjectInformatieObjectFactory.create(is_zaak=True, object=zaak)
+
+    def test_expand_fetches_external_urls_concurrently(self):
+        start = time.monotonic()
+        response = self.client.get(self.list_url, {"expand": "object.status"})
+        duration = time.monotonic() - start
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # 12 urls over 2 levels, fetched in parallel per level
+        self.assertLess(duration, 4 * DELAY)
+
+        expanded = {oio["object"]: oio["_expand"]["object"] for oio in response.json()}
+        self.assertEqual(set(expanded), set(self.zaken))
+        for zaak, data in expanded.items():
+            self.assertEqual(data["url"], zaak)
+            self.assertEqual(
+                data["_expand"]["status"]["url"],
+                zaak.replace("/zaken/", "/statussen/"),
+            )
+
+    @override_settings(EXPAND_EXTERNAL_MAX_PER_HOST=2)
+    def test_expand_limits_concurrency_per_host(self):
+        response = self.client.get(self.list_url, {"expand": "object"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.server.max_active, 2)
+
+    @override_settings(EXPAND_EXTERNAL_TIMEOUT=DELAY / 3)
+    def test_expand_timeout(self):
+        start = time.monotonic()
+        response = self.client.get(self.list_url, {"expand": "object"})
+        duration = time.monotonic() - start
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLess(duration, DELAY)
+        for oio in response.json():
+            self.assertEqual(oio["_expand"]["object"], {})
@@ -1,3 +1,6 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.tests import JWTAuthMixin, get_operation_url, get_validation_errors
@@ -145,3 +148,34 @@ class GebruiksrechtenTests(JWTAuthMixin, APITestCase):
         pprint(response.json())
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_expand_resolves_urls_once(self):
+        eio = EnkelvoudigInformatieObjectCanonicalFactory.create(
+            latest_version__informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail",
+            kwargs={"uuid": eio.latest_version.uuid},
+        )
+        url = reverse("gebruiksrechten-list")
+
+        def count_expand_queries():
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get(url)
+            with CaptureQueriesContext(connection) as expand_queries:
+                response = self.client.get(url, {"expand": "informatieobject"})
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response, len(expand_queries) - len(queries)
+
+        GebruiksrechtenFactory.create(informatieobject=eio)
+        _, num_queries = count_expand_queries()
+
+        GebruiksrechtenFactory.create_batch(2, informatieobject=eio)
+        response, num_queries_shared = count_expand_queries()
+
+        # the shared informatieobject is fetched and serialized only once
+        self.assertEqual(num_queries_shared, num_queries)
+        self.assertEqual(len(response.json()), 3)
+        for gebruiksrechten in response.json():
+            expanded = gebruiksrechten["_expand"]["informatieobject"]
+            self.assertEqual(expanded["url"], f"http://testserver{eio_url}")
@@ -3,9 +3,11 @@ from unittest.mock import patch
 
 from django.test import override_settings
 
+import requests
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import ObjectTypes
+from vng_api_common.mocks import link_fetcher_200
 from vng_api_common.tests import JWTAuthMixin, get_validation_errors, reverse
 from zds_client.tests.mocks import mock_client
 
@@ -125,6 +127,69 @@ class ObjectInformatieObjectTests(JWTAuthMixin, APITestCase):
         )
 
 
+@override_settings(
+    ZDS_CLIENT_CLASS="vng_api_common.mocks.MockClient",
+    REMOTE_VALIDATION_TIMEOUT=5,
+)
+@patch("vng_api_common.validators.fetcher")
+@patch("vng_api_common.validators.obj_has_shape", return_value=True)
+class ObjectInformatieObjectRemoteValidationTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    list_url = reverse(ObjectInformatieObject)
+
+    def create(self, object_url: str, object_type: str):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        eio_url = reverse(
+            "enkelvoudiginformatieobject-detail", kwargs={"uuid": eio.uuid}
+        )
+        return self.client.post(
+            self.list_url,
+            {
+                "object": object_url,
+                "informatieobject": f"http://testserver{eio_url}",
+                "objectType": object_type,
+            },
+        )
+
+    def test_object_fetched_once(self, *mocks):
+        with patch(
+            "vng_api_common.mocks.link_fetcher_200", wraps=link_fetcher_200
+        ) as mock_link_fetcher:
+            with override_settings(
+                LINK_FETCHER="vng_api_common.mocks.link_fetcher_200"
+            ):
+                response = self.create(ZAAK, ObjectTypes.zaak)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.data)
+        mock_link_fetcher.assert_called_once()
+        self.assertEqual(mock_link_fetcher.call_args[1]["timeout"], 5)
+        self.assertEqual(
+            mock_link_fetcher.call_args[1]["headers"]["Accept-Crs"], "EPSG:4326"
+        )
+
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_404")
+    def test_object_not_found(self, *mocks):
+        response = self.create(BESLUIT, ObjectTypes.besluit)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "object")
+        self.assertEqual(error["code"], "bad-url")
+        self.assertFalse(ObjectInformatieObject.objects.exists())
+
+    @override_settings(LINK_FETCHER="vng_api_common.mocks.link_fetcher_200")
+    def test_relation_timeout(self, *mocks):
+        with patch(
+            "vng_api_common.mocks.MockClient.list", side_effect=requests.Timeout
+        ):
+            response = self.create(ZAAK, ObjectTypes.zaak)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "relation-validation-error")
+        self.assertFalse(ObjectInformatieObject.objects.exists())
+
+
 @patch("zds_client.client.get_operation_url")
 @patch("zds_client.tests.mocks.MockClient.fetch_schema", return_value={})
 class ObjectInformatieObjectDestroyTests(JWTAuthMixin, APITestCase):
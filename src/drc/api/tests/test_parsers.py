@@ -0,0 +1,96 @@
+import base64
+import binascii
+import io
+import json
+import os
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from rest_framework.exceptions import ParseError
+
+from ..parsers import Base64FileJSONParser
+
+CONTENT = bytes(range(256)) * 4
+
+
+@override_settings(READ_CHUNK=7)
+class Base64FileJSONParserTests(SimpleTestCase):
+    def parse(self, body: str):
+        stream = io.BytesIO(body.encode("utf8"))
+        return Base64FileJSONParser().parse(stream, parser_context={})
+
+    def test_decode_in_chunks(self):
+        body = json.dumps(
+            {
+                "titel": "inhoud",
+                "inhoud": base64.b64encode(CONTENT).decode("ascii"),
+                "bestandsomvang": len(CONTENT),
+                "ondertekening": {"soort": "", "datum": None},
+            }
+        )
+
+        data = self.parse(body)
+
+        inhoud = data.pop("inhoud")
+        self.assertEqual(
+            data,
+            {
+                "titel": "inhoud",
+                "bestandsomvang": len(CONTENT),
+                "ondertekening": {"soort": "", "datum": None},
+            },
+        )
+        self.assertEqual(inhoud.size, len(CONTENT))
+        self.assertEqual(inhoud.read(), CONTENT)
+
+    def test_escapes_and_data_uri(self):
+        encoded = base64.encodebytes(CONTENT).decode("ascii").replace("/", "\\/")
+        body = (
+            '{"inhoud": "data:application/octet-stream;base64,'
+            + encoded.replace("\n", "\\n").replace("A", "\\u0041")
+            + '", "titel": "a \\"quoted\\" inhoud"}'
+        )
+
+        data = self.parse(body)
+
+        self.assertEqual(data["titel"], 'a "quoted" inhoud')
+        self.assertEqual(data["inhoud"].read(), CONTENT)
+
+    def test_nested_inhoud_is_not_decoded(self):
+        data = self.parse('{"object": {"inhoud": "aGVsbG8="}, "inhoud": null}')
+
+        self.assertEqual(data, {"object": {"inhoud": "aGVsbG8="}, "inhoud": None})
+
+    def test_empty_inhoud(self):
+        data = self.parse('{"inhoud": ""}')
+
+        self.assertEqual(data, {"inhoud": ""})
+
+    def test_same_result_as_b64decode(self):
+        for value in ["aGVsbG8=", "aGVs bG8", "aGVsbG8", "aGVsbG8=d29ybGQ=", "a==="]:
+            with self.subTest(value=value):
+                data = self.parse(json.dumps({"inhoud": value}))
+
+                try:
+                    expected = base64.b64decode(value)
+                except binascii.Error as exc:
+                    self.assertIsInstance(data["inhoud"], binascii.Error)
+                    self.assertEqual(str(data["inhoud"]), str(exc))
+                else:
+                    self.assertEqual(data["inhoud"].read(), expected)
+
+    def test_invalid_json(self):
+        with self.assertRaises(ParseError):
+            self.parse('{"inhoud": "aGVsbG8=", ')
+
+    def test_duplicate_inhoud(self):
+        body = '{"inhoud": "aGVsbG8=", "titel": "", "inhoud": "d29ybGQ="}'
+
+        with tempfile.TemporaryDirectory() as upload_dir:
+            with override_settings(FILE_UPLOAD_TEMP_DIR=upload_dir):
+                with self.assertRaises(ParseError):
+                    self.parse(body)
+
+            # the decoded file is removed
+            self.assertEqual(os.listdir(upload_dir), [])
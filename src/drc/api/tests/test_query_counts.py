@@ -0,0 +1,80 @@
+"""
+Guard against queries per object when a page of results is serialized.
+
+The number of queries to list a page must not grow with the number of objects
+on it, with or without expanding the related informatieobjecten.
+"""
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import JWTAuthMixin, get_operation_url
+
+from drc.datamodel.tests.factories import (
+    BestandsDeelFactory,
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+    ObjectInformatieObjectFactory,
+    VerzendingFactory,
+)
+
+from .utils import reverse
+
+
+class QueryCountTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def create_documents(self, amount: int) -> list:
+        uuids = []
+        for _ in range(amount):
+            canonical = EnkelvoudigInformatieObjectCanonicalFactory.create(
+                lock="abc", latest_version=None
+            )
+            for versie in [1, 2]:
+                eio = EnkelvoudigInformatieObjectFactory.create(
+                    canonical=canonical, versie=versie
+                )
+            uuids.append(eio.uuid)
+            for volgnummer in [1, 2]:
+                BestandsDeelFactory.create(
+                    informatieobject=canonical, volgnummer=volgnummer
+                )
+            GebruiksrechtenFactory.create(informatieobject=canonical)
+            ObjectInformatieObjectFactory.create(informatieobject=canonical)
+            VerzendingFactory.create(informatieobject=canonical)
+        return uuids
+
+    def count_queries(self, method: str, url: str, data=None) -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return len(queries)
+
+    def assertConstantQueries(self, url: str, data=None):
+        self.create_documents(1)
+        num_queries = self.count_queries("get", url, data)
+
+        self.create_documents(3)
+        self.assertEqual(self.count_queries("get", url, data), num_queries)
+
+    def test_list_enkelvoudiginformatieobjecten(self):
+        self.assertConstantQueries(reverse("enkelvoudiginformatieobject-list"))
+
+    def test_zoek_enkelvoudiginformatieobjecten(self):
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+
+        uuids = self.create_documents(1)
+        num_queries = self.count_queries("post", url, {"uuid__in": uuids})
+
+        uuids += self.create_documents(3)
+        self.assertEqual(
+            self.count_queries("post", url, {"uuid__in": uuids}), num_queries
+        )
+
+    def test_list_related_resources(self):
+        for resource in ["gebruiksrechten", "objectinformatieobject", "verzending"]:
+            for data in [{}, {"expand": "informatieobject"}]:
+                with self.subTest(resource=resource, data=data):
+                    self.assertConstantQueries(reverse(f"{resource}-list"), data)
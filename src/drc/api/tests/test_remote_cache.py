@@ -0,0 +1,150 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import SimpleTestCase, override_settings
+
+import requests
+import requests_mock
+from vng_api_common.validators import URLValidator
+
+from ..remote_cache import cached_link_fetcher, remote_cache
+from ..serializers import EnkelvoudigInformatieObjectSerializer
+
+URL = "https://ztc.nl/api/v1/informatieobjecttypen/1"
+
+
+@override_settings(
+    REMOTE_RESOURCE_CACHE="default",
+    REMOTE_RESOURCE_CACHE_TIMEOUT=300,
+    LINK_FETCHER="drc.api.remote_cache.cached_link_fetcher",
+)
+class RemoteResourceCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def test_fetch_is_cached(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL})
+
+            response1 = remote_cache.fetch(URL, requests.get)
+            response2 = remote_cache.fetch(URL, requests.get)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(response1.json(), {"url": URL})
+        self.assertEqual(response2.json(), {"url": URL})
+        self.assertEqual(remote_cache.stats(), {"hits": 1, "misses": 1})
+
+    @override_settings(REMOTE_RESOURCE_CACHE="remote_resources")
+    def test_stats_in_default_cache(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL})
+
+            remote_cache.fetch(URL, requests.get)
+            remote_cache.fetch(URL, requests.get)
+
+        # the resources aren't cached by the dummy cache of the tests
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(remote_cache.stats(), {"hits": 0, "misses": 2})
+
+    def test_no_store(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL}, headers={"Cache-Control": "no-store"})
+
+            remote_cache.fetch(URL, requests.get)
+            remote_cache.fetch(URL, requests.get)
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_errors_are_not_cached(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, status_code=404)
+
+            remote_cache.fetch(URL, requests.get)
+            response = remote_cache.fetch(URL, requests.get)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(response.status_code, 404)
+
+    def test_revalidate_with_etag(self):
+        with requests_mock.Mocker() as m:
+            m.get(
+                URL,
+                [
+                    {
+                        "json": {"url": URL},
+                        "headers": {"Cache-Control": "max-age=0", "ETag": '"abc"'},
+                    },
+                    {"status_code": 304},
+                ],
+            )
+
+            remote_cache.fetch(URL, requests.get)
+            response = remote_cache.fetch(URL, requests.get)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {"url": URL})
+
+    def test_private_resources_are_cached_per_credentials(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL})
+
+            for token in ["a", "a", "b"]:
+                remote_cache.fetch(
+                    URL,
+                    requests.get,
+                    headers={"Authorization": f"Bearer {token}"},
+                    private=True,
+                )
+
+        self.assertEqual(m.call_count, 2)
+
+    def test_url_validator(self):
+        validator = URLValidator()
+
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL})
+
+            validator(URL)
+            response = validator(URL)
+
+        self.assertEqual(m.call_count, 1)
+        self.assertEqual(response.json(), {"url": URL})
+
+    def test_cached_link_fetcher_passes_headers(self):
+        with requests_mock.Mocker() as m:
+            m.get(URL, json={"url": URL})
+
+            cached_link_fetcher(URL, headers={"Accept-Crs": "EPSG:4326"})
+
+        self.assertEqual(m.last_request.headers["Accept-Crs"], "EPSG:4326")
+
+    @patch(
+        "drc.api.serializers.enkelvoudig_informatieobject.get_ztc_auth",
+        return_value={"Authorization": "Bearer token"},
+    )
+    def test_informatieobjecttype_revalidated_with_etag(self, mock_auth):
+        serializer = EnkelvoudigInformatieObjectSerializer()
+
+        with requests_mock.Mocker() as m:
+            m.get(
+                URL,
+                [
+                    {
+                        "json": {"url": URL},
+                        "headers": {"Cache-Control": "max-age=0", "ETag": '"abc"'},
+                    },
+                    {"status_code": 304},
+                ],
+            )
+
+            serializer._get_informatieobjecttype(URL)
+            informatieobjecttype = serializer._get_informatieobjecttype(URL)
+
+        self.assertEqual(m.call_count, 2)
+        self.assertEqual(m.last_request.headers["If-None-Match"], '"abc"')
+        self.assertEqual(m.last_request.headers["Authorization"], "Bearer token")
+        self.assertEqual(informatieobjecttype, {"url": URL})
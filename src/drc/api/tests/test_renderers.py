@@ -0,0 +1,93 @@
+import datetime
+import json
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy as _
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+
+from ..renderers import CustomCamelCaseJSONRenderer, NDJSONRenderer
+
+
+def replace_expand(data):
+    if isinstance(data, dict):
+        return {
+            ("_expand" if key == "Expand" else key): replace_expand(value)
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [replace_expand(item) for item in data]
+    return data
+
+
+def render_parse_render(data) -> bytes:
+    """
+    The way the renderer used to render data.
+    """
+    rendered = CamelCaseJSONRenderer().render(data)
+    return json.dumps(replace_expand(json.loads(rendered))).encode("utf-8")
+
+
+class CustomCamelCaseJSONRendererTests(SimpleTestCase):
+    def test_same_output_as_before(self):
+        data = {
+            "count": 2,
+            "next": None,
+            "results": [
+                {
+                    "url": "http://testserver/api/v1/enkelvoudiginformatieobjecten/1",
+                    "titel": 'één \u2028 \U0001f4c4 "quoted"',
+                    "bestandsomvang": 10**20,
+                    "creatiedatum": datetime.date(2018, 6, 27),
+                    "begin_registratie": datetime.datetime(
+                        2018, 6, 27, 12, 0, tzinfo=datetime.timezone.utc
+                    ),
+                    "uuid": uuid.UUID("95be3c32-9f42-4a8c-bd0e-1b2a4fa04c50"),
+                    "prijs": Decimal("1.50"),
+                    "ratio": 0.1,
+                    "is_locked": False,
+                    "inhoud_is_vervallen": None,
+                    "tuple_value": ("a_b", {"nested_key": [1, 2]}),
+                    "lazy": _("status"),
+                    1: "non-string key",
+                    "_expand": {
+                        "informatieobjecttype": {"omschrijving_generiek": {}},
+                        "_expand": {},
+                    },
+                },
+                {},
+            ],
+        }
+
+        rendered = CustomCamelCaseJSONRenderer().render(data)
+
+        self.assertEqual(rendered, render_parse_render(data))
+        self.assertIn(b'"_expand": {"informatieobjecttype"', rendered)
+        self.assertIn(b'"omschrijvingGeneriek"', rendered)
+
+    def test_empty(self):
+        self.assertEqual(CustomCamelCaseJSONRenderer().render(None), b"")
+        self.assertEqual(
+            CustomCamelCaseJSONRenderer().render([]), render_parse_render([])
+        )
+
+    def test_strict(self):
+        with self.assertRaises(ValueError):
+            CustomCamelCaseJSONRenderer().render({"value": float("nan")})
+
+
+class NDJSONRendererTests(SimpleTestCase):
+    def test_one_object_per_line(self):
+        data = [{"begin_registratie": None, "_expand": {}}, {"titel": "a\nb"}]
+
+        rendered = NDJSONRenderer().render(data)
+
+        self.assertEqual(
+            rendered,
+            b'{"beginRegistratie": null, "_expand": {}}\n{"titel": "a\\nb"}\n',
+        )
+
+    def test_single_object(self):
+        self.assertEqual(NDJSONRenderer().render({"a_b": 1}), b'{"aB": 1}\n')
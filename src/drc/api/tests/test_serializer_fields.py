@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from rest_framework import serializers
+from vng_api_common.serializers import add_choice_values_help_text
+
+from drc.datamodel.constants import Statussen
+
+from ..serializers import EnkelvoudigInformatieObjectSerializer
+
+
+class CachedFieldsTests(SimpleTestCase):
+    def test_fields_built_once(self):
+        EnkelvoudigInformatieObjectSerializer().fields
+
+        with patch.object(
+            serializers.ModelSerializer,
+            "build_field",
+            side_effect=AssertionError("fields built again"),
+        ):
+            fields = EnkelvoudigInformatieObjectSerializer().fields
+
+        self.assertIn("status", fields)
+
+    def test_fields_copied_per_instance(self):
+        serializer1 = EnkelvoudigInformatieObjectSerializer()
+        serializer2 = EnkelvoudigInformatieObjectSerializer()
+
+        field1 = serializer1.fields["status"]
+        field2 = serializer2.fields["status"]
+
+        self.assertIsNot(field1, field2)
+        self.assertIs(field1.parent, serializer1)
+        self.assertIs(field2.parent, serializer2)
+
+    def test_choices_help_text_added_once(self):
+        value_display_mapping = add_choice_values_help_text(Statussen)
+
+        for _ in range(2):
+            help_text = (
+                EnkelvoudigInformatieObjectSerializer().fields["status"].help_text
+            )
+
+        self.assertTrue(help_text.endswith(f"\n\n{value_display_mapping}"))
+        self.assertEqual(help_text.count(value_display_mapping), 1)
@@ -0,0 +1,126 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.tests import (
+    JWTAuthMixin,
+    get_operation_url,
+    get_validation_errors,
+    reverse,
+)
+
+from drc.datamodel.models import (
+    BestandsDeel,
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    Gebruiksrechten,
+    Verzending,
+)
+from drc.datamodel.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+    VerzendingFactory,
+)
+
+
+class SparseFieldsTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def get(self, url: str, data: dict):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, data)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        return response, [query["sql"] for query in queries]
+
+    def test_list_enkelvoudiginformatieobjecten(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response, queries = self.get(
+            reverse(EnkelvoudigInformatieObject),
+            {"fields": "url,titel,inhoud"},
+        )
+
+        self.assertEqual(
+            response.json()["results"],
+            [
+                {
+                    "url": f"http://testserver{reverse(eio)}",
+                    "titel": eio.titel,
+                    "inhoud": f"http://testserver{reverse(eio)}/download?versie=1",
+                }
+            ],
+        )
+        select = queries[-1]
+        self.assertIn('"titel"', select)
+        self.assertNotIn('"beschrijving"', select)
+        # the canonical is not selected and the bestandsdelen are not prefetched
+        self.assertNotIn(
+            f'"{EnkelvoudigInformatieObjectCanonical._meta.db_table}"."lock"', select
+        )
+        self.assertFalse(any(BestandsDeel._meta.db_table in query for query in queries))
+
+    def test_retrieve_enkelvoudiginformatieobject(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        response, queries = self.get(reverse(eio), {"fields": "titel,locked"})
+
+        self.assertEqual(
+            response.json(), {"titel": eio.titel, "locked": bool(eio.canonical.lock)}
+        )
+        self.assertNotIn('"beschrijving"', queries[-1])
+
+    def test_zoek_enkelvoudiginformatieobjecten(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        url = get_operation_url("enkelvoudiginformatieobject__zoek")
+
+        response = self.client.post(url, {"uuid__in": [eio.uuid], "fields": "titel"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["results"], [{"titel": eio.titel}])
+
+    def test_list_related_resources(self):
+        gebruiksrechten = GebruiksrechtenFactory.create()
+        VerzendingFactory.create(informatieobject=gebruiksrechten.informatieobject)
+
+        for model, data in [
+            (Gebruiksrechten, {"fields": "url,omschrijvingVoorwaarden"}),
+            (Verzending, {"fields": "url,binnenlandsCorrespondentieadres"}),
+        ]:
+            with self.subTest(model=model):
+                response, queries = self.get(reverse(model), data)
+
+                results = response.json()
+                if isinstance(results, dict):
+                    results = results["results"]
+                self.assertEqual(set(results[0]), set(data["fields"].split(",")))
+                # the informatieobject is not joined
+                self.assertNotIn(
+                    EnkelvoudigInformatieObject._meta.db_table, queries[-1]
+                )
+
+    def test_expand_requires_field(self):
+        gebruiksrechten = GebruiksrechtenFactory.create()
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=gebruiksrechten.informatieobject
+        )
+
+        response, _ = self.get(
+            reverse(Gebruiksrechten),
+            {"fields": "url,informatieobject", "expand": "informatieobject"},
+        )
+
+        data = response.json()[0]
+        self.assertEqual(set(data), {"url", "informatieobject", "_expand"})
+        self.assertEqual(
+            data["_expand"]["informatieobject"]["url"], data["informatieobject"]
+        )
+
+    def test_unknown_fields(self):
+        response = self.client.get(
+            reverse(EnkelvoudigInformatieObject), {"fields": "titel,foo"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "fields")
+        self.assertEqual(error["code"], "unknown-fields")
@@ -0,0 +1,114 @@
+import json
+from unittest.mock import patch
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, reverse
+
+from drc.datamodel.models import EnkelvoudigInformatieObject, ObjectInformatieObject
+from drc.datamodel.tests.factories import (
+    EnkelvoudigInformatieObjectFactory,
+    ObjectInformatieObjectFactory,
+)
+
+from ..mixins import StreamingListMixin
+from ..scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+
+IOTYPE = "https://informatieobjecttype.nl/ok"
+
+
+class StreamingListTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def stream(self, url: str, data=None) -> list:
+        response = self.client.get(url, data, HTTP_ACCEPT="application/x-ndjson")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertTrue(response.streaming)
+        content = b"".join(response.streaming_content)
+        return [json.loads(line) for line in content.splitlines()]
+
+    @patch.object(StreamingListMixin, "stream_chunk_size", 2)
+    def test_stream_enkelvoudiginformatieobjecten(self):
+        eios = EnkelvoudigInformatieObjectFactory.create_batch(5)
+
+        results = self.stream(reverse(EnkelvoudigInformatieObject))
+
+        self.assertEqual(
+            [result["url"] for result in results],
+            [f"http://testserver{reverse(eio)}" for eio in eios],
+        )
+        self.assertIn("bestandsdelen", results[0])
+
+    def test_filters_apply(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(identificatie="match")
+        EnkelvoudigInformatieObjectFactory.create(identificatie="other")
+
+        results = self.stream(
+            reverse(EnkelvoudigInformatieObject),
+            {"identificatie": "match", "fields": "url,identificatie"},
+        )
+
+        self.assertEqual(
+            results,
+            [{"url": f"http://testserver{reverse(eio)}", "identificatie": "match"}],
+        )
+
+    @patch.object(StreamingListMixin, "stream_chunk_size", 2)
+    def test_expand(self):
+        oios = ObjectInformatieObjectFactory.create_batch(3)
+        for oio in oios:
+            EnkelvoudigInformatieObjectFactory.create(canonical=oio.informatieobject)
+
+        results = self.stream(
+            reverse(ObjectInformatieObject), {"expand": "informatieobject"}
+        )
+
+        self.assertEqual(len(results), 3)
+        for result in results:
+            self.assertEqual(
+                result["_expand"]["informatieobject"]["url"],
+                result["informatieobject"],
+            )
+
+    def test_json_without_accept_header(self):
+        EnkelvoudigInformatieObjectFactory.create()
+
+        response = self.client.get(reverse(EnkelvoudigInformatieObject))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.json()["count"], 1)
+
+
+class StreamingListAuthorizationsTests(JWTAuthMixin, APITestCase):
+    scopes = [SCOPE_DOCUMENTEN_ALLES_LEZEN]
+    informatieobjecttype = IOTYPE
+    max_vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.openbaar
+
+    def test_authorizations_apply(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=IOTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=IOTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.geheim,
+        )
+        EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype="https://informatieobjecttype.nl/not_ok",
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+
+        response = self.client.get(
+            reverse(EnkelvoudigInformatieObject), HTTP_ACCEPT="application/x-ndjson"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(
+            [json.loads(line)["url"] for line in lines],
+            [f"http://testserver{reverse(eio)}"],
+        )
@@ -0,0 +1,158 @@
+import errno
+import uuid
+from hashlib import md5
+from unittest.mock import patch
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase
+from django.urls import reverse as django_reverse
+
+from privates.storages import private_media_storage
+from privates.test import temp_private_root
+from rest_framework.request import Request
+from rest_framework.reverse import reverse
+from rest_framework.test import APIRequestFactory
+from rest_framework.versioning import URLPathVersioning
+
+from .. import utils
+from ..utils import get_absolute_url, merge_files, parse_content_range, reverse_uuid
+
+
+@temp_private_root()
+class MergeFilesTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self.parts = [
+            private_media_storage.open(
+                private_media_storage.save(f"part-uploads/part{i}", ContentFile(data))
+            )
+            for i, data in enumerate([b"first ", b"second ", b"third"])
+        ]
+
+    def test_merge_files(self):
+        name, size, checksum = merge_files(
+            self.parts, private_media_storage, "uploads/document.txt"
+        )
+
+        self.assertEqual(name, "uploads/document.txt")
+        self.assertEqual(size, 18)
+        self.assertEqual(checksum, "")
+        with private_media_storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"first second third")
+
+    def test_merge_files_with_checksum(self):
+        name, size, checksum = merge_files(
+            self.parts, private_media_storage, "uploads/merged.txt", hash_name="md5"
+        )
+
+        self.assertEqual(size, 18)
+        self.assertEqual(checksum, md5(b"first second third").hexdigest())
+        with private_media_storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"first second third")
+
+    def test_merge_files_does_not_overwrite(self):
+        existing_name = private_media_storage.save(
+            "uploads/existing.txt", ContentFile(b"existing")
+        )
+
+        name, size, checksum = merge_files(
+            self.parts, private_media_storage, existing_name
+        )
+
+        self.assertNotEqual(name, existing_name)
+        with private_media_storage.open(existing_name) as existing:
+            self.assertEqual(existing.read(), b"existing")
+
+    @patch("os.sendfile", side_effect=OSError(errno.EINVAL, "not supported"))
+    @patch("os.copy_file_range", side_effect=OSError(errno.EXDEV, "not supported"))
+    def test_merge_files_without_zero_copy(self, *mocks):
+        name, size, checksum = merge_files(
+            self.parts, private_media_storage, "uploads/merged.txt"
+        )
+
+        self.assertEqual(size, 18)
+        with private_media_storage.open(name) as merged:
+            self.assertEqual(merged.read(), b"first second third")
+
+    def test_merge_files_removes_incomplete_file(self):
+        with patch("drc.api.utils._copy_file", side_effect=OSError(errno.EIO, "")):
+            with self.assertRaises(OSError):
+                merge_files(self.parts, private_media_storage, "uploads/failed.txt")
+
+        self.assertFalse(private_media_storage.exists("uploads/failed.txt"))
+
+
+class ParseContentRangeTests(SimpleTestCase):
+    def test_parse_content_range(self):
+        self.assertEqual(parse_content_range("bytes 0-9/10"), (0, 9, 10))
+        self.assertEqual(parse_content_range("bytes 5-5/10"), (5, 5, 10))
+
+    def test_invalid_content_range(self):
+        for value in ["bytes 0-10/10", "bytes 5-4/10", "bytes */10", "items 0-1/2"]:
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_content_range(value)
+
+
+class ReverseUUIDTests(SimpleTestCase):
+    view_names = [
+        "enkelvoudiginformatieobject-detail",
+        "enkelvoudiginformatieobject-download",
+        "gebruiksrechten-detail",
+        "objectinformatieobject-detail",
+        "bestandsdeel-detail",
+        "verzending-detail",
+    ]
+
+    def get_request(self, path="/api/v1/enkelvoudiginformatieobjecten"):
+        request = Request(APIRequestFactory().get(path))
+        request.version = "1"
+        request.versioning_scheme = URLPathVersioning()
+        return request
+
+    def test_same_url_as_reverse(self):
+        request = self.get_request()
+        value = uuid.uuid4()
+
+        for view_name in self.view_names:
+            with self.subTest(view_name=view_name):
+                self.assertEqual(
+                    reverse_uuid(view_name, "uuid", value, request),
+                    reverse(view_name, kwargs={"uuid": value}, request=request),
+                )
+
+    def test_url_reversed_once(self):
+        utils._get_url_template.cache_clear()
+        request = self.get_request()
+
+        with patch.object(
+            utils, "django_reverse", wraps=django_reverse
+        ) as mock_reverse:
+            urls = [
+                reverse_uuid("gebruiksrechten-detail", "uuid", value, request)
+                for value in [uuid.uuid4(), uuid.uuid4()]
+            ]
+
+        self.assertEqual(mock_reverse.call_count, 1)
+        self.assertNotEqual(urls[0], urls[1])
+
+    def test_format_query_parameter_preserved(self):
+        request = self.get_request("/api/v1/gebruiksrechten?format=json")
+        value = uuid.uuid4()
+
+        url = reverse_uuid("gebruiksrechten-detail", "uuid", value, request)
+
+        self.assertEqual(
+            url, f"http://testserver/api/v1/gebruiksrechten/{value}?format=json"
+        )
+
+    def test_get_absolute_url(self):
+        value = uuid.uuid4()
+
+        url = get_absolute_url("enkelvoudiginformatieobject-detail", uuid=str(value))
+
+        self.assertEqual(
+            url,
+            f"{settings.DRC_BASE_URL}/api/v1/enkelvoudiginformatieobjecten/{value}",
+        )
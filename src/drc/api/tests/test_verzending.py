@@ -30,6 +30,18 @@ class VerzendingAPITests(JWTAuthMixin, APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(data["count"], 3)
 
+    def test_list_cursor(self):
+        VerzendingFactory.create_batch(size=3, has_address=True)
+
+        response = self.client.get(reverse("verzending-list"), {"cursor": ""})
+
+        data = response.json()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn("count", data)
+        self.assertIsNone(data["next"])
+        self.assertEqual(len(data["results"]), 3)
+
     def test_detail(self):
         verzending = VerzendingFactory(has_address=True)
 
@@ -1,30 +1,270 @@
+import errno
+import hashlib
 import os
-import shutil
+import re
+import uuid as _uuid
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, Union
 
 from django.conf import settings
 from django.contrib.sites.models import Site
+from django.urls import get_script_prefix, get_urlconf, reverse as django_reverse
 
+from rest_framework.request import Request
 from rest_framework.reverse import reverse
+from rest_framework.settings import api_settings
 
+from drc.datamodel.constants import ChecksumAlgoritmes
 
-def get_absolute_url(url_name: str, uuid: str) -> str:
-    path = reverse(
-        url_name,
-        kwargs={"version": settings.REST_FRAMEWORK["DEFAULT_VERSION"], "uuid": uuid},
+# checksum algorithms which can be computed with ``hashlib``
+HASH_ALGORITHMS = {
+    ChecksumAlgoritmes.md5: "md5",
+    ChecksumAlgoritmes.sha_1: "sha1",
+    ChecksumAlgoritmes.sha_256: "sha256",
+    ChecksumAlgoritmes.sha_512: "sha512",
+}
+
+# errors of ``copy_file_range`` and ``sendfile`` when they can't be used for a
+# pair of files, e.g. because they are on different file systems
+ZERO_COPY_UNSUPPORTED = (
+    errno.EXDEV,
+    errno.ENOSYS,
+    errno.EINVAL,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+)
+
+CONTENT_RANGE_RE = re.compile(r"^bytes (?P<start>\d+)-(?P<end>\d+)/(?P<total>\d+)$")
+
+# reversed in place of the lookup value to build the template of an url
+URL_TEMPLATE_PLACEHOLDER = str(_uuid.UUID(int=0))
+
+
+@lru_cache(maxsize=None)
+def _get_url_template(
+    view_name: str,
+    lookup_url_kwarg: str,
+    version: str,
+    script_prefix: str,
+    urlconf: Optional[str],
+) -> Tuple[str, str]:
+    path = django_reverse(
+        view_name,
+        kwargs={"version": version, lookup_url_kwarg: URL_TEMPLATE_PLACEHOLDER},
+        urlconf=urlconf,
     )
+    prefix, suffix = path.split(URL_TEMPLATE_PLACEHOLDER)
+    return prefix, suffix
+
+
+def get_url_template(view_name: str, lookup_url_kwarg: str, request=None):
+    """
+    Get the ``(prefix, suffix)`` around the lookup value of the url of a view.
+
+    The template is reversed once per view, and made absolute once per request.
+    Returns ``None`` if the url can't be formatted from a template.
+    """
+    if request is None:
+        return _get_url_template(
+            view_name,
+            lookup_url_kwarg,
+            settings.REST_FRAMEWORK["DEFAULT_VERSION"],
+            get_script_prefix(),
+            get_urlconf(),
+        )
+
+    templates = getattr(request, "_url_templates", None)
+    if templates is None:
+        templates = request._url_templates = {}
+
+    key = (view_name, lookup_url_kwarg)
+    if key not in templates:
+        # DRF preserves the format query parameter in urls
+        if api_settings.URL_FORMAT_OVERRIDE in request.GET:
+            templates[key] = None
+        else:
+            version = (
+                getattr(request, "version", None)
+                or settings.REST_FRAMEWORK["DEFAULT_VERSION"]
+            )
+            prefix, suffix = _get_url_template(
+                view_name, lookup_url_kwarg, version, get_script_prefix(), get_urlconf()
+            )
+            templates[key] = (request.build_absolute_uri(prefix), suffix)
+    return templates[key]
+
+
+def reverse_uuid(
+    view_name: str,
+    lookup_url_kwarg: str,
+    lookup_value: Union[_uuid.UUID, str],
+    request: Optional[Request] = None,
+) -> str:
+    """
+    Reverse the url of a resource with a UUID lookup, like DRF's ``reverse``.
+
+    The url is formatted from a template, which is much cheaper than resolving
+    the url for every object in a list.
+    """
+    template = get_url_template(view_name, lookup_url_kwarg, request)
+    if template is None:
+        return reverse(
+            view_name, kwargs={lookup_url_kwarg: lookup_value}, request=request
+        )
+    prefix, suffix = template
+    return f"{prefix}{lookup_value}{suffix}"
+
+
+def get_absolute_url(url_name: str, uuid: str) -> str:
+    path = reverse_uuid(url_name, "uuid", uuid)
     domain = settings.DRC_BASE_URL
     return f"{domain}{path}"
 
 
-def merge_files(part_files, file_dir, file_name) -> str:
-    os.makedirs(file_dir, exist_ok=True)
+def _write(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
 
-    file_path = os.path.join(file_dir, file_name)
-    with open(file_path, "wb") as output:
+def _copy_file(source, out_fd: int, hash_obj=None) -> int:
+    """
+    Append the contents of ``source`` to ``out_fd``.
+
+    Without a hash to compute, the data is copied within the kernel with
+    ``copy_file_range`` or ``sendfile``, falling back to a regular copy when the
+    (file)system doesn't support them.
+    """
+    in_fd = source.fileno()
+    size = os.fstat(in_fd).st_size
+    copied = 0
+
+    if hash_obj is None:
+        for zero_copy in ("copy_file_range", "sendfile"):
+            if not hasattr(os, zero_copy):
+                continue
+            try:
+                while copied < size:
+                    if zero_copy == "copy_file_range":
+                        count = os.copy_file_range(in_fd, out_fd, size - copied, copied)
+                    else:
+                        count = os.sendfile(out_fd, in_fd, copied, size - copied)
+                    if not count:
+                        break
+                    copied += count
+                return copied
+            except OSError as exc:
+                if exc.errno not in ZERO_COPY_UNSUPPORTED:
+                    raise
+
+    source.seek(copied)
+    while True:
+        chunk = source.read(settings.READ_CHUNK)
+        if not chunk:
+            break
+        if hash_obj is not None:
+            hash_obj.update(chunk)
+        _write(out_fd, chunk)
+        copied += len(chunk)
+    return copied
+
+
+def merge_files(
+    part_files,
+    storage,
+    name: str,
+    hash_name: str = "",
+    progress: Optional[Callable[[int], None]] = None,
+) -> Tuple[str, int, str]:
+    """
+    Concatenate the part files into a new file of the storage.
+
+    The parts are written straight into their final location, so the result
+    can be assigned to a ``FileField`` without copying it again.
+
+    :param hash_name: name of a :mod:`hashlib` algorithm to compute the
+      checksum of the merged file with, in the same pass.
+    :param progress: called with the number of bytes written so far, after
+      every part.
+    :return: the name of the file in the storage, its size and its checksum
+    """
+    hash_obj = hashlib.new(hash_name) if hash_name else None
+
+    while True:
+        name = storage.get_available_name(name)
+        file_path = storage.path(name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        try:
+            out_fd = os.open(
+                file_path,
+                os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0),
+                0o666,
+            )
+        except FileExistsError:
+            # created in the meantime, try again with another name
+            continue
+        break
+
+    size = 0
+    try:
         for file in part_files:
             with file.open("rb") as fileobj:
-                shutil.copyfileobj(fileobj, output, settings.READ_CHUNK)
-    return file_path
+                size += _copy_file(fileobj, out_fd, hash_obj)
+            if progress is not None:
+                progress(size)
+    except Exception:
+        os.close(out_fd)
+        os.remove(file_path)
+        raise
+    os.close(out_fd)
+
+    if storage.file_permissions_mode is not None:
+        os.chmod(file_path, storage.file_permissions_mode)
+
+    checksum = hash_obj.hexdigest() if hash_obj else ""
+    return name, size, checksum
+
+
+def parse_content_range(value: str) -> Tuple[int, int, int]:
+    """
+    Parse a ``Content-Range: bytes <start>-<end>/<total>`` header.
+
+    :return: the first and last (inclusive) byte positions and the total size
+    :raises ValueError: if the header is malformed or the range is not
+      satisfiable
+    """
+    match = CONTENT_RANGE_RE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid Content-Range header: {value!r}")
+
+    start, end, total = (int(match.group(key)) for key in ("start", "end", "total"))
+    if start > end or end >= total:
+        raise ValueError(f"Invalid Content-Range header: {value!r}")
+    return start, end, total
+
+
+def write_chunk(path: str, offset: int, chunk, skip: int = 0) -> int:
+    """
+    Write the uploaded ``chunk`` into the file at ``path``, starting at
+    ``offset``, and drop anything after it.
+
+    :param skip: number of bytes at the start of the chunk which are in the
+      file already, and are kept as they are.
+    :return: the size of the file
+    """
+    fd = os.open(path, os.O_WRONLY | getattr(os, "O_BINARY", 0))
+    try:
+        size = offset + skip
+        os.lseek(fd, size, os.SEEK_SET)
+        for data in chunk.chunks():
+            if skip:
+                data, skip = data[skip:], max(skip - len(data), 0)
+            _write(fd, data)
+            size += len(data)
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+    return size
 
 
 def create_filename(name):
@@ -1,20 +1,22 @@
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.utils.module_loading import import_string
 from django.utils.translation import ugettext_lazy as _
 
+import requests
 from rest_framework import exceptions, serializers
 from rest_framework.exceptions import ValidationError as ValdationErrorRest
-from vng_api_common.models import APICredential
-from vng_api_common.validators import ResourceValidator
+from vng_api_common.validators import ResourceValidator, URLValidator
 from zds_client import ClientError
 
 from drc.datamodel.models import ObjectInformatieObject
 from drc.datamodel.validators import validate_status
 
 from .auth import get_zrc_auth
+from .credentials import get_auth
 from .utils import get_absolute_url
 
 
@@ -208,15 +210,44 @@ class StatusValidator:
             raise serializers.ValidationError(exc.error_dict)
 
 
+class PrefetchedURLValidator(URLValidator):
+    """
+    Validate the response of a URL that was fetched already.
+    """
+
+    def __init__(self, *args, response=None, **kwargs):
+        self.response = response
+        super().__init__(*args, **kwargs)
+
+    def __call__(self, value: str):
+        if self.response.status_code != 200:
+            raise serializers.ValidationError(
+                self.message.format(status_code=self.response.status_code, url=value),
+                code=self.code,
+            )
+        return self.response
+
+
+class PrefetchedResourceValidator(ResourceValidator, PrefetchedURLValidator):
+    """
+    Validate the shape of a resource that was fetched already.
+    """
+
+
 class ObjectInformatieObjectValidator:
     """
-    Validate that the INFORMATIEOBJECT is already linked to the OBJECT in the remote component.
+    Validate that the OBJECT exists and that the INFORMATIEOBJECT is already
+    linked to it in the remote component.
+
+    The OBJECT and the relation are fetched concurrently, each bounded by the
+    ``REMOTE_VALIDATION_TIMEOUT`` setting.
     """
 
     message = _(
         "Het informatieobject is in het {component} nog niet gerelateerd aan het object."
     )
     code = "inconsistent-relation"
+    unreachable_message = _("Het {component} kon niet bereikt worden.")
 
     def __call__(self, context: OrderedDict):
         object_url = context["object"]
@@ -227,44 +258,60 @@ class ObjectInformatieObjectValidator:
             "enkelvoudiginformatieobject-detail", uuid=informatieobject_uuid
         )
 
+        if object_type == "zaak":
+            resource = "zaakinformatieobject"
+            component = "ZRC"
+            oas_schema = settings.ZRC_API_SPEC
+        elif object_type == "besluit":
+            resource = "besluitinformatieobject"
+            component = "BRC"
+            oas_schema = settings.BRC_API_SPEC
+
+        timeout = settings.REMOTE_VALIDATION_TIMEOUT
+        # the credentials may be loaded from the database, outside of the threads
+        fetch_object = URLValidator(
+            headers={**get_zrc_auth(object_url), "Accept-Crs": "EPSG:4326"},
+            timeout=timeout,
+        )
         # dynamic so that it can be mocked in tests easily
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
-        try:
-            if object_type == "zaak":
-                resource = "zaakinformatieobject"
-                component = "ZRC"
-                oas_schema = settings.ZRC_API_SPEC
-            elif object_type == "besluit":
-                resource = "besluitinformatieobject"
-                component = "BRC"
-                oas_schema = settings.BRC_API_SPEC
+        client.auth = get_auth(object_url)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            object_future = executor.submit(fetch_object, object_url)
+            oios_future = executor.submit(
+                client.list,
+                resource,
+                query_params={
+                    object_type: object_url,
+                    "informatieobject": informatieobject_url,
+                },
+                request_kwargs={"timeout": timeout},
+            )
 
             try:
-                ResourceValidator(
+                PrefetchedResourceValidator(
                     object_type.capitalize(),
                     oas_schema,
-                    get_auth=get_zrc_auth,
-                    headers={"Accept-Crs": "EPSG:4326"},
+                    response=object_future.result(),
                 )(object_url)
             except exceptions.ValidationError as exc:
                 raise serializers.ValidationError(
                     {"object": exc.detail}, code=ResourceValidator.code
                 )
 
-            oios = client.list(
-                resource,
-                query_params={
-                    object_type: object_url,
-                    "informatieobject": informatieobject_url,
-                },
-            )
-
-        except ClientError as exc:
-            raise serializers.ValidationError(
-                exc.args[0], code="relation-validation-error"
-            ) from exc
+            try:
+                oios = oios_future.result()
+            except ClientError as exc:
+                raise serializers.ValidationError(
+                    exc.args[0], code="relation-validation-error"
+                ) from exc
+            except requests.RequestException as exc:
+                raise serializers.ValidationError(
+                    self.unreachable_message.format(component=component),
+                    code="relation-validation-error",
+                ) from exc
 
         if len(oios) == 0:
             raise serializers.ValidationError(
@@ -288,7 +335,7 @@ class RemoteRelationValidator:
 
         Client = import_string(settings.ZDS_CLIENT_CLASS)
         client = Client.from_url(object_url)
-        client.auth = APICredential.get_auth(object_url)
+        client.auth = get_auth(object_url)
 
         resource = f"{object_informatie_object.object_type}informatieobject"
 
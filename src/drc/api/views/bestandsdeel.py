@@ -1,21 +1,52 @@
+from django.db import transaction
 from django.utils.translation import gettext as _
 
-from drf_spectacular.utils import extend_schema, extend_schema_view, inline_serializer
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+    inline_serializer,
+)
 from rest_framework import serializers, viewsets
 from rest_framework.parsers import FormParser, MultiPartParser
 
-from drc.api.mixins import UpdateWithoutPartialMixin
+from drc.api.mixins import RawUploadMixin, UpdateWithoutPartialMixin
+from drc.api.parsers import OctetStreamParser
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.schema import BestandsDeelSchema
 from drc.api.scopes import SCOPE_DOCUMENTEN_BIJWERKEN
 from drc.api.serializers import BestandsDeelSerializer
 from drc.api.serializers.bestandsdeel import SchemaBestandsDeelSerializer
+from drc.api.views.constants import DIGEST_HEADER_PARAM, LOCK_HEADER_PARAM
 from drc.datamodel.models.bestandsdeel import BestandsDeel
 
 
 @extend_schema_view(
     update=extend_schema(
         summary=_("Upload een bestandsdeel."),
+        parameters=[
+            OpenApiParameter(
+                name="Content-Range",
+                type=str,
+                location=OpenApiParameter.HEADER,
+                required=False,
+                description=_(
+                    "Upload een deel van het bestandsdeel, bijvoorbeeld "
+                    "`bytes 0-1048575/4294967296`, waarbij het totaal de omvang "
+                    "van het bestandsdeel is. De upload moet aansluiten op het "
+                    "aantal `ontvangen` bytes, zodat een onderbroken upload kan "
+                    "worden hervat."
+                ),
+            ),
+            LOCK_HEADER_PARAM,
+            DIGEST_HEADER_PARAM,
+        ],
+        request={
+            "multipart/form-data": BestandsDeelSerializer,
+            "application/x-www-form-urlencoded": BestandsDeelSerializer,
+            "application/octet-stream": OpenApiTypes.BINARY,
+        },
         responses={
             200: inline_serializer(
                 name="BestandsDeelResponse",
@@ -31,6 +62,10 @@ from drc.datamodel.models.bestandsdeel import BestandsDeel
                     "omvang": serializers.IntegerField(
                         help_text=BestandsDeel.omvang.field.help_text, required=False
                     ),
+                    "ontvangen": serializers.IntegerField(
+                        help_text=BestandsDeel.ontvangen.field.help_text,
+                        required=False,
+                    ),
                     "inhoud": serializers.URLField(
                         help_text="De URL naar de bestandsinhoud van dit specifieke bestandsdeel.",
                         required=False,
@@ -50,12 +85,26 @@ from drc.datamodel.models.bestandsdeel import BestandsDeel
         },
     ),
 )
-class BestandsDeelViewSet(UpdateWithoutPartialMixin, viewsets.GenericViewSet):
+class BestandsDeelViewSet(
+    UpdateWithoutPartialMixin, RawUploadMixin, viewsets.GenericViewSet
+):
     queryset = BestandsDeel.objects.all()
     serializer_class = BestandsDeelSerializer
     lookup_field = "uuid"
-    parser_classes = (MultiPartParser, FormParser)
+    parser_classes = (MultiPartParser, FormParser, OctetStreamParser)
     permission_classes = (InformationObjectRelatedAuthScopesRequired,)
     required_scopes = {"update": SCOPE_DOCUMENTEN_BIJWERKEN}
 
     swagger_schema = BestandsDeelSchema
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # only lock the part itself, so the parts of a document can be uploaded
+        # in parallel, while the offset of a part is consistent
+        if self.action == "update":
+            queryset = queryset.select_for_update(of=("self",))
+        return queryset
+
+    @transaction.atomic
+    def update(self, request, *args, **kwargs):
+        return super().update(request, *args, **kwargs)
@@ -15,3 +15,20 @@ REGISTRATIE_QUERY_PARAM = OpenApiParameter(
     "kortst hiervoor zit wordt opgehaald.",
     type=OpenApiTypes.STR,
 )
+
+# Openapi header parameters for raw (application/octet-stream) uploads
+LOCK_HEADER_PARAM = OpenApiParameter(
+    name="Lock",
+    location=OpenApiParameter.HEADER,
+    description="Het lock ID van het INFORMATIEOBJECT, bij een upload met "
+    "`Content-Type: application/octet-stream`.",
+    type=OpenApiTypes.STR,
+)
+DIGEST_HEADER_PARAM = OpenApiParameter(
+    name="Digest",
+    location=OpenApiParameter.HEADER,
+    description="Een checksum van de verzoekinhoud volgens RFC 3230, bijvoorbeeld "
+    "`sha-256=<base64>`, bij een upload met `Content-Type: application/octet-stream`. "
+    "Ondersteunde algoritmes: `md5`, `sha`, `sha-256` en `sha-512`.",
+    type=OpenApiTypes.STR,
+)
@@ -1,4 +1,8 @@
+from urllib.parse import urlsplit
+
 from django.db import models, transaction
+from django.db.models.functions import Right
+from django.http import Http404
 from django.utils.translation import gettext as _
 
 from drf_spectacular.types import OpenApiTypes
@@ -11,8 +15,8 @@ from drf_spectacular.utils import (
 from notifications_api_common.viewsets import NotificationViewSetMixin
 from rest_framework import serializers, status, viewsets
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.settings import api_settings
 from sendfile import sendfile
 from vng_api_common.audittrails.viewsets import (
@@ -24,17 +28,27 @@ from vng_api_common.search import SearchMixin
 from vng_api_common.serializers import FoutSerializer
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from drc.api.audits import AUDIT_DRC
+from drc.api.audits import AUDIT_DRC, AuditTrailBufferMixin, reconstruct_wijzigingen
 from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.exclusions import EXPAND_QUERY_PARAM, ExpandFieldValidator, ExpansionMixin
 from drc.api.filters import (
+    AuditTrailFilter,
     EnkelvoudigInformatieObjectDetailFilter,
     EnkelvoudigInformatieObjectListFilter,
 )
 from drc.api.kanalen import KANAAL_DOCUMENTEN
+from drc.api.mixins import (
+    FIELDS_QUERY_PARAM,
+    RawUploadMixin,
+    SparseFieldsMixin,
+    StreamingListMixin,
+)
+from drc.api.notifications import NotificatieOutboxMixin
+from drc.api.pagination import OptionalCursorPagination, PageNumberOrCursorPagination
+from drc.api.parsers import Base64FileJSONParser, OctetStreamParser
 from drc.api.permissions import InformationObjectAuthScopesRequired
 from drc.api.renderers import BinaryFileRenderer
-from drc.api.schema import EIOAutoSchema
+from drc.api.schema import EIOAutoSchema, OptionalPaginationAutoSchema
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
     SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -55,7 +69,12 @@ from drc.api.serializers.enkelvoudig_informatieobject import (
     EIOZoekSerializer,
     SchemaEIOSerializer,
 )
-from drc.api.views.constants import REGISTRATIE_QUERY_PARAM, VERSIE_QUERY_PARAM
+from drc.api.views.constants import (
+    DIGEST_HEADER_PARAM,
+    LOCK_HEADER_PARAM,
+    REGISTRATIE_QUERY_PARAM,
+    VERSIE_QUERY_PARAM,
+)
 from drc.datamodel.models import EnkelvoudigInformatieObject
 
 PATH_PARAMETER_NAME = "enkelvoudiginformatieobject_uuid"
@@ -72,6 +91,9 @@ PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
             "(`inhoud`) naar de binary data. Alleen de laatste versie van elk"
             "(ENKELVOUDIG) INFORMATIEOBJECT wordt getoond. Specifieke versies kunnen "
             "alleen"
+            "\n\nMet de header `Accept: application/x-ndjson` worden alle resultaten "
+            "zonder paginering gestreamd als newline delimited JSON, één object per "
+            "regel."
         ),
     ),
     retrieve=extend_schema(
@@ -101,8 +123,17 @@ PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
     partial_update=extend_schema(
         summary=_("Werk een (ENKELVOUDIG) INFORMATIEOBJECT deels bij."),
         description=_(
-            "Dit creëert altijd een nieuwe versie van het (ENKELVOUDIG) INFORMATIEOBJECT."
+            "Dit creëert altijd een nieuwe versie van het (ENKELVOUDIG) INFORMATIEOBJECT.\n\n"
+            "De `inhoud` kan ook zonder base64-encoding worden geupload, als "
+            "verzoekinhoud met `Content-Type: application/octet-stream`. Het lock ID "
+            "wordt dan in de `Lock` header meegestuurd en de `bestandsomvang` is de "
+            "`Content-Length` van het verzoek."
         ),
+        parameters=[LOCK_HEADER_PARAM, DIGEST_HEADER_PARAM],
+        request={
+            "application/json": EnkelvoudigInformatieObjectWithLockSerializer,
+            "application/octet-stream": OpenApiTypes.BINARY,
+        },
     ),
     destroy=extend_schema(
         summary=_("Verwijder een (ENKELVOUDIG) INFORMATIEOBJECT."),
@@ -139,25 +170,32 @@ PATH_PARAMETER_DESCRIPTION = "Unieke resource identifier (UUID4)"
     ),
 )
 class EnkelvoudigInformatieObjectViewSet(
+    NotificatieOutboxMixin,
     NotificationViewSetMixin,
     CheckQueryParamsMixin,
     SearchMixin,
     ListFilterByAuthorizationsMixin,
+    AuditTrailBufferMixin,
     AuditTrailViewsetMixin,
     ExpandFieldValidator,
+    StreamingListMixin,
     ExpansionMixin,
+    SparseFieldsMixin,
+    RawUploadMixin,
     viewsets.ModelViewSet,
 ):
     global_description = _(
         "Opvragen en bewerken van (ENKELVOUDIG) INFORMATIEOBJECTen (documenten)."
     )
-    queryset = EnkelvoudigInformatieObject.objects.order_by(
-        "canonical", "-versie"
-    ).distinct("canonical")
+    queryset = EnkelvoudigInformatieObject.objects.all()
+    serializer_select_related = ("canonical", "finalisatie")
+    serializer_prefetch_related = ("canonical__bestandsdelen",)
     lookup_field = "uuid"
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
+    cursor_ordering = "canonical_id"
     search_input_serializer_class = EIOZoekSerializer
     serializer_class = EnkelvoudigInformatieObjectSerializer
+    parser_classes = (Base64FileJSONParser,)
     permission_classes = (InformationObjectAuthScopesRequired,)
     required_scopes = {
         "list": SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -177,6 +215,15 @@ class EnkelvoudigInformatieObjectViewSet(
 
     swagger_schema = EIOAutoSchema
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # list operations only ever show the latest version of each document
+        if self.action in ["list", "_zoek"]:
+            return queryset.latest_versions().order_by("canonical")
+        # detail operations can request a specific version with the
+        # ``versie`` and ``registratieOp`` query parameters
+        return queryset.order_by("canonical", "-versie").distinct("canonical")
+
     def get_serializer_context(self):
         context = super().get_serializer_context()
         if self.action in ["update", "partial_update"]:
@@ -192,6 +239,15 @@ class EnkelvoudigInformatieObjectViewSet(
 
         return context
 
+    def get_parsers(self):
+        parsers = super().get_parsers()
+        # the ``inhoud`` can be uploaded as raw data with a partial update. The
+        # action is not known yet when the request is initialized
+        request = getattr(self, "request", None)
+        if request is not None and request.method == "PATCH":
+            parsers.append(OctetStreamParser())
+        return parsers
+
     def get_renderers(self):
         if self.action == "download":
             return [BinaryFileRenderer]
@@ -208,7 +264,7 @@ class EnkelvoudigInformatieObjectViewSet(
         search_input = self.get_search_input()
         queryset = self.filter_queryset(self.get_queryset())
         for name, value in search_input.items():
-            if name == "expand":
+            if name in ("expand", "fields"):
                 continue
             queryset = queryset.filter(**{name: value})
 
@@ -259,7 +315,12 @@ class EnkelvoudigInformatieObjectViewSet(
         return EnkelvoudigInformatieObjectSerializer
 
     @extend_schema(
-        parameters=[VERSIE_QUERY_PARAM, REGISTRATIE_QUERY_PARAM, EXPAND_QUERY_PARAM],
+        parameters=[
+            VERSIE_QUERY_PARAM,
+            REGISTRATIE_QUERY_PARAM,
+            EXPAND_QUERY_PARAM,
+            FIELDS_QUERY_PARAM,
+        ],
         responses=SchemaEIOSerializer,
     )
     def retrieve(self, request, *args, **kwargs):
@@ -376,7 +437,12 @@ class EnkelvoudigInformatieObjectViewSet(
 @extend_schema_view(
     list=extend_schema(
         summary=_("Alle audit trail regels behorend bij het INFORMATIEOBJECT."),
-        description=_("Alle audit trail regels behorend bij het INFORMATIEOBJECT."),
+        description=_(
+            "Alle audit trail regels behorend bij het INFORMATIEOBJECT.\n\n"
+            "Met de `cursor` query parameter worden de regels gepagineerd "
+            "teruggegeven, in een object met de `next`, `previous` en `results` "
+            "attributen."
+        ),
     ),
     retrieve=extend_schema(
         summary=_("Een specifieke audit trail regel opvragen."),
@@ -386,9 +452,57 @@ class EnkelvoudigInformatieObjectViewSet(
 class EnkelvoudigInformatieObjectAuditTrailViewSet(AuditTrailViewSet):
     main_resource_lookup_field = "enkelvoudiginformatieobject_uuid"
     global_description = "Opvragen van de audit trail regels."
+    pagination_class = OptionalCursorPagination
+    # entries written by the same batch can have the same ``aanmaakdatum``
+    cursor_ordering = ("aanmaakdatum", "id")
+    schema = OptionalPaginationAutoSchema()
+
+    @property
+    def filterset_class(self):
+        if self.action == "list":
+            return AuditTrailFilter
+        return None
+
+    def get_queryset(self):
+        identifier = self.kwargs.get(self.main_resource_lookup_field)
+        if not identifier:  # schema generation
+            return self.queryset.all()
+
+        # the URL of the document is stored with the host of the request that
+        # wrote the entry, so only match its path. The uuid at the end of the
+        # URL is indexed by ``audittrail_hoofdobject_idx``
+        url = reverse(
+            "enkelvoudiginformatieobject-detail",
+            kwargs={"uuid": identifier},
+            request=self.request,
+        )
+        path = urlsplit(url).path
+        queryset = self.queryset.annotate(
+            hoofd_object_uuid=Right("hoofd_object", 36)
+        ).filter(hoofd_object_uuid=str(identifier), hoofd_object__endswith=path)
+        if not queryset.exists():
+            raise Http404
+        return queryset
 
     def initialize_request(self, request, *args, **kwargs):
         # workaround for drf-nested-viewset injecting the URL kwarg into request.data
         return super(viewsets.ReadOnlyModelViewSet, self).initialize_request(
             request, *args, **kwargs
         )
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        audittrails = [
+            reconstruct_wijzigingen(audittrail)
+            for audittrail in (queryset if page is None else page)
+        ]
+        serializer = self.get_serializer(audittrails, many=True)
+        if page is None:
+            return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = reconstruct_wijzigingen(self.get_object())
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
@@ -7,11 +7,13 @@ from vng_api_common.audittrails.viewsets import AuditTrailViewsetMixin
 from vng_api_common.caching.decorators import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
-from drc.api.audits import AUDIT_DRC
+from drc.api.audits import AUDIT_DRC, AuditTrailBufferMixin
 from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.exclusions import ExpandFieldValidator, ExpansionMixin
 from drc.api.filters import GebruiksrechtenFilter
 from drc.api.kanalen import KANAAL_DOCUMENTEN
+from drc.api.mixins import FIELDS_QUERY_PARAM, SparseFieldsMixin, StreamingListMixin
+from drc.api.notifications import NotificatieOutboxMixin
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
@@ -27,11 +29,17 @@ from drc.datamodel.models.gebruiksrechten import Gebruiksrechten
 @extend_schema_view(
     list=extend_schema(
         summary=_("Alle GEBRUIKSRECHTen opvragen."),
-        description=_("Deze lijst kan gefilterd wordt met query-string parameters."),
+        description=_(
+            "Deze lijst kan gefilterd wordt met query-string parameters."
+            "\n\nMet de header `Accept: application/x-ndjson` worden alle resultaten "
+            "zonder paginering gestreamd als newline delimited JSON, één object per "
+            "regel."
+        ),
     ),
     retrieve=extend_schema(
         summary=_("Een specifieke GEBRUIKSRECHT opvragen."),
         description=_("Een specifieke GEBRUIKSRECHT opvragen."),
+        parameters=[FIELDS_QUERY_PARAM],
     ),
     create=extend_schema(
         summary=_("Maak een GEBRUIKSRECHT aan."),
@@ -61,12 +69,16 @@ from drc.datamodel.models.gebruiksrechten import Gebruiksrechten
     ),
 )
 class GebruiksrechtenViewSet(
+    NotificatieOutboxMixin,
     NotificationViewSetMixin,
     CheckQueryParamsMixin,
     ListFilterByAuthorizationsMixin,
+    AuditTrailBufferMixin,
     AuditTrailViewsetMixin,
     ExpandFieldValidator,
+    StreamingListMixin,
     ExpansionMixin,
+    SparseFieldsMixin,
     viewsets.ModelViewSet,
 ):
     global_description = _(
@@ -74,6 +86,7 @@ class GebruiksrechtenViewSet(
     )
 
     queryset = Gebruiksrechten.objects.all()
+    serializer_select_related = ("informatieobject__current_version",)
     serializer_class = GebruiksrechtenSerializer
     filterset_class = GebruiksrechtenFilter
     lookup_field = "uuid"
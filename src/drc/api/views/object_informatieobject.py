@@ -9,6 +9,7 @@ from vng_api_common.viewsets import CheckQueryParamsMixin
 from drc.api.data_filtering import ListFilterByAuthorizationsMixin
 from drc.api.exclusions import ExpandFieldValidator, ExpansionMixin
 from drc.api.filters import ObjectInformatieObjectFilter
+from drc.api.mixins import FIELDS_QUERY_PARAM, SparseFieldsMixin, StreamingListMixin
 from drc.api.permissions import InformationObjectRelatedAuthScopesRequired
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
@@ -25,11 +26,17 @@ from drc.datamodel.models.object_informatieobject import ObjectInformatieObject
 @extend_schema_view(
     list=extend_schema(
         summary=_("Alle OBJECT-INFORMATIEOBJECT relaties opvragen."),
-        description=_(" Deze lijst kan gefilterd wordt met query-string parameters."),
+        description=_(
+            " Deze lijst kan gefilterd wordt met query-string parameters."
+            "\n\nMet de header `Accept: application/x-ndjson` worden alle resultaten "
+            "zonder paginering gestreamd als newline delimited JSON, één object per "
+            "regel."
+        ),
     ),
     retrieve=extend_schema(
         summary=_("Een specifieke OBJECT-INFORMATIEOBJECT relatie opvragen."),
         description=_("Een specifieke OBJECT-INFORMATIEOBJECT relatie opvragen."),
+        parameters=[FIELDS_QUERY_PARAM],
     ),
     create=extend_schema(
         summary=_("Maak een OBJECT-INFORMATIEOBJECT relatie aan."),
@@ -56,7 +63,9 @@ class ObjectInformatieObjectViewSet(
     CheckQueryParamsMixin,
     ListFilterByAuthorizationsMixin,
     ExpandFieldValidator,
+    StreamingListMixin,
     ExpansionMixin,
+    SparseFieldsMixin,
     mixins.CreateModelMixin,
     mixins.DestroyModelMixin,
     viewsets.ReadOnlyModelViewSet,
@@ -66,6 +75,7 @@ class ObjectInformatieObjectViewSet(
     )
 
     queryset = ObjectInformatieObject.objects.all()
+    serializer_select_related = ("informatieobject__current_version",)
     serializer_class = ObjectInformatieObjectSerializer
     filterset_class = ObjectInformatieObjectFilter
     lookup_field = "uuid"
@@ -2,12 +2,13 @@ from django.utils.translation import gettext as _
 
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import viewsets
-from rest_framework.pagination import PageNumberPagination
 from vng_api_common.caching.decorators import conditional_retrieve
 from vng_api_common.viewsets import CheckQueryParamsMixin
 
 from drc.api.exclusions import ExpandFieldValidator, ExpansionMixin
 from drc.api.filters import VerzendingFilter
+from drc.api.mixins import FIELDS_QUERY_PARAM, SparseFieldsMixin, StreamingListMixin
+from drc.api.pagination import PageNumberOrCursorPagination
 from drc.api.scopes import (
     SCOPE_DOCUMENTEN_AANMAKEN,
     SCOPE_DOCUMENTEN_ALLES_LEZEN,
@@ -22,11 +23,17 @@ from drc.datamodel.models import Verzending
 @extend_schema_view(
     list=extend_schema(
         summary=_("Alle VERZENDINGen opvragen."),
-        description=_("Deze lijst kan gefilterd wordt met query-string parameters."),
+        description=_(
+            "Deze lijst kan gefilterd wordt met query-string parameters."
+            "\n\nMet de header `Accept: application/x-ndjson` worden alle resultaten "
+            "zonder paginering gestreamd als newline delimited JSON, één object per "
+            "regel."
+        ),
     ),
     retrieve=extend_schema(
         summary=_("Een specifieke VERZENDING opvragen."),
         description=_("Een specifieke VERZENDING opvragen."),
+        parameters=[FIELDS_QUERY_PARAM],
     ),
     create=extend_schema(
         summary=_("Maak een VERZENDING aan."),
@@ -50,15 +57,18 @@ from drc.datamodel.models import Verzending
 class VerzendingViewSet(
     CheckQueryParamsMixin,
     ExpandFieldValidator,
+    StreamingListMixin,
     ExpansionMixin,
+    SparseFieldsMixin,
     viewsets.ModelViewSet,
 ):
 
     global_description = _("Opvragen en bewerken van VERZENDINGen.")
 
-    queryset = Verzending.objects.select_related("informatieobject")
+    queryset = Verzending.objects.all()
+    serializer_select_related = ("informatieobject__current_version",)
     serializer_class = VerzendingSerializer
-    pagination_class = PageNumberPagination
+    pagination_class = PageNumberOrCursorPagination
     filterset_class = VerzendingFilter
     lookup_field = "uuid"
     required_scopes = {
@@ -61,3 +61,30 @@ BRC_API_SPEC = f"https://raw.githubusercontent.com/{brc_repo}/{brc_commit}/src/o
 SELF_REPO = "VNG-Realisatie/gemma-documentregistratiecomponent"
 SELF_BRANCH = os.getenv("SELF_BRANCH") or API_VERSION
 GITHUB_API_SPEC = f"https://raw.githubusercontent.com/{SELF_REPO}/{SELF_BRANCH}/src/openapi.yaml"  # noqa
+
+# Fetching of external resources for the ``expand`` query parameter
+EXPAND_EXTERNAL_MAX_WORKERS = int(os.getenv("EXPAND_EXTERNAL_MAX_WORKERS", 10))
+EXPAND_EXTERNAL_MAX_PER_HOST = int(os.getenv("EXPAND_EXTERNAL_MAX_PER_HOST", 4))
+EXPAND_EXTERNAL_TIMEOUT = float(os.getenv("EXPAND_EXTERNAL_TIMEOUT", 10))
+
+# Fetching of the resources of the other APIs to validate relations
+REMOTE_VALIDATION_TIMEOUT = float(os.getenv("REMOTE_VALIDATION_TIMEOUT", 10))
+
+# Cache of resources of the other APIs, see ``drc.api.remote_cache``
+REMOTE_RESOURCE_CACHE = os.getenv("REMOTE_RESOURCE_CACHE", "remote_resources")
+REMOTE_RESOURCE_CACHE_TIMEOUT = int(os.getenv("REMOTE_RESOURCE_CACHE_TIMEOUT", 300))
+# size of the ``remote_resources`` cache alias
+REMOTE_RESOURCE_CACHE_MAX_ENTRIES = int(
+    os.getenv("REMOTE_RESOURCE_CACHE_MAX_ENTRIES", 1000)
+)
+REMOTE_RESOURCE_FETCHER = "requests.get"
+LINK_FETCHER = "drc.api.remote_cache.cached_link_fetcher"
+
+# Cache of the compiled authorizations of applications, see
+# ``drc.api.authorizations``
+AUTHORIZATIONS_CACHE = os.getenv("AUTHORIZATIONS_CACHE", "default")
+AUTHORIZATIONS_CACHE_TIMEOUT = int(os.getenv("AUTHORIZATIONS_CACHE_TIMEOUT", 3600))
+
+# Cache signalling changes of the credentials for the other APIs, see
+# ``drc.api.credentials``
+API_CREDENTIALS_CACHE = os.getenv("API_CREDENTIALS_CACHE", "default")
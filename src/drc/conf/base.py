@@ -353,6 +353,29 @@ IS_HTTPS = os.getenv("IS_HTTPS", "1").lower() in ["true", "1", "yes"]
 
 # settings for sending notifications
 NOTIFICATIONS_KANAAL = "documenten"
+# write notifications to the outbox, sent by the ``send_notifications`` worker,
+# instead of sending them at the end of the request
+ASYNC_NOTIFICATIONS = os.getenv("ASYNC_NOTIFICATIONS", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+NOTIFICATIONS_BATCH_SIZE = int(os.getenv("NOTIFICATIONS_BATCH_SIZE", 100))
+NOTIFICATIONS_MAX_ATTEMPTS = int(os.getenv("NOTIFICATIONS_MAX_ATTEMPTS", 10))
+# seconds before the first retry, doubled for every next retry
+NOTIFICATIONS_RETRY_BACKOFF = int(os.getenv("NOTIFICATIONS_RETRY_BACKOFF", 10))
+NOTIFICATIONS_RETRY_BACKOFF_MAX = int(
+    os.getenv("NOTIFICATIONS_RETRY_BACKOFF_MAX", 3600)
+)
+
+# write audit trail entries to a buffer, moved to the audit trail by the
+# ``write_audittrails`` worker, instead of writing them during the request
+ASYNC_AUDITTRAILS = os.getenv("ASYNC_AUDITTRAILS", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+AUDITTRAILS_BATCH_SIZE = int(os.getenv("AUDITTRAILS_BATCH_SIZE", 500))
 
 # settings for private media files
 PRIVATE_MEDIA_ROOT = os.path.join(BASE_DIR, "private-media")
@@ -366,6 +389,16 @@ MIN_UPLOAD_SIZE = int(os.getenv("MIN_UPLOAD_SIZE", 4 * 2**30))
 CHUNK_SIZE = 4 * 2**30  # 4 GB
 READ_CHUNK = 6 * 2**20  # 6 MB
 DEFAULT_EXTENSION = "bin"
+# merge the bestandsdelen of a document in the ``finalize_uploads`` worker
+# instead of during the unlock request
+ASYNC_UPLOAD_FINALIZATION = os.getenv("ASYNC_UPLOAD_FINALIZATION", "0").lower() in [
+    "true",
+    "1",
+    "yes",
+]
+# number of seconds after which a merge is considered stopped, and is started
+# over by the ``finalize_uploads`` worker
+UPLOAD_FINALIZATION_TIMEOUT = int(os.getenv("UPLOAD_FINALIZATION_TIMEOUT", 3600))
 
 # Relevant for multipart parser, which comes into play with file uploads in the
 # next version.
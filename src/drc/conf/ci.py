@@ -12,6 +12,8 @@ CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     # https://github.com/jazzband/django-axes/blob/master/docs/configuration.rst#cache-problems
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # don't share remote resources between tests
+    "remote_resources": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
 }
 
 # Hosts/domain names that are valid for this site; required if DEBUG is False
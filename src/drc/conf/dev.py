@@ -81,6 +81,13 @@ AXES_BEHIND_REVERSE_PROXY = (
 CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # resources of the other APIs, bounded and kept by every process, see
+    # ``REMOTE_RESOURCE_CACHE``
+    "remote_resources": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "remote-resources",
+        "OPTIONS": {"MAX_ENTRIES": REMOTE_RESOURCE_CACHE_MAX_ENTRIES},
+    },
 }
 
 AXES_CACHE = "axes_cache"
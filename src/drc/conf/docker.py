@@ -38,6 +38,13 @@ CACHES = {
     "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
     # https://github.com/jazzband/django-axes/blob/master/docs/configuration.rst#cache-problems
     "axes_cache": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"},
+    # resources of the other APIs, bounded and kept by every process, see
+    # ``REMOTE_RESOURCE_CACHE``
+    "remote_resources": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "remote-resources",
+        "OPTIONS": {"MAX_ENTRIES": REMOTE_RESOURCE_CACHE_MAX_ENTRIES},
+    },
 }
 
 # Deal with being hosted on a subpath
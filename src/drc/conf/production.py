@@ -23,7 +23,14 @@ CACHES = {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
             "IGNORE_EXCEPTIONS": True,
         },
-    }
+    },
+    # resources of the other APIs, bounded and kept by every process, see
+    # ``REMOTE_RESOURCE_CACHE``
+    "remote_resources": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "remote-resources",
+        "OPTIONS": {"MAX_ENTRIES": REMOTE_RESOURCE_CACHE_MAX_ENTRIES},
+    },
 }
 
 # Caching sessions.
@@ -1,15 +1,20 @@
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from privates.admin import PrivateMediaMixin
 
+from drc.datamodel.constants import FinalisatieStatussen, NotificatieStatussen
 from drc.datamodel.forms import VerzendingForm
 
 from .models import (
+    AuditTrailBuffer,
     BestandsDeel,
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
+    Finalisatie,
     Gebruiksrechten,
+    Notificatie,
     ObjectInformatieObject,
     Verzending,
 )
@@ -73,6 +78,51 @@ class BestandsDeelAdmin(PrivateMediaMixin, admin.ModelAdmin):
     private_media_fields = ("inhoud",)
 
 
+@admin.register(Finalisatie)
+class FinalisatieAdmin(admin.ModelAdmin):
+    list_display = ("informatieobject", "status", "omvang", "verwerkt", "aangemaakt")
+    list_filter = ("status",)
+    raw_id_fields = ("informatieobject",)
+    readonly_fields = ("aangemaakt", "gestart", "beeindigd")
+    actions = ["retry"]
+
+    def retry(self, request, queryset):
+        (
+            queryset.filter(status=FinalisatieStatussen.mislukt) | queryset.stale()
+        ).update(
+            status=FinalisatieStatussen.in_wachtrij,
+            verwerkt=0,
+            foutmelding="",
+            gestart=None,
+            beeindigd=None,
+        )
+
+    retry.short_description = _("Retry the selected failed or stalled finalisaties")
+
+
+@admin.register(AuditTrailBuffer)
+class AuditTrailBufferAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "hoofd_object", "aanmaakdatum")
+    readonly_fields = ("hoofd_object", "gegevens", "aanmaakdatum")
+
+
+@admin.register(Notificatie)
+class NotificatieAdmin(admin.ModelAdmin):
+    list_display = ("__str__", "status", "pogingen", "volgende_poging", "aangemaakt")
+    list_filter = ("status",)
+    readonly_fields = ("aangemaakt",)
+    actions = ["retry"]
+
+    def retry(self, request, queryset):
+        queryset.filter(status=NotificatieStatussen.mislukt).update(
+            status=NotificatieStatussen.in_wachtrij,
+            pogingen=0,
+            volgende_poging=timezone.now(),
+        )
+
+    retry.short_description = _("Retry the selected failed notificaties")
+
+
 @admin.register(Verzending)
 class VerzendingAdmin(admin.ModelAdmin):
     form = VerzendingForm
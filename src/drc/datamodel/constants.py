@@ -69,6 +69,18 @@ class ChecksumAlgoritmes(DjangoChoices):
     sha_3 = ChoiceItem("sha_3", "SHA-3")
 
 
+class FinalisatieStatussen(DjangoChoices):
+    in_wachtrij = ChoiceItem("in_wachtrij", _("In wachtrij"))
+    bezig = ChoiceItem("bezig", _("Bezig"))
+    voltooid = ChoiceItem("voltooid", _("Voltooid"))
+    mislukt = ChoiceItem("mislukt", _("Mislukt"))
+
+
+class NotificatieStatussen(DjangoChoices):
+    in_wachtrij = ChoiceItem("in_wachtrij", _("In wachtrij"))
+    mislukt = ChoiceItem("mislukt", _("Mislukt"))
+
+
 class OndertekeningSoorten(DjangoChoices):
     analoog = ChoiceItem("analoog", _("Analoog"))
     digitaal = ChoiceItem("digitaal", _("Digitaal"))
@@ -0,0 +1,57 @@
+import json
+from datetime import datetime, time
+
+from django.core.management import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from vng_api_common.audittrails.models import AuditTrail
+
+
+class Command(BaseCommand):
+    help = (
+        "Move the audit trail entries created before a date to a newline "
+        "delimited JSON file"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "before",
+            help="Archive the entries created before this date (YYYY-MM-DD)",
+        )
+        parser.add_argument("output", help="File to append the entries to")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of entries to archive per transaction",
+        )
+
+    def handle(self, **options):
+        before = parse_date(options["before"])
+        if before is None:
+            raise CommandError("The date must be formatted as YYYY-MM-DD")
+
+        queryset = AuditTrail.objects.filter(
+            aanmaakdatum__lt=timezone.make_aware(datetime.combine(before, time.min))
+        ).order_by("pk")
+        archived = 0
+        with open(options["output"], "a") as output:
+            while True:
+                # write the batch before deleting it, so a failure never loses
+                # entries, at most archives them twice
+                with transaction.atomic():
+                    batch = list(queryset.values()[: options["batch_size"]])
+                    if not batch:
+                        break
+                    for entry in batch:
+                        output.write(json.dumps(entry, cls=DjangoJSONEncoder) + "\n")
+                    output.flush()
+                    AuditTrail.objects.filter(
+                        pk__in=[entry["id"] for entry in batch]
+                    ).delete()
+                archived += len(batch)
+
+        self.stdout.write(f"{archived} audit trail entries archived")
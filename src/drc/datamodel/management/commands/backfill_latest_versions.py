@@ -0,0 +1,64 @@
+from django.core.management import BaseCommand
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+
+from drc.datamodel.models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Populate the latest version pointer of EnkelvoudigInformatieObjectCanonical "
+        "for existing documents"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=10_000,
+            help="Number of documents to update per transaction",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recalculate the pointer for all documents, not only the missing ones",
+        )
+
+    def handle(self, **options):
+        batch_size = options["batch_size"]
+
+        latest_version = (
+            EnkelvoudigInformatieObject.objects.filter(canonical=OuterRef("pk"))
+            .order_by("-versie", "-pk")
+            .values("pk")[:1]
+        )
+
+        canonicals = EnkelvoudigInformatieObjectCanonical.objects.order_by("pk")
+        if not options["all"]:
+            canonicals = canonicals.filter(current_version__isnull=True)
+
+        self.stdout.write(f"Updating {canonicals.count()} documents...")
+
+        updated = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                canonicals.filter(pk__gt=last_pk).values_list("pk", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not pks:
+                break
+
+            with transaction.atomic():
+                updated += EnkelvoudigInformatieObjectCanonical.objects.filter(
+                    pk__in=pks
+                ).update(current_version=Subquery(latest_version))
+
+            last_pk = pks[-1]
+            self.stdout.write(f"  {updated} documents updated")
+
+        self.stdout.write(self.style.SUCCESS("Done"))
@@ -0,0 +1,39 @@
+import time
+
+from django.core.management import BaseCommand
+
+from drc.api.finalization import process_finalisaties
+
+
+class Command(BaseCommand):
+    help = (
+        "Merge the bestandsdelen of unlocked documents, if ASYNC_UPLOAD_FINALIZATION "
+        "is enabled"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Process the waiting uploads and exit, instead of polling for new ones",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5,
+            help="Number of seconds to wait between polls for new uploads",
+        )
+
+    def handle(self, **options):
+        while True:
+            processed = process_finalisaties()
+            if processed:
+                self.stdout.write(f"{processed} uploads finalized")
+
+            if options["once"]:
+                break
+
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                break
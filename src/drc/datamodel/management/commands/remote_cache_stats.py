@@ -0,0 +1,16 @@
+from django.core.management import BaseCommand
+
+from drc.api.remote_cache import remote_cache
+
+
+class Command(BaseCommand):
+    help = "Show the number of hits and misses of the remote resource cache"
+
+    def handle(self, **options):
+        stats = remote_cache.stats()
+        total = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / total if total else 0
+
+        self.stdout.write(f"Hits: {stats['hits']}")
+        self.stdout.write(f"Misses: {stats['misses']}")
+        self.stdout.write(f"Hit ratio: {ratio:.1%}")
@@ -0,0 +1,43 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from drc.api.notifications import process_notificaties
+
+
+class Command(BaseCommand):
+    help = "Send the notifications in the outbox, if ASYNC_NOTIFICATIONS is enabled"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Send the waiting notifications and exit, instead of polling for new ones",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1,
+            help="Number of seconds to wait between polls for new notifications",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.NOTIFICATIONS_BATCH_SIZE,
+            help="Number of notifications to send per transaction",
+        )
+
+    def handle(self, **options):
+        while True:
+            processed = process_notificaties(options["batch_size"])
+            if processed:
+                self.stdout.write(f"{processed} notifications processed")
+
+            if options["once"]:
+                break
+
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                break
@@ -0,0 +1,43 @@
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+
+from drc.api.audits import process_audittrails
+
+
+class Command(BaseCommand):
+    help = "Write the buffered audit trail entries, if ASYNC_AUDITTRAILS is enabled"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Write the buffered entries and exit, instead of polling for new ones",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=1,
+            help="Number of seconds to wait between polls for new entries",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.AUDITTRAILS_BATCH_SIZE,
+            help="Number of entries to write per transaction",
+        )
+
+    def handle(self, **options):
+        while True:
+            processed = process_audittrails(options["batch_size"])
+            if processed:
+                self.stdout.write(f"{processed} audit trail entries written")
+
+            if options["once"]:
+                break
+
+            try:
+                time.sleep(options["interval"])
+            except KeyboardInterrupt:
+                break
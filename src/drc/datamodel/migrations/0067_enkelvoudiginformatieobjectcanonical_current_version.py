@@ -0,0 +1,65 @@
+# Generated by Django 3.2.13 on 2026-10-18 03:23
+
+from django.db import migrations, models, transaction
+from django.db.models import OuterRef, Subquery
+import django.db.models.deletion
+
+BATCH_SIZE = 10_000
+
+
+def backfill_current_version(apps, schema_editor):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "datamodel", "EnkelvoudigInformatieObject"
+    )
+    EnkelvoudigInformatieObjectCanonical = apps.get_model(
+        "datamodel", "EnkelvoudigInformatieObjectCanonical"
+    )
+
+    latest_version = (
+        EnkelvoudigInformatieObject.objects.filter(canonical=OuterRef("pk"))
+        .order_by("-versie", "-pk")
+        .values("pk")[:1]
+    )
+    canonicals = EnkelvoudigInformatieObjectCanonical.objects.filter(
+        current_version__isnull=True
+    ).order_by("pk")
+
+    last_pk = 0
+    while True:
+        pks = list(
+            canonicals.filter(pk__gt=last_pk).values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic():
+            EnkelvoudigInformatieObjectCanonical.objects.filter(pk__in=pks).update(
+                current_version=Subquery(latest_version)
+            )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    # the backfill commits per batch
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0066_auto_20240325_0929"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobjectcanonical",
+            name="current_version",
+            field=models.OneToOneField(
+                blank=True,
+                editable=False,
+                help_text="The latest version of the document",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="datamodel.enkelvoudiginformatieobject",
+            ),
+        ),
+        migrations.RunPython(backfill_current_version, migrations.RunPython.noop),
+    ]
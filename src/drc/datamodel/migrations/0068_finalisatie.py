@@ -0,0 +1,96 @@
+# Generated by Django 3.2.13 on 2026-10-18 03:41
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0067_enkelvoudiginformatieobjectcanonical_current_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Finalisatie",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_wachtrij", "In wachtrij"),
+                            ("bezig", "Bezig"),
+                            ("voltooid", "Voltooid"),
+                            ("mislukt", "Mislukt"),
+                        ],
+                        db_index=True,
+                        default="in_wachtrij",
+                        help_text="De stand van zaken van het samenvoegen van de bestandsdelen.",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "omvang",
+                    models.BigIntegerField(
+                        help_text="Het totaal aantal bytes van de bestandsdelen.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="omvang",
+                    ),
+                ),
+                (
+                    "verwerkt",
+                    models.BigIntegerField(
+                        default=0,
+                        help_text="Het aantal bytes dat al is samengevoegd.",
+                        validators=[django.core.validators.MinValueValidator(0)],
+                        verbose_name="verwerkt",
+                    ),
+                ),
+                (
+                    "foutmelding",
+                    models.TextField(
+                        blank=True,
+                        help_text="De reden waarom het samenvoegen is mislukt.",
+                        verbose_name="foutmelding",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+                (
+                    "gestart",
+                    models.DateTimeField(blank=True, null=True, verbose_name="gestart"),
+                ),
+                (
+                    "beeindigd",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="beëindigd"
+                    ),
+                ),
+                (
+                    "informatieobject",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="finalisatie",
+                        to="datamodel.enkelvoudiginformatieobject",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "finalisatie",
+                "verbose_name_plural": "finalisaties",
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.13 on 2026-10-18 03:46
+
+import django.core.validators
+from django.db import migrations, models
+from django.db.models import F
+
+
+def set_ontvangen(apps, schema_editor):
+    BestandsDeel = apps.get_model("datamodel.BestandsDeel")
+    # parts uploaded before were uploaded at once
+    BestandsDeel.objects.exclude(inhoud="").update(ontvangen=F("omvang"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0068_finalisatie"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="bestandsdeel",
+            name="ontvangen",
+            field=models.BigIntegerField(
+                default=0,
+                help_text="Het aantal bytes van dit bestandsdeel dat is ontvangen. Een upload met `Content-Range` header wordt vanaf dit punt hervat.",
+                validators=[django.core.validators.MinValueValidator(0)],
+            ),
+        ),
+        migrations.RunPython(set_ontvangen, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 3.2.13 on 2026-10-18 04:06
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models, transaction
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+BATCH_SIZE = 10_000
+
+
+def set_vertrouwelijkheidaanduiding_order(apps, schema_editor):
+    EnkelvoudigInformatieObject = apps.get_model(
+        "datamodel", "EnkelvoudigInformatieObject"
+    )
+    order = VertrouwelijkheidsAanduiding.get_order_expression(
+        "vertrouwelijkheidaanduiding"
+    )
+    queryset = EnkelvoudigInformatieObject.objects.exclude(
+        vertrouwelijkheidaanduiding=""
+    ).order_by("pk")
+
+    # update in batches, each in its own transaction, to keep the locks short
+    last_pk = 0
+    while True:
+        pks = list(
+            queryset.filter(pk__gt=last_pk).values_list("pk", flat=True)[:BATCH_SIZE]
+        )
+        if not pks:
+            break
+
+        with transaction.atomic():
+            EnkelvoudigInformatieObject.objects.filter(pk__in=pks).update(
+                vertrouwelijkheidaanduiding_order=order
+            )
+        last_pk = pks[-1]
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0069_bestandsdeel_ontvangen"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="enkelvoudiginformatieobject",
+            name="vertrouwelijkheidaanduiding_order",
+            field=models.PositiveSmallIntegerField(
+                editable=False,
+                help_text="De rangorde van de `vertrouwelijkheidaanduiding`, om te vergelijken met de maximale vertrouwelijkheidaanduiding van autorisaties.",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(
+            set_vertrouwelijkheidaanduiding_order, migrations.RunPython.noop
+        ),
+        # without blocking writes to the table while building the index
+        AddIndexConcurrently(
+            model_name="enkelvoudiginformatieobject",
+            index=models.Index(
+                fields=[
+                    "informatieobjecttype",
+                    "vertrouwelijkheidaanduiding_order",
+                    "canonical",
+                ],
+                name="eio_authorization_idx",
+            ),
+        ),
+    ]
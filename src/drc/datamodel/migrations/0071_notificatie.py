@@ -0,0 +1,90 @@
+# Generated by Django 3.2.13 on 2026-10-18 04:47
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0070_vertrouwelijkheidaanduiding_order"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Notificatie",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "bericht",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Het bericht dat naar de Notificaties API verstuurd wordt.",
+                        verbose_name="bericht",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("in_wachtrij", "In wachtrij"),
+                            ("mislukt", "Mislukt"),
+                        ],
+                        default="in_wachtrij",
+                        help_text="De stand van zaken van het versturen van de notificatie.",
+                        max_length=20,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "pogingen",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Het aantal mislukte pogingen om de notificatie te versturen.",
+                        verbose_name="pogingen",
+                    ),
+                ),
+                (
+                    "volgende_poging",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Het tijdstip vanaf wanneer de notificatie verstuurd mag worden.",
+                        verbose_name="volgende poging",
+                    ),
+                ),
+                (
+                    "foutmelding",
+                    models.TextField(
+                        blank=True,
+                        help_text="De reden waarom de laatste poging is mislukt.",
+                        verbose_name="foutmelding",
+                    ),
+                ),
+                (
+                    "aangemaakt",
+                    models.DateTimeField(auto_now_add=True, verbose_name="aangemaakt"),
+                ),
+            ],
+            options={
+                "verbose_name": "notificatie",
+                "verbose_name_plural": "notificaties",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="notificatie",
+            index=models.Index(
+                condition=models.Q(("status", "in_wachtrij")),
+                fields=["volgende_poging"],
+                name="notificatie_wachtrij_idx",
+            ),
+        ),
+    ]
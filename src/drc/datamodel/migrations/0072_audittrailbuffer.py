@@ -0,0 +1,57 @@
+# Generated by Django 3.2.13 on 2026-10-18 04:51
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("datamodel", "0071_notificatie"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditTrailBuffer",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "hoofd_object",
+                    models.URLField(
+                        help_text="De URL naar het hoofdobject van een component.",
+                        max_length=1000,
+                        verbose_name="hoofd object",
+                    ),
+                ),
+                (
+                    "gegevens",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="De velden van de audit trail regel, met alleen de gewijzigde attributen in `oud` en `nieuw`.",
+                        verbose_name="gegevens",
+                    ),
+                ),
+                (
+                    "aanmaakdatum",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="De datum waarop de handeling is gedaan.",
+                        verbose_name="aanmaakdatum",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "audit trail buffer",
+                "verbose_name_plural": "audit trail buffer",
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 3.2.13 on 2026-10-18 05:20
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # the audit trail table can be large, build the indexes without locking it
+    atomic = False
+
+    dependencies = [
+        ("datamodel", "0072_audittrailbuffer"),
+        ("audittrails", "0018_auto_20220927_1000"),
+    ]
+
+    # the audit trail model is part of vng_api_common
+    operations = [
+        # the audit trail of a document is looked up by the uuid at the end of
+        # its URL, which doesn't depend on the host it was written with
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS audittrail_hoofdobject_idx "
+            "ON audittrails_audittrail (right(hoofd_object, 36), aanmaakdatum, id)",
+            "DROP INDEX CONCURRENTLY IF EXISTS audittrail_hoofdobject_idx",
+        ),
+        # entries are appended in the order of ``aanmaakdatum``, a small BRIN
+        # index is enough to select the entries of a period to archive
+        migrations.RunSQL(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS audittrail_aanmaakdatum_brin "
+            "ON audittrails_audittrail USING brin (aanmaakdatum)",
+            "DROP INDEX CONCURRENTLY IF EXISTS audittrail_aanmaakdatum_brin",
+        ),
+    ]
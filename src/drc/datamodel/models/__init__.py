@@ -1,9 +1,12 @@
+from .audittrail import AuditTrailBuffer  # noqa
 from .bestandsdeel import BestandsDeel  # noqa
 from .enkelvoudig_informatieobject import (  # noqa
     EnkelvoudigInformatieObject,
     EnkelvoudigInformatieObjectCanonical,
 )
+from .finalisatie import Finalisatie  # noqa
 from .gebruiksrechten import Gebruiksrechten  # noqa
 from .informatieobject import InformatieObject  # noqa
+from .notificatie import Notificatie  # noqa
 from .object_informatieobject import ObjectInformatieObject  # noqa
 from .verzending import Verzending  # noqa
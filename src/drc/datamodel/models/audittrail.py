@@ -0,0 +1,40 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+
+class AuditTrailBuffer(models.Model):
+    """
+    An audit trail entry, written in the transaction of the change it is about
+    and moved to the audit trail by the ``write_audittrails`` worker.
+    """
+
+    hoofd_object = models.URLField(
+        _("hoofd object"),
+        max_length=1000,
+        help_text=_("De URL naar het hoofdobject van een component."),
+    )
+    gegevens = models.JSONField(
+        _("gegevens"),
+        encoder=DjangoJSONEncoder,
+        help_text=_(
+            "De velden van de audit trail regel, met alleen de gewijzigde "
+            "attributen in `oud` en `nieuw`."
+        ),
+    )
+    aanmaakdatum = models.DateTimeField(
+        _("aanmaakdatum"),
+        default=timezone.now,
+        help_text=_("De datum waarop de handeling is gedaan."),
+    )
+
+    class Meta:
+        verbose_name = _("audit trail buffer")
+        verbose_name_plural = _("audit trail buffer")
+
+    def __str__(self):
+        return "{actie} {resource_url}".format(
+            actie=self.gegevens.get("actie", ""),
+            resource_url=self.gegevens.get("resource_url", ""),
+        )
@@ -28,6 +28,14 @@ class BestandsDeel(models.Model):
         blank=True,
         help_text=_("De (binaire) bestandsinhoud van dit specifieke bestandsdeel."),
     )
+    ontvangen = models.BigIntegerField(
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text=_(
+            "Het aantal bytes van dit bestandsdeel dat is ontvangen. Een upload "
+            "met `Content-Range` header wordt vanaf dit punt hervat."
+        ),
+    )
     lock = models.CharField(
         default="",
         blank=True,
@@ -45,4 +53,4 @@ class BestandsDeel(models.Model):
 
     @property
     def voltooid(self) -> bool:
-        return bool(self.inhoud.name)
+        return bool(self.inhoud.name) and self.ontvangen >= self.omvang
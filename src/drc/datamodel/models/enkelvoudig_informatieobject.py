@@ -3,6 +3,9 @@ import uuid as _uuid
 from django.contrib.postgres.fields import ArrayField
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import F, OuterRef, Q, Subquery
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.utils.translation import ugettext_lazy as _
 
 from privates.fields import PrivateMediaFileField
@@ -25,19 +28,57 @@ class EnkelvoudigInformatieObjectCanonical(models.Model):
         max_length=100,
         help_text=_("Hash string, which represents id of the lock"),
     )
+    # denormalized pointer to the latest version, maintained by
+    # ``EnkelvoudigInformatieObject.save`` and when versions are deleted. It is
+    # populated for existing data by migration 0067, see the
+    # ``backfill_latest_versions`` management command to recalculate it.
+    current_version = models.OneToOneField(
+        "EnkelvoudigInformatieObject",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text=_("The latest version of the document"),
+    )
 
     def __str__(self):
         return str(self.latest_version)
 
+    def save(self, *args, **kwargs):
+        # never write back a (possibly stale) in-memory pointer, it is only
+        # updated by saving a version
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "current_version"
+            ]
+        super().save(*args, **kwargs)
+
     @property
     def latest_version(self):
-        versies = self.enkelvoudiginformatieobject_set.order_by("-versie", "-pk")
-        return versies.first()
+        # use the pointer if it was fetched along, e.g. with ``select_related``,
+        # and is populated
+        if (
+            EnkelvoudigInformatieObjectCanonical.current_version.is_cached(self)
+            and self.current_version is not None
+        ):
+            return self.current_version
+
+        versies = self.enkelvoudiginformatieobject_set
+        latest_version = versies.latest_versions().first()
+        # the pointer is not populated (yet) for this document
+        if latest_version is None:
+            latest_version = versies.order_by("-versie", "-pk").first()
+        return latest_version
 
     @property
     def complete_upload(self) -> bool:
-        empty_parts = self.bestandsdelen.filter(inhoud="")
-        return empty_parts.count() == 0
+        incomplete_parts = self.bestandsdelen.filter(
+            Q(inhoud="") | Q(ontvangen__lt=F("omvang"))
+        )
+        return not incomplete_parts.exists()
 
     @property
     def empty_bestandsdelen(self) -> bool:
@@ -169,3 +210,48 @@ class EnkelvoudigInformatieObject(ETagMixin, APIMixin, InformatieObject):
 
     class Meta:
         unique_together = ("uuid", "versie")
+        indexes = [
+            # filtering on authorizations
+            models.Index(
+                fields=[
+                    "informatieobjecttype",
+                    "vertrouwelijkheidaanduiding_order",
+                    "canonical",
+                ],
+                name="eio_authorization_idx",
+            )
+        ]
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._update_current_version()
+
+    def _update_current_version(self):
+        """
+        Point the canonical to this version if it is (or became) the latest one.
+        """
+        is_latest = Q(current_version__isnull=True) | Q(
+            current_version__versie__lte=self.versie
+        )
+        EnkelvoudigInformatieObjectCanonical.objects.filter(
+            pk=self.canonical_id
+        ).filter(is_latest).update(current_version=self)
+
+
+@receiver(post_delete, sender=EnkelvoudigInformatieObject)
+def update_current_version_on_delete(sender, instance, **kwargs):
+    """
+    Point the canonical to the latest remaining version if its current version
+    was deleted, which ``on_delete=SET_NULL`` only clears.
+
+    This is a signal rather than ``delete``, to also handle cascades and bulk
+    deletes.
+    """
+    latest_version = (
+        EnkelvoudigInformatieObject.objects.filter(canonical=OuterRef("pk"))
+        .order_by("-versie", "-pk")
+        .values("pk")[:1]
+    )
+    EnkelvoudigInformatieObjectCanonical.objects.filter(
+        pk=instance.canonical_id, current_version__isnull=True
+    ).update(current_version=Subquery(latest_version))
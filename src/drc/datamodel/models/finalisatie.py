@@ -0,0 +1,62 @@
+from django.core.validators import MinValueValidator
+from django.db import models
+from django.utils.translation import ugettext_lazy as _
+
+from ..constants import FinalisatieStatussen
+from ..query import FinalisatieQuerySet
+
+
+class Finalisatie(models.Model):
+    """
+    Merging the bestandsdelen of a document version into its `inhoud`, which
+    is done by the ``finalize_uploads`` worker after unlocking the document.
+    """
+
+    informatieobject = models.OneToOneField(
+        "EnkelvoudigInformatieObject",
+        on_delete=models.CASCADE,
+        related_name="finalisatie",
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=FinalisatieStatussen.choices,
+        default=FinalisatieStatussen.in_wachtrij,
+        db_index=True,
+        help_text=_("De stand van zaken van het samenvoegen van de bestandsdelen."),
+    )
+    omvang = models.BigIntegerField(
+        _("omvang"),
+        validators=[MinValueValidator(0)],
+        help_text=_("Het totaal aantal bytes van de bestandsdelen."),
+    )
+    verwerkt = models.BigIntegerField(
+        _("verwerkt"),
+        default=0,
+        validators=[MinValueValidator(0)],
+        help_text=_("Het aantal bytes dat al is samengevoegd."),
+    )
+    foutmelding = models.TextField(
+        _("foutmelding"),
+        blank=True,
+        help_text=_("De reden waarom het samenvoegen is mislukt."),
+    )
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+    gestart = models.DateTimeField(_("gestart"), null=True, blank=True)
+    beeindigd = models.DateTimeField(_("beëindigd"), null=True, blank=True)
+
+    objects = FinalisatieQuerySet.as_manager()
+
+    class Meta:
+        verbose_name = _("finalisatie")
+        verbose_name_plural = _("finalisaties")
+
+    def __str__(self):
+        return f"{self.informatieobject} - {self.get_status_display()}"
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in [
+            FinalisatieStatussen.in_wachtrij,
+            FinalisatieStatussen.bezig,
+        ]
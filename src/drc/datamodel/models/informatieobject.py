@@ -1,6 +1,7 @@
 from django.db import models
 from django.utils.translation import ugettext_lazy as _
 
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.descriptors import GegevensGroepType
 from vng_api_common.fields import RSINField, VertrouwelijkheidsAanduidingField
 from vng_api_common.utils import generate_unique_identification
@@ -41,6 +42,12 @@ class InformatieObject(models.Model):
         help_text="Aanduiding van de mate waarin het INFORMATIEOBJECT voor de "
         "openbaarheid bestemd is.",
     )
+    vertrouwelijkheidaanduiding_order = models.PositiveSmallIntegerField(
+        null=True,
+        editable=False,
+        help_text="De rangorde van de `vertrouwelijkheidaanduiding`, om te "
+        "vergelijken met de maximale vertrouwelijkheidaanduiding van autorisaties.",
+    )
     auteur = models.CharField(
         max_length=200,
         help_text="De persoon of organisatie die in de eerste plaats "
@@ -158,6 +165,22 @@ class InformatieObject(models.Model):
     def save(self, *args, **kwargs):
         if not self.identificatie:
             self.identificatie = generate_unique_identification(self, "creatiedatum")
+
+        # keep the order in sync, it is used to filter on authorizations
+        self.vertrouwelijkheidaanduiding_order = (
+            VertrouwelijkheidsAanduiding.get_choice(
+                self.vertrouwelijkheidaanduiding
+            ).order
+            if self.vertrouwelijkheidaanduiding in VertrouwelijkheidsAanduiding.values
+            else None
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "vertrouwelijkheidaanduiding" in update_fields:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "vertrouwelijkheidaanduiding_order",
+            }
+
         super().save(*args, **kwargs)
 
     def clean(self):
@@ -0,0 +1,62 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import ugettext_lazy as _
+
+from ..constants import NotificatieStatussen
+
+
+class Notificatie(models.Model):
+    """
+    A notification for the Notificaties API, written in the transaction of the
+    change it is about and sent by the ``send_notifications`` worker.
+
+    Sent notifications are deleted, failed ones are kept.
+    """
+
+    bericht = models.JSONField(
+        _("bericht"),
+        encoder=DjangoJSONEncoder,
+        help_text=_("Het bericht dat naar de Notificaties API verstuurd wordt."),
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=20,
+        choices=NotificatieStatussen.choices,
+        default=NotificatieStatussen.in_wachtrij,
+        help_text=_("De stand van zaken van het versturen van de notificatie."),
+    )
+    pogingen = models.PositiveIntegerField(
+        _("pogingen"),
+        default=0,
+        help_text=_("Het aantal mislukte pogingen om de notificatie te versturen."),
+    )
+    volgende_poging = models.DateTimeField(
+        _("volgende poging"),
+        default=timezone.now,
+        help_text=_("Het tijdstip vanaf wanneer de notificatie verstuurd mag worden."),
+    )
+    foutmelding = models.TextField(
+        _("foutmelding"),
+        blank=True,
+        help_text=_("De reden waarom de laatste poging is mislukt."),
+    )
+    aangemaakt = models.DateTimeField(_("aangemaakt"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("notificatie")
+        verbose_name_plural = _("notificaties")
+        indexes = [
+            # the worker only looks for waiting notifications
+            models.Index(
+                fields=["volgende_poging"],
+                condition=models.Q(status=NotificatieStatussen.in_wachtrij),
+                name="notificatie_wachtrij_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return "{actie} {resource_url}".format(
+            actie=self.bericht.get("actie", ""),
+            resource_url=self.bericht.get("resourceUrl", ""),
+        )
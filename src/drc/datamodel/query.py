@@ -1,16 +1,90 @@
-from django.apps import apps
+from datetime import timedelta
+from typing import Dict, Iterable, Union
+
+from django.conf import settings
 from django.db import models
-from django.db.models import Case, IntegerField, Value, When
+from django.db.models import F, Func
+from django.utils import timezone
 
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
 from vng_api_common.scopes import Scope
 
+from .constants import FinalisatieStatussen
+
+
+def compile_authorizations(scope: Scope, authorizations: Iterable) -> Dict[str, int]:
+    """
+    Map the ``informatieobjecttypen`` for which ``scope`` is granted to the order
+    of the highest ``vertrouwelijkheidaanduiding`` allowed.
+
+    If several authorizations grant the scope for the same
+    ``informatieobjecttype``, the least restrictive one applies.
+    """
+    compiled = {}
+    for authorization in authorizations:
+        # test if this authorization has the scope that's needed
+        if not scope.is_contained_in(authorization.scopes):
+            continue
+
+        # extract the order and map it to the database value
+        order = VertrouwelijkheidsAanduiding.get_choice(
+            authorization.max_vertrouwelijkheidaanduiding
+        ).order
+        informatieobjecttype = authorization.informatieobjecttype
+        compiled[informatieobjecttype] = max(
+            order, compiled.get(informatieobjecttype, order)
+        )
+    return compiled
+
+
+class AllowedByAuthorizations(Func):
+    """
+    Test if the ``informatieobjecttype`` and the order of the
+    ``vertrouwelijkheidaanduiding`` of a row are allowed by compiled
+    authorizations.
+
+    The authorizations are passed as two array parameters, which are joined as
+    a table, so the SQL is the same however many authorizations there are. The
+    ``informatieobjecttype`` is also compared with the array of allowed types,
+    which the planner can look up in ``eio_authorization_idx``, unlike the
+    values of the joined table.
+    """
+
+    output_field = models.BooleanField()
+
+    def __init__(self, informatieobjecttype, va_order, authorizations: Dict[str, int]):
+        super().__init__(informatieobjecttype, va_order)
+        self.authorizations = authorizations
+
+    def as_sql(self, compiler, connection):
+        informatieobjecttype, va_order = self.get_source_expressions()
+        informatieobjecttype_sql, informatieobjecttype_params = compiler.compile(
+            informatieobjecttype
+        )
+        va_order_sql, va_order_params = compiler.compile(va_order)
+        sql = (
+            f"({informatieobjecttype_sql} = ANY(%s::varchar[]) AND "
+            "EXISTS (SELECT 1 FROM unnest(%s::varchar[], %s::integer[]) "
+            "AS autorisatie(informatieobjecttype, max_order) "
+            f"WHERE autorisatie.informatieobjecttype = {informatieobjecttype_sql} "
+            f"AND autorisatie.max_order >= {va_order_sql}))"
+        )
+        params = [
+            *informatieobjecttype_params,
+            list(self.authorizations.keys()),
+            list(self.authorizations.keys()),
+            list(self.authorizations.values()),
+            *informatieobjecttype_params,
+            *va_order_params,
+        ]
+        return sql, params
+
 
 class AuthorizationsFilterMixin:
     authorizations_lookup = None
 
     def filter_for_authorizations(
-        self, scope: Scope, authorizations: models.QuerySet
+        self, scope: Scope, authorizations: Union[models.QuerySet, Dict[str, int]]
     ) -> models.QuerySet:
         """
         Filter objects whitelisted by the authorizations.
@@ -31,74 +105,50 @@ class AuthorizationsFilterMixin:
         :param scope: a (possibly complex) scope that must be granted on the
           authorizations
         :param authorizations: queryset of
-          :class:`vng_api_common.authorizations.Autorisatie` objects
+          :class:`vng_api_common.authorizations.Autorisatie` objects, or the
+          result of :func:`compile_authorizations` for the ``scope``
 
         :return: a queryset of filtered results according to the
           authorizations provided
         """
-        # keep a list of allowed informatieobjecttypen
-        informatieobjecttypen = []
-
-        # annotate the queryset so we can map a string value to a logical number
-        order_case = VertrouwelijkheidsAanduiding.get_order_expression(
-            "vertrouwelijkheidaanduiding"
+        if not isinstance(authorizations, dict):
+            authorizations = compile_authorizations(scope, authorizations)
+
+        # related resources are filtered on the current version of their
+        # document, which is joined through the pointer of the canonical
+        prefix = f"{self.authorizations_lookup}__" if self.authorizations_lookup else ""
+        # the stored order of the confidentiality level is compared with the
+        # maximum of the authorization, which can use an index
+        allowed = AllowedByAuthorizations(
+            F(f"{prefix}informatieobjecttype"),
+            F(f"{prefix}vertrouwelijkheidaanduiding_order"),
+            authorizations,
         )
-
-        # build the case/when to map the max_vertrouwelijkheidaanduiding based
-        # on the ``informatieobjecttype``
-        vertrouwelijkheidaanduiding_whens = []
-        for authorization in authorizations:
-            # test if this authorization has the scope that's needed
-            if not scope.is_contained_in(authorization.scopes):
-                continue
-
-            # this informatieobjecttype is allowed
-            informatieobjecttypen.append(authorization.informatieobjecttype)
-
-            # extract the order and map it to the database value
-            choice_item = VertrouwelijkheidsAanduiding.get_choice(
-                authorization.max_vertrouwelijkheidaanduiding
-            )
-            vertrouwelijkheidaanduiding_whens.append(
-                When(
-                    **{"informatieobjecttype": authorization.informatieobjecttype},
-                    then=Value(choice_item.order),
-                )
-            )
-
-        # apply the order annnotation so we can filter later
-        annotations = {"_va_order": order_case}
-        # filtering:
-        # * only allow the white-listed informatieobjecttypen, explicitly
-        # * apply the filtering to limit cases within case-types to the maximal
-        #   confidentiality level
-        filters = {
-            "informatieobjecttype__in": informatieobjecttypen,
-            "_va_order__lte": Case(
-                *vertrouwelijkheidaanduiding_whens, output_field=IntegerField()
-            ),
-        }
-        if self.authorizations_lookup:
-            # If the current queryset is not an InformatieObjectQuerySet, first
-            # retrieve the canonical IDs of EnkelvoudigInformatieObjects
-            # for which the user is authorized and then return the objects
-            # related to those EnkelvoudigInformatieObjectCanonicals
-            model = apps.get_model("datamodel", "EnkelvoudigInformatieObject")
-            filtered = (
-                model.objects.annotate(**annotations)
-                .filter(**filters)
-                .values("canonical")
-            )
-            queryset = self.filter(informatieobject__in=filtered)
-        # bring it all together now to build the resulting queryset
-        else:
-            queryset = self.annotate(**annotations).filter(**filters)
-        return queryset
+        return self.filter(allowed)
 
 
 class InformatieobjectQuerySet(AuthorizationsFilterMixin, models.QuerySet):
-    pass
+    def latest_versions(self) -> models.QuerySet:
+        """
+        Limit the queryset to the latest version of every document.
+
+        Relies on the ``current_version`` pointer of the canonical, which avoids
+        sorting all versions to ``DISTINCT ON`` the canonical.
+        """
+        return self.filter(canonical__current_version=models.F("pk"))
 
 
 class InformatieobjectRelatedQuerySet(AuthorizationsFilterMixin, models.QuerySet):
-    authorizations_lookup = "informatieobject"
+    authorizations_lookup = "informatieobject__current_version"
+
+
+class FinalisatieQuerySet(models.QuerySet):
+    def stale(self) -> models.QuerySet:
+        """
+        Limit the queryset to the jobs that have been in progress for longer
+        than ``UPLOAD_FINALIZATION_TIMEOUT``, of which the worker was stopped.
+        """
+        cutoff = timezone.now() - timedelta(
+            seconds=settings.UPLOAD_FINALIZATION_TIMEOUT
+        )
+        return self.filter(status=FinalisatieStatussen.bezig, gestart__lt=cutoff)
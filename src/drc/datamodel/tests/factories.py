@@ -90,6 +90,7 @@ class BestandsDeelFactory(factory.django.DjangoModelFactory):
     informatieobject = factory.SubFactory(EnkelvoudigInformatieObjectCanonicalFactory)
     inhoud = factory.django.FileField(data=b"some data", filename="file_part.bin")
     omvang = factory.LazyAttribute(lambda o: o.inhoud.size)
+    ontvangen = factory.SelfAttribute("omvang")
     volgnummer = factory.fuzzy.FuzzyInteger(1, 100, 1)
 
     class Meta:
@@ -0,0 +1,156 @@
+from django.db import connection
+from django.db.models import OuterRef, Subquery
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from drc.api.scopes import SCOPE_DOCUMENTEN_ALLES_LEZEN
+
+from ..models import (
+    EnkelvoudigInformatieObject,
+    EnkelvoudigInformatieObjectCanonical,
+    Gebruiksrechten,
+    ObjectInformatieObject,
+)
+from .factories import (
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+    GebruiksrechtenFactory,
+    ObjectInformatieObjectFactory,
+)
+
+IOTYPE = "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1"
+AUTHORIZATIONS = {
+    IOTYPE: VertrouwelijkheidsAanduiding.get_choice(
+        VertrouwelijkheidsAanduiding.intern
+    ).order
+}
+
+
+class RelatedAuthorizationsFilterTests(TestCase):
+    def test_only_current_version_counts(self):
+        allowed, denied = EnkelvoudigInformatieObjectCanonicalFactory.create_batch(
+            2, latest_version=None
+        )
+        # the current version of ``denied`` is too confidential, unlike the
+        # previous version, and vice versa for ``allowed``
+        for canonical, vertrouwelijkheidaanduidingen in [
+            (allowed, ["geheim", "openbaar"]),
+            (denied, ["openbaar", "geheim"]),
+        ]:
+            for versie, vertrouwelijkheidaanduiding in enumerate(
+                vertrouwelijkheidaanduidingen, start=1
+            ):
+                EnkelvoudigInformatieObjectFactory.create(
+                    canonical=canonical,
+                    versie=versie,
+                    vertrouwelijkheidaanduiding=vertrouwelijkheidaanduiding,
+                )
+            ObjectInformatieObjectFactory.create(informatieobject=canonical)
+            GebruiksrechtenFactory.create(informatieobject=canonical)
+
+        for model in [ObjectInformatieObject, Gebruiksrechten]:
+            with self.subTest(model=model):
+                queryset = model.objects.filter_for_authorizations(
+                    SCOPE_DOCUMENTEN_ALLES_LEZEN, AUTHORIZATIONS
+                )
+
+                self.assertEqual(
+                    list(queryset.values_list("informatieobject", flat=True)),
+                    [allowed.pk],
+                )
+
+    def copy_for_documents(self, instance, after: int, **expressions):
+        """
+        Copy ``instance`` for every document created after the one with pk
+        ``after``, with SQL ``expressions`` for some of the columns.
+        """
+        quote = connection.ops.quote_name
+        columns = [
+            field.column
+            for field in instance._meta.concrete_fields
+            if not field.primary_key
+        ]
+        values = [
+            expressions.get(column, f"template.{quote(column)}") for column in columns
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(instance._meta.db_table)} "
+                f"({', '.join(quote(column) for column in columns)}) "
+                f"SELECT {', '.join(values)} "
+                f"FROM {quote(instance._meta.db_table)} template, "
+                f"{quote(EnkelvoudigInformatieObjectCanonical._meta.db_table)} "
+                "canonical WHERE template.id = %s AND canonical.id > %s",
+                [instance.pk, after],
+            )
+
+    def test_filter_uses_authorization_index(self):
+        """
+        Assert that the documents with an authorized ``informatieobjecttype``
+        are looked up in ``eio_authorization_idx``, among many other documents.
+        """
+        canonicals = EnkelvoudigInformatieObjectCanonicalFactory.create_batch(
+            3, latest_version__informatieobjecttype=IOTYPE
+        )
+        for canonical in canonicals:
+            ObjectInformatieObjectFactory.create(informatieobject=canonical)
+            GebruiksrechtenFactory.create(informatieobject=canonical)
+
+        # 20000 documents of 100 other informatieobjecttypen, with relations
+        canonical, after = canonicals[-1], canonicals[-1].pk
+        canonical_table = EnkelvoudigInformatieObjectCanonical._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {canonical_table} (lock) "
+                "SELECT '' FROM generate_series(1, 20000)"
+            )
+        uuid = "md5(canonical.id::text)::uuid"
+        self.copy_for_documents(
+            canonical.latest_version,
+            after,
+            canonical_id="canonical.id",
+            uuid=uuid,
+            informatieobjecttype="'https://example.com/ztc/' || canonical.id %% 100",
+        )
+        EnkelvoudigInformatieObjectCanonical.objects.filter(pk__gt=after).update(
+            current_version=Subquery(
+                EnkelvoudigInformatieObject.objects.filter(
+                    canonical=OuterRef("pk")
+                ).values("pk")
+            )
+        )
+        for model in [ObjectInformatieObject, Gebruiksrechten]:
+            self.copy_for_documents(
+                model.objects.get(informatieobject=canonical),
+                after,
+                informatieobject_id="canonical.id",
+                uuid=uuid,
+            )
+
+        models = [
+            EnkelvoudigInformatieObject,
+            EnkelvoudigInformatieObjectCanonical,
+            ObjectInformatieObject,
+            Gebruiksrechten,
+        ]
+        with connection.cursor() as cursor:
+            for model in models:
+                cursor.execute(f"ANALYZE {model._meta.db_table}")
+
+        querysets = [
+            EnkelvoudigInformatieObject.objects.latest_versions(),
+            ObjectInformatieObject.objects.all(),
+            Gebruiksrechten.objects.all(),
+        ]
+        for queryset in querysets:
+            with self.subTest(model=queryset.model):
+                plan = queryset.filter_for_authorizations(
+                    SCOPE_DOCUMENTEN_ALLES_LEZEN, AUTHORIZATIONS
+                ).explain()
+
+                self.assertRegex(
+                    plan,
+                    r"Index (Only )?Scan (using|on) eio_authorization_idx "
+                    r"[^\n]*\n\s*Index Cond: \(\(?\(?informatieobjecttype\)",
+                )
@@ -0,0 +1,107 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import EnkelvoudigInformatieObject, EnkelvoudigInformatieObjectCanonical
+from .factories import (
+    EnkelvoudigInformatieObjectCanonicalFactory,
+    EnkelvoudigInformatieObjectFactory,
+)
+
+
+class LatestVersionTests(TestCase):
+    def test_pointer_set_on_create(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get()
+
+        self.assertEqual(canonical.current_version, eio)
+
+    def test_pointer_follows_new_version(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2
+        )
+
+        # saving an older version does not move the pointer back
+        eio.titel = "changed"
+        eio.save()
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get()
+        self.assertEqual(canonical.current_version, eio2)
+        self.assertEqual(canonical.latest_version, eio2)
+
+    def test_latest_version_uses_selected_pointer(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.select_related(
+            "current_version"
+        ).get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(canonical.latest_version, eio)
+
+    def test_latest_versions_queryset(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, uuid=eio1.uuid, versie=2
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create()
+
+        latest = EnkelvoudigInformatieObject.objects.latest_versions()
+
+        self.assertEqual(set(latest), {eio2, eio3})
+
+    def test_backfill_command(self):
+        canonical = EnkelvoudigInformatieObjectCanonicalFactory.create()
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=canonical, uuid=canonical.latest_version.uuid, versie=2
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=canonical, uuid=canonical.latest_version.uuid, versie=3
+        )
+        EnkelvoudigInformatieObjectCanonical.objects.update(current_version=None)
+
+        call_command("backfill_latest_versions", batch_size=1, stdout=StringIO())
+
+        canonical.refresh_from_db()
+        self.assertEqual(canonical.current_version, eio3)
+
+    def test_latest_version_without_pointer(self):
+        eio = EnkelvoudigInformatieObjectFactory.create()
+        EnkelvoudigInformatieObjectCanonical.objects.update(current_version=None)
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.select_related(
+            "current_version"
+        ).get()
+
+        self.assertEqual(canonical.latest_version, eio)
+
+    def test_pointer_follows_deleted_version(self):
+        eio1 = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        eio2 = EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio1.canonical, uuid=eio1.uuid, versie=2
+        )
+        eio3 = EnkelvoudigInformatieObjectFactory.create()
+
+        eio2.delete()
+
+        canonical = EnkelvoudigInformatieObjectCanonical.objects.get(
+            pk=eio1.canonical_id
+        )
+        self.assertEqual(canonical.current_version, eio1)
+        self.assertEqual(
+            set(EnkelvoudigInformatieObject.objects.latest_versions()), {eio1, eio3}
+        )
+
+    def test_delete_canonical(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(versie=1)
+        EnkelvoudigInformatieObjectFactory.create(
+            canonical=eio.canonical, uuid=eio.uuid, versie=2
+        )
+
+        eio.canonical.delete()
+
+        self.assertFalse(EnkelvoudigInformatieObjectCanonical.objects.exists())
+        self.assertFalse(EnkelvoudigInformatieObject.objects.exists())
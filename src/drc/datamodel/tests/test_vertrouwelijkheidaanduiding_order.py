@@ -0,0 +1,42 @@
+from django.test import TestCase
+
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+
+from ..models import EnkelvoudigInformatieObject
+from .factories import EnkelvoudigInformatieObjectFactory
+
+
+class VertrouwelijkheidaanduidingOrderTests(TestCase):
+    def test_order_set_on_save(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern
+        )
+
+        eio.refresh_from_db()
+        self.assertEqual(
+            eio.vertrouwelijkheidaanduiding_order,
+            VertrouwelijkheidsAanduiding.get_choice(
+                VertrouwelijkheidsAanduiding.intern
+            ).order,
+        )
+
+    def test_order_follows_update_fields(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.intern
+        )
+
+        eio.vertrouwelijkheidaanduiding = VertrouwelijkheidsAanduiding.geheim
+        eio.save(update_fields=["vertrouwelijkheidaanduiding"])
+
+        self.assertEqual(
+            EnkelvoudigInformatieObject.objects.get().vertrouwelijkheidaanduiding_order,
+            VertrouwelijkheidsAanduiding.get_choice(
+                VertrouwelijkheidsAanduiding.geheim
+            ).order,
+        )
+
+    def test_no_order_without_vertrouwelijkheidaanduiding(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(vertrouwelijkheidaanduiding="")
+
+        eio.refresh_from_db()
+        self.assertIsNone(eio.vertrouwelijkheidaanduiding_order)
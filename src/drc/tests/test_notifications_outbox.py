@@ -0,0 +1,137 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APITestCase
+from vng_api_common.constants import VertrouwelijkheidsAanduiding
+from vng_api_common.tests import JWTAuthMixin, get_operation_url, reverse
+from zds_client import ClientError
+
+from drc.api.notifications import process_notificaties
+from drc.datamodel.constants import NotificatieStatussen
+from drc.datamodel.models import Notificatie
+from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
+
+INFORMATIEOBJECTTYPE = (
+    "https://example.com/ztc/api/v1/catalogus/1/informatieobjecttype/1"
+)
+
+
+@freeze_time("2012-01-14")
+@override_settings(NOTIFICATIONS_DISABLED=False, ASYNC_NOTIFICATIONS=True)
+@patch("notifications_api_common.models.NotificationsConfig.get_client")
+class NotificatieOutboxTests(JWTAuthMixin, APITestCase):
+    heeft_alle_autorisaties = True
+
+    def test_notification_written_to_outbox(self, mock_client):
+        client = mock_client.return_value
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            bronorganisatie="159351741",
+            informatieobjecttype=INFORMATIEOBJECTTYPE,
+            vertrouwelijkheidaanduiding=VertrouwelijkheidsAanduiding.openbaar,
+        )
+        eio_url = f"http://testserver{reverse(eio)}"
+
+        with capture_on_commit_callbacks(execute=True):
+            response = self.client.post(
+                get_operation_url("gebruiksrechten_create"),
+                {
+                    "informatieobject": eio_url,
+                    "startdatum": "2019-10-22T00:00:00Z",
+                    "omschrijvingVoorwaarden": "mlem",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        client.create.assert_not_called()
+        message = {
+            "kanaal": "documenten",
+            "hoofdObject": eio_url,
+            "resource": "gebruiksrechten",
+            "resourceUrl": response.json()["url"],
+            "actie": "create",
+            "aanmaakdatum": "2012-01-14T00:00:00Z",
+            "kenmerken": {
+                "bronorganisatie": "159351741",
+                "informatieobjecttype": INFORMATIEOBJECTTYPE,
+                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.openbaar,
+            },
+        }
+        self.assertEqual(Notificatie.objects.get().bericht, message)
+
+        call_command("send_notifications", once=True, stdout=StringIO())
+
+        client.create.assert_called_once_with("notificaties", message)
+        self.assertFalse(Notificatie.objects.exists())
+
+    def test_kenmerken_of_deleted_document(self, mock_client):
+        client = mock_client.return_value
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+
+        with capture_on_commit_callbacks(execute=True):
+            response = self.client.delete(reverse(eio))
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        call_command("send_notifications", once=True, stdout=StringIO())
+
+        message = client.create.call_args.args[1]
+        self.assertEqual(message["actie"], "destroy")
+        self.assertEqual(
+            message["kenmerken"]["informatieobjecttype"], INFORMATIEOBJECTTYPE
+        )
+
+
+@freeze_time("2012-01-14")
+@override_settings(NOTIFICATIONS_MAX_ATTEMPTS=2, NOTIFICATIONS_RETRY_BACKOFF=10)
+@patch("notifications_api_common.models.NotificationsConfig.get_client")
+class SendNotificatiesTests(TestCase):
+    def test_batches(self, mock_client):
+        client = mock_client.return_value
+        Notificatie.objects.bulk_create(
+            [Notificatie(bericht={"actie": str(i)}) for i in range(5)]
+        )
+
+        processed = process_notificaties(batch_size=2)
+
+        self.assertEqual(processed, 5)
+        self.assertEqual(
+            [call.args[1]["actie"] for call in client.create.call_args_list],
+            ["0", "1", "2", "3", "4"],
+        )
+        self.assertFalse(Notificatie.objects.exists())
+
+    def test_retry_with_backoff(self, mock_client):
+        client = mock_client.return_value
+        client.create.side_effect = ClientError({"detail": "down"})
+        notificatie = Notificatie.objects.create(bericht={"actie": "create"})
+
+        process_notificaties()
+
+        notificatie.refresh_from_db()
+        self.assertEqual(notificatie.status, NotificatieStatussen.in_wachtrij)
+        self.assertEqual(notificatie.pogingen, 1)
+        self.assertEqual(
+            notificatie.volgende_poging, timezone.now() + timedelta(seconds=10)
+        )
+        self.assertIn("down", notificatie.foutmelding)
+
+        # not retried before the backoff has passed
+        process_notificaties()
+        self.assertEqual(client.create.call_count, 1)
+
+        with freeze_time(notificatie.volgende_poging):
+            process_notificaties()
+
+        notificatie.refresh_from_db()
+        self.assertEqual(notificatie.status, NotificatieStatussen.mislukt)
+        self.assertEqual(notificatie.pogingen, 2)
@@ -1,9 +1,14 @@
 import uuid
 from base64 import b64encode
+from datetime import timedelta
+from hashlib import md5, sha256
+from io import StringIO
 
 from django.conf import settings
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.test import override_settings
+from django.utils import timezone
 
 from privates.test import temp_private_root
 from rest_framework import status
@@ -25,7 +30,8 @@ from drc.api.scopes import (
     SCOPE_DOCUMENTEN_LOCK,
 )
 from drc.api.tests.utils import split_file
-from drc.datamodel.models import EnkelvoudigInformatieObject
+from drc.datamodel.constants import ChecksumAlgoritmes, FinalisatieStatussen
+from drc.datamodel.models import EnkelvoudigInformatieObject, Finalisatie
 from drc.datamodel.tests.factories import EnkelvoudigInformatieObjectFactory
 
 from .mixins import MockValidationsMixin
@@ -301,6 +307,70 @@ class SmallFileUpload(MockValidationsMixin, JWTAuthMixin, APITestCase):
         self.assertEqual(data["inhoud"], f"http://testserver{file_url}?versie=2")
         self.assertEqual(eio_new.inhoud.file.read(), b"some other file content")
 
+    def test_update_eio_file_raw(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+        detail_url = reverse(eio)
+        lock_url = get_operation_url("enkelvoudiginformatieobject_lock", uuid=eio.uuid)
+        lock = self.client.post(lock_url).json()["lock"]
+        content = b"some other file content"
+
+        response = self.client.patch(
+            detail_url,
+            content,
+            content_type="application/octet-stream",
+            HTTP_LOCK=lock,
+            HTTP_DIGEST=f"sha-256={b64encode(sha256(content).digest()).decode()}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["bestandsomvang"], 23)
+        eio_new = eio.canonical.latest_version
+        self.assertEqual(eio_new.inhoud.file.read(), content)
+
+    def test_update_eio_file_raw_invalid_digest(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+        lock_url = get_operation_url("enkelvoudiginformatieobject_lock", uuid=eio.uuid)
+        lock = self.client.post(lock_url).json()["lock"]
+
+        response = self.client.patch(
+            reverse(eio),
+            b"some other file content",
+            content_type="application/octet-stream",
+            HTTP_LOCK=lock,
+            HTTP_DIGEST=f"sha-256={b64encode(sha256(b'other').digest()).decode()}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-digest")
+        eio_new = eio.canonical.latest_version
+        self.assertEqual(eio_new.inhoud.file.read(), b"some data")
+
+    def test_update_eio_file_raw_without_content_length(self):
+        eio = EnkelvoudigInformatieObjectFactory.create(
+            informatieobjecttype=INFORMATIEOBJECTTYPE
+        )
+        lock_url = get_operation_url("enkelvoudiginformatieobject_lock", uuid=eio.uuid)
+        lock = self.client.post(lock_url).json()["lock"]
+
+        # a chunked request body has no size
+        response = self.client.patch(
+            reverse(eio),
+            b"some other file content",
+            content_type="application/octet-stream",
+            HTTP_LOCK=lock,
+            CONTENT_LENGTH="",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["code"], "file-size")
+        eio_new = eio.canonical.latest_version
+        self.assertEqual(eio_new.inhoud.file.read(), b"some data")
+
     def test_update_eio_file_set_empty(self):
         """
         Test the delete the file from the document
@@ -603,6 +673,299 @@ class LargeFileAPITests(MockValidationsMixin, JWTAuthMixin, APITestCase):
         self._unlock()
         self._download_file()
 
+    def test_unlock_computes_checksum(self):
+        self._create_metadata()
+        self.eio.integriteit_algoritme = ChecksumAlgoritmes.sha_256
+        self.eio.save()
+        self._upload_part_files()
+
+        self._unlock()
+
+        self.assertEqual(self.eio.bestandsomvang, self.file_content.size)
+        self.assertEqual(
+            self.eio.integriteit_waarde, sha256(b"filecontentstring").hexdigest()
+        )
+        self.assertIsNotNone(self.eio.integriteit_datum)
+        self._download_file()
+
+    @override_settings(ASYNC_UPLOAD_FINALIZATION=True)
+    def test_unlock_async_finalization(self):
+        self._create_metadata()
+        self._upload_part_files()
+        detail_url = reverse(self.eio)
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        lock_url = get_operation_url(
+            "enkelvoudiginformatieobject_lock", uuid=self.eio.uuid
+        )
+
+        response = self.client.post(unlock_url, {"lock": self.canonical.lock})
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+        self.assertEqual(self.canonical.bestandsdelen.count(), 2)
+        self.assertEqual(
+            self.client.get(detail_url).json()["finalisatie"],
+            {
+                "status": FinalisatieStatussen.in_wachtrij,
+                "omvang": self.file_content.size,
+                "verwerkt": 0,
+            },
+        )
+
+        # the document can't be locked again until the upload is finalized
+        response = self.client.post(lock_url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "finalisatie-bezig")
+
+        call_command("finalize_uploads", once=True, stdout=StringIO())
+
+        self.eio.refresh_from_db()
+        self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+        self.assertEqual(self.eio.bestandsomvang, self.file_content.size)
+        self.assertEqual(
+            self.client.get(detail_url).json()["finalisatie"],
+            {
+                "status": FinalisatieStatussen.voltooid,
+                "omvang": self.file_content.size,
+                "verwerkt": self.file_content.size,
+            },
+        )
+        self._download_file()
+
+        response = self.client.post(lock_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(ASYNC_UPLOAD_FINALIZATION=True, UPLOAD_FINALIZATION_TIMEOUT=60)
+    def test_stale_finalization_is_taken_again(self):
+        self._create_metadata()
+        self._upload_part_files()
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        self.client.post(unlock_url, {"lock": self.canonical.lock})
+        # the worker was killed while merging
+        Finalisatie.objects.update(
+            status=FinalisatieStatussen.bezig,
+            verwerkt=4,
+            gestart=timezone.now() - timedelta(seconds=30),
+        )
+
+        call_command("finalize_uploads", once=True, stdout=StringIO())
+
+        finalisatie = Finalisatie.objects.get()
+        self.assertEqual(finalisatie.status, FinalisatieStatussen.bezig)
+
+        Finalisatie.objects.update(gestart=timezone.now() - timedelta(seconds=61))
+
+        call_command("finalize_uploads", once=True, stdout=StringIO())
+
+        finalisatie.refresh_from_db()
+        self.assertEqual(finalisatie.status, FinalisatieStatussen.voltooid)
+        self.assertEqual(self.canonical.bestandsdelen.count(), 0)
+        self._download_file()
+
+    @override_settings(ASYNC_UPLOAD_FINALIZATION=True)
+    def test_force_unlock_after_failed_finalization(self):
+        self.autorisatie.scopes = self.autorisatie.scopes + [
+            SCOPE_DOCUMENTEN_GEFORCEERD_UNLOCK
+        ]
+        self.autorisatie.save()
+        self._create_metadata()
+        self._upload_part_files()
+        unlock_url = get_operation_url(
+            "enkelvoudiginformatieobject_unlock", uuid=self.eio.uuid
+        )
+        self.client.post(unlock_url, {"lock": self.canonical.lock})
+        Finalisatie.objects.update(
+            status=FinalisatieStatussen.mislukt, foutmelding="disk full"
+        )
+
+        response = self.client.post(unlock_url)
+
+        self.assertEqual(
+            response.status_code, status.HTTP_204_NO_CONTENT, response.data
+        )
+        finalisatie = Finalisatie.objects.get()
+        self.assertEqual(finalisatie.status, FinalisatieStatussen.in_wachtrij)
+        self.assertEqual(finalisatie.foutmelding, "")
+
+    def test_upload_part_in_ranges(self):
+        self._create_metadata()
+        part, last_part = self.bestandsdelen
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+
+        def upload_range(content: bytes, content_range: str):
+            return self.client.put(
+                part_url,
+                {
+                    "inhoud": SimpleUploadedFile("part.bin", content),
+                    "lock": self.canonical.lock,
+                },
+                format="multipart",
+                HTTP_CONTENT_RANGE=content_range,
+            )
+
+        response = upload_range(b"file", "bytes 0-3/10")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["ontvangen"], 4)
+        self.assertFalse(response.json()["voltooid"])
+
+        # a gap between the received bytes and the range is not allowed
+        response = upload_range(b"nten", "bytes 6-9/10")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-offset")
+
+        # resending a range which was (partly) received already is allowed
+        response = upload_range(b"eco", "bytes 3-5/10")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["ontvangen"], 6)
+
+        response = upload_range(b"nten", "bytes 6-9/10")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["ontvangen"], 10)
+        self.assertTrue(response.json()["voltooid"])
+
+        response = self.client.put(
+            get_operation_url("bestandsdeel_update", uuid=last_part.uuid),
+            {
+                "inhoud": SimpleUploadedFile("part.bin", b"tstring"),
+                "lock": self.canonical.lock,
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.json()["ontvangen"], 7)
+
+        self._unlock()
+        self._download_file()
+
+    def test_upload_part_invalid_range(self):
+        self._create_metadata()
+        part_url = get_operation_url(
+            "bestandsdeel_update", uuid=self.bestandsdelen[0].uuid
+        )
+
+        for content_range in ["bytes 0-3/11", "bytes 0-4/10", "bytes 4-3/10", "0-3"]:
+            with self.subTest(content_range=content_range):
+                response = self.client.put(
+                    part_url,
+                    {
+                        "inhoud": SimpleUploadedFile("part.bin", b"file"),
+                        "lock": self.canonical.lock,
+                    },
+                    format="multipart",
+                    HTTP_CONTENT_RANGE=content_range,
+                )
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                error = get_validation_errors(response, "nonFieldErrors")
+                self.assertEqual(error["code"], "invalid-content-range")
+
+    def test_upload_part_raw(self):
+        self._create_metadata()
+        content = [b"fileconten", b"tstring"]
+
+        for part, data in zip(self.bestandsdelen, content):
+            response = self.client.put(
+                get_operation_url("bestandsdeel_update", uuid=part.uuid),
+                data,
+                content_type="application/octet-stream",
+                HTTP_LOCK=self.canonical.lock,
+                HTTP_DIGEST=f"md5={b64encode(md5(data).digest()).decode()}",
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+            self.assertTrue(response.json()["voltooid"])
+
+        self._unlock()
+        self._download_file()
+
+    def test_upload_part_raw_in_ranges(self):
+        self._create_metadata()
+        part_url = get_operation_url(
+            "bestandsdeel_update", uuid=self.bestandsdelen[0].uuid
+        )
+
+        for data, content_range in [
+            (b"filec", "bytes 0-4/10"),
+            (b"econteX", "bytes 3-9/10"),
+        ]:
+            response = self.client.put(
+                part_url,
+                data,
+                content_type="application/octet-stream",
+                HTTP_LOCK=self.canonical.lock,
+                HTTP_CONTENT_RANGE=content_range,
+            )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        self.assertEqual(response.json()["ontvangen"], 10)
+        part = self.bestandsdelen[0]
+        part.refresh_from_db()
+        # the bytes which were received already are kept
+        self.assertEqual(part.inhoud.file.read(), b"fileconteX")
+
+    def test_upload_part_raw_invalid_content_length(self):
+        self._create_metadata()
+        part = self.bestandsdelen[0]
+
+        response = self.client.put(
+            get_operation_url("bestandsdeel_update", uuid=part.uuid),
+            b"fileconten",
+            content_type="application/octet-stream",
+            HTTP_LOCK=self.canonical.lock,
+            CONTENT_LENGTH="ten",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()["code"], "parse_error")
+        part.refresh_from_db()
+        self.assertEqual(part.ontvangen, 0)
+
+    def test_upload_part_raw_invalid_digest(self):
+        self._create_metadata()
+        part = self.bestandsdelen[0]
+        part_url = get_operation_url("bestandsdeel_update", uuid=part.uuid)
+
+        response = self.client.put(
+            part_url,
+            b"filec",
+            content_type="application/octet-stream",
+            HTTP_LOCK=self.canonical.lock,
+            HTTP_CONTENT_RANGE="bytes 0-4/10",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+
+        response = self.client.put(
+            part_url,
+            b"onten",
+            content_type="application/octet-stream",
+            HTTP_LOCK=self.canonical.lock,
+            HTTP_CONTENT_RANGE="bytes 5-9/10",
+            HTTP_DIGEST=f"md5={b64encode(md5(b'other').digest()).decode()}",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = get_validation_errors(response, "nonFieldErrors")
+        self.assertEqual(error["code"], "invalid-digest")
+        part.refresh_from_db()
+        self.assertEqual(part.ontvangen, 5)
+        self.assertEqual(part.inhoud.file.read(), b"filec")
+
     def test_upload_part_wrong_size(self):
         """
         Test the upload of the incorrect part file
@@ -8,8 +8,10 @@ https://github.com/VNG-Realisatie/gemma-zaken/issues/609
 from base64 import b64encode
 from unittest.mock import patch
 
-from django.test import override_settings, tag
+from django.core.cache import caches
+from django.test import override_settings
 
+import requests_mock
 from rest_framework import status
 from rest_framework.test import APITestCase
 from vng_api_common.constants import VertrouwelijkheidsAanduiding
@@ -32,7 +34,11 @@ class US609TestCase(TypeCheckMixin, JWTAuthMixin, APITestCase):
     scopes = [SCOPE_DOCUMENTEN_AANMAKEN]
     informatieobjecttype = INFORMATIEOBJECTTYPE
 
-    @tag("mock_client")
+    def setUp(self):
+        super().setUp()
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
     @patch("vng_api_common.validators.fetcher")
     @patch("vng_api_common.validators.obj_has_shape", return_value=True)
     def test_vertrouwelijkheidaanduiding_derived(self, *mocks):
@@ -41,14 +47,15 @@ class US609TestCase(TypeCheckMixin, JWTAuthMixin, APITestCase):
         from informatieobjecttype
         """
         url = reverse("enkelvoudiginformatieobject-list")
-        responses = {
-            INFORMATIEOBJECTTYPE: {
-                "url": INFORMATIEOBJECTTYPE,
-                "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
-            }
-        }
 
-        with mock_client(responses):
+        with requests_mock.Mocker() as m:
+            m.get(
+                INFORMATIEOBJECTTYPE,
+                json={
+                    "url": INFORMATIEOBJECTTYPE,
+                    "vertrouwelijkheidaanduiding": VertrouwelijkheidsAanduiding.zaakvertrouwelijk,
+                },
+            )
             response = self.client.post(
                 url,
                 {